@@ -0,0 +1,225 @@
+#! /usr/bin/python36
+#[][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][]
+#[]  Script: blindindex.py                                                     []
+#[]  Script Language: Python 3.6(.4)                                           []
+#[]  Description: This class maps keyed blind index digests produced by the    []
+#[]               Encrypter class to record ids, either in memory or in a      []
+#[]               SQLite database, for equality lookups on encrypted values.   []
+#[]  Author: Paul J. Laue                                                      []
+#[]  Created: October 19, 2026 01:00:00 PM                                     []
+#[] ========================================================================== []
+#[]  CHANGE LOG                                                                []
+#[]  ----------                                                                []
+#[]                                                                            []
+#[] ========================================================================== []
+#[][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][]
+from encrypter import Encrypter
+import sqlite3
+
+class BlindIndex:
+    """
+    This class keeps an index of blind index digests to record ids so that records holding an
+    encrypted value can be found by equality without decrypting every row.  The index is kept
+    in memory unless a SQLite database file is given.
+    """
+    def __init__(self, keyFile=None, databaseFile=None):
+        """
+        Creates a new empty BlindIndex object.
+        
+        @param keyFile (optional): location of the secure key used to key the digests
+        @type keyFile: String
+        
+        @param databaseFile (optional): SQLite database file to persist the index in (':memory:' is allowed)
+        @type databaseFile: String
+        
+        @raise OSError when key file does not exist or is invalid.
+        """
+        self._errMsg = ''
+        self._outMsg = ''
+        self._encrypter = Encrypter(keyFile)
+        self._index = {}
+        self._db = None
+        
+        if databaseFile is not None:
+            self.open(databaseFile)
+    
+    def getErrorMsg(self):
+        """
+        Returns any error messages on the stack.
+        
+        @return String
+        """
+        return self._errMsg
+    
+    def getOutputMsg(self):
+        """
+        Returns any output messages on the stack.
+        
+        @return String
+        """
+        return self._outMsg
+    
+    def getEncrypter(self):
+        """
+        Returns the Encrypter used to compute the digests.
+        
+        @return Encrypter
+        """
+        return self._encrypter
+    
+    def open(self, databaseFile):
+        """
+        Attempts to open (and create if needed) a SQLite database to hold the index.
+        
+        @param databaseFile: SQLite database file
+        @type databaseFile: String
+        
+        @return Boolean
+        """
+        try:
+            self._db = sqlite3.connect(databaseFile)
+            self._db.execute("CREATE TABLE IF NOT EXISTS blind_index (field TEXT NOT NULL, digest TEXT NOT NULL, record_id TEXT NOT NULL, PRIMARY KEY (field, digest, record_id)) WITHOUT ROWID")
+            self._db.commit()
+            self._outMsg = "Blind index database '{0}' opened.".format(databaseFile)
+        except sqlite3.Error as serr:
+            self._errMsg = "There was a critical error attempting to open database '{0}'.  Error={1}".format(databaseFile, str(serr))
+            self._db = None
+            return False
+        
+        return True
+    
+    def close(self):
+        """
+        Closes the SQLite database if it is open.
+        """
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+    
+    def add(self, field, value, recordId):
+        """
+        Indexes a plain text value of a field for a record.
+        
+        @param field: name of the field the value belongs to
+        @type field: String
+        
+        @param value: the plain text value
+        @type value: String
+        
+        @param recordId: id of the record holding the value
+        @type recordId: String
+        """
+        self.addDigests(field, [(self._encrypter.getBlindIndex(value, field), recordId)])
+    
+    def addMany(self, field, valuesAndIds):
+        """
+        Indexes many (value, recordId) pairs of a field.
+        
+        @param field: name of the field the values belong to
+        @type field: String
+        
+        @param valuesAndIds: an iterable of (value, recordId) pairs
+        @type valuesAndIds: List/Sequence
+        """
+        self.addDigests(field, ((self._encrypter.getBlindIndex(value, field), recordId) for value, recordId in valuesAndIds))
+    
+    def addDigests(self, field, digestsAndIds):
+        """
+        Indexes already computed (digest, recordId) pairs of a field, e.g. the digests returned
+        by 'Encrypter.encryptWithBlindIndex'.  The digests must have been computed with the field
+        name as context, or 'lookup' will never find them.
+        
+        @param field: name of the field the digests belong to
+        @type field: String
+        
+        @param digestsAndIds: an iterable of (digest, recordId) pairs
+        @type digestsAndIds: List/Sequence
+        """
+        if self._db is not None:
+            self._db.executemany("INSERT OR IGNORE INTO blind_index (field, digest, record_id) VALUES (?, ?, ?)", ((field, digest, str(recordId)) for digest, recordId in digestsAndIds if digest is not None))
+            self._db.commit()
+        else:
+            for digest, recordId in digestsAndIds:
+                if digest is not None:
+                    self._index.setdefault((field, digest), set()).add(str(recordId))
+    
+    def remove(self, field, value, recordId=None):
+        """
+        Removes a value of a field from the index, for one record or for all records.
+        
+        @param field: name of the field the value belongs to
+        @type field: String
+        
+        @param value: the plain text value
+        @type value: String
+        
+        @param recordId (optional): id of the record to remove, all records when omitted
+        @type recordId: String
+        """
+        digest = self._encrypter.getBlindIndex(value, field)
+        if self._db is not None:
+            if recordId is None:
+                self._db.execute("DELETE FROM blind_index WHERE field = ? AND digest = ?", (field, digest))
+            else:
+                self._db.execute("DELETE FROM blind_index WHERE field = ? AND digest = ? AND record_id = ?", (field, digest, str(recordId)))
+            self._db.commit()
+        else:
+            if recordId is None:
+                self._index.pop((field, digest), None)
+            else:
+                self._index.get((field, digest), set()).discard(str(recordId))
+    
+    def lookup(self, field, value):
+        """
+        Returns the ids of the records whose field holds the given plain text value.
+        
+        @param field: name of the field to search
+        @type field: String
+        
+        @param value: the plain text value to find
+        @type value: String
+        
+        @return List
+        """
+        return self.lookupDigest(field, self._encrypter.getBlindIndex(value, field))
+    
+    def lookupDigest(self, field, digest):
+        """
+        Returns the ids of the records whose field has the given blind index digest.
+        
+        @param field: name of the field to search
+        @type field: String
+        
+        @param digest: the blind index digest to find
+        @type digest: String
+        
+        @return List
+        """
+        if digest is None:
+            return []
+        
+        if self._db is not None:
+            return [row[0] for row in self._db.execute("SELECT record_id FROM blind_index WHERE field = ? AND digest = ?", (field, digest))]
+        else:
+            return sorted(self._index.get((field, digest), ()))
+    
+    def getIndexCount(self):
+        """
+        Returns the number of (field, digest, record) entries in the index.
+        
+        @return Integer
+        """
+        if self._db is not None:
+            return self._db.execute("SELECT COUNT(*) FROM blind_index").fetchone()[0]
+        else:
+            return sum(len(ids) for ids in self._index.values())
+    
+    def clear(self):
+        """
+        Clears out the index.
+        """
+        if self._db is not None:
+            self._db.execute("DELETE FROM blind_index")
+            self._db.commit()
+        else:
+            self._index.clear()
@@ -0,0 +1,319 @@
+#! /usr/bin/python36
+#[][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][]
+#[]  Script: cryptbench.py                                                     []
+#[]  Script Language: Python 3.6(.4)                                           []
+#[]  Description: This class can be used to measure the throughput of the      []
+#[]               operations offered by the Encrypter class on this host and   []
+#[]               to record the fastest Blake2 digest size ("auto" mode).      []
+#[]  Author: Paul J. Laue                                                      []
+#[]  Created: October 19, 2026 10:00:00 AM                                     []
+#[] ========================================================================== []
+#[]  CHANGE LOG                                                                []
+#[]  ----------                                                                []
+#[]                                                                            []
+#[] ========================================================================== []
+#[][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][]
+import os.path
+import tempfile
+import time
+import json
+from datetime import datetime
+from encrypter import Encrypter, RSAKeySize, DigestSize, PublicKeyFormatType
+from plat4rm import Platform
+
+DIGEST_ALGORITHMS = ('md5', 'sha256', 'sha512', 'blake2b', 'blake2s')
+
+class EncrypterBenchmark:
+    """
+    This class runs timed benchmarks of the Encrypter class and keeps the results
+    so they can be compared between hosts.
+    """
+    def __init__(self):
+        """
+        Creates a new empty EncrypterBenchmark object.
+        """
+        self._errMsg = ''
+        self._outMsg = ''
+        self._results = {}
+        
+    def getErrorMsg(self):
+        """
+        Returns any error messages on the stack.
+        
+        @return String
+        """
+        return self._errMsg
+    
+    def getOutputMsg(self):
+        """
+        Returns any output messages on the stack.
+        
+        @return String
+        """
+        return self._outMsg
+    
+    def getResults(self):
+        """
+        Returns all benchmark results gathered so far.
+        
+        @return Dictionary
+        """
+        return self._results
+    
+    def benchmarkDigests(self, payloadSizes=(64, 4096, 1048576), minTime=0.2):
+        """
+        Measures the throughput of every supported digest across payload sizes.
+        
+        @param payloadSizes (optional): payload sizes in bytes
+        @type payloadSizes: List/Sequence
+        
+        @param minTime (optional): minimum number of seconds to run each measurement
+        @type minTime: Float
+        
+        @return Dictionary of algorithm to {payload size: megabytes per second}
+        """
+        enc = Encrypter()
+        operations = {
+            'md5': enc.getMD5HashedString,
+            'sha256': enc.getSHA256HashedString,
+            'sha512': enc.getSHA512HashedString,
+            'blake2b': lambda text: enc.getBlake2HashedString(text, DigestSize.sz64),
+            'blake2s': lambda text: enc.getBlake2HashedString(text, DigestSize.sz32)
+        }
+        
+        results = {}
+        for algorithm in DIGEST_ALGORITHMS:
+            results[algorithm] = {}
+            for size in payloadSizes:
+                payload = 'x' * size
+                opsPerSec = self._timeOperation(lambda: operations[algorithm](payload), minTime)
+                results[algorithm][size] = opsPerSec * size / 1048576
+                
+        self._results['digests'] = results
+        return results
+    
+    def benchmarkFernet(self, payloadSizes=(64, 4096, 1048576), minTime=0.2):
+        """
+        Measures Fernet encryption and decryption throughput across payload sizes.
+        
+        @param payloadSizes (optional): payload sizes in bytes
+        @type payloadSizes: List/Sequence
+        
+        @param minTime (optional): minimum number of seconds to run each measurement
+        @type minTime: Float
+        
+        @return Dictionary of payload size to (encrypt megabytes per second, decrypt megabytes per second)
+        """
+        results = {}
+        with tempfile.TemporaryDirectory() as tmpdir:
+            keyfile = os.path.join(tmpdir, "bench.key")
+            with open(keyfile, 'wb') as kf:
+                kf.write(Encrypter().generateKey())
+            enc = Encrypter(keyfile)
+            
+            for size in payloadSizes:
+                payload = 'x' * size
+                token = enc.encrypt(payload)
+                encrate = self._timeOperation(lambda: enc.encrypt(payload), minTime)
+                decrate = self._timeOperation(lambda: enc.decrypt(token), minTime)
+                results[size] = (encrate * size / 1048576, decrate * size / 1048576)
+                
+        self._results['fernet'] = results
+        return results
+    
+    def benchmarkRSA(self, keySizes=(RSAKeySize.sz1024, RSAKeySize.sz2048, RSAKeySize.sz4096), minTime=0.2):
+        """
+        Measures RSA key generation, encryption and decryption operations per second for each key size.
+        
+        @param keySizes (optional): the key sizes to measure
+        @type keySizes: List/Sequence of RSAKeySize
+        
+        @param minTime (optional): minimum number of seconds to run each measurement
+        @type minTime: Float
+        
+        @return Dictionary of key size to (key pairs per second, encryptions per second, decryptions per second)
+        """
+        payload = b'x' * 32
+        results = {}
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for keySize in keySizes:
+                enc = Encrypter()
+                bits = enc.getRSAKeySize(keySize)
+                pubfile = os.path.join(tmpdir, "bench_{0}.pub".format(bits))
+                pemfile = os.path.join(tmpdir, "bench_{0}.pem".format(bits))
+                
+                start = time.perf_counter()
+                pubkey, pem = enc.generateRSAKeyPair(keySize)
+                genrate = 1 / (time.perf_counter() - start)
+                with open(pubfile, 'wb') as pf:
+                    pf.write(pubkey)
+                with open(pemfile, 'wb') as pf:
+                    pf.write(pem)
+                    
+                enc.setSecureKey(pubfile)
+                ciphertext = enc.encryptRSA(payload, PublicKeyFormatType.PEM)
+                encrate = self._timeOperation(lambda: enc.encryptRSA(payload, PublicKeyFormatType.PEM), minTime)
+                
+                dec = Encrypter(pemfile)
+                decrate = self._timeOperation(lambda: dec.decryptRSA(ciphertext), minTime)
+                
+                results[bits] = (genrate, encrate, decrate)
+                
+        self._results['rsa'] = results
+        return results
+    
+    def benchmarkSigning(self, keySizes=(RSAKeySize.sz1024, RSAKeySize.sz2048, RSAKeySize.sz4096), messageCount=500, processes=1):
+        """
+        Measures RSA signatures and verifications per second for each key size.
+        
+        @param keySizes (optional): the key sizes to measure
+        @type keySizes: List/Sequence of RSAKeySize
+        
+        @param messageCount (optional): number of messages to sign per key size
+        @type messageCount: Integer
+        
+        @param processes (optional): number of worker processes passed to signMany/verifyMany
+        @type processes: Integer
+        
+        @return Dictionary of key size to (signatures per second, verifications per second)
+        """
+        messages = ["benchmark message {0}".format(i) for i in range(messageCount)]
+        results = {}
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for keySize in keySizes:
+                enc = Encrypter()
+                bits = enc.getRSAKeySize(keySize)
+                pubfile = os.path.join(tmpdir, "bench_{0}.pub".format(bits))
+                pemfile = os.path.join(tmpdir, "bench_{0}.pem".format(bits))
+                pubkey, pem = enc.generateRSAKeyPair(keySize)
+                with open(pubfile, 'wb') as pf:
+                    pf.write(pubkey)
+                with open(pemfile, 'wb') as pf:
+                    pf.write(pem)
+                
+                enc.setSecureKey(pemfile)
+                start = time.perf_counter()
+                signatures = enc.signMany(messages, processes=processes)
+                signrate = messageCount / (time.perf_counter() - start)
+                if signatures is None:
+                    self._errMsg = enc.getErrorMsg()
+                    return None
+                
+                enc.setSecureKey(pubfile)
+                start = time.perf_counter()
+                verified = enc.verifyMany(messages, signatures, processes=processes)
+                verifyrate = messageCount / (time.perf_counter() - start)
+                if verified is False:
+                    self._errMsg = enc.getErrorMsg()
+                    return None
+                
+                results[bits] = (signrate, verifyrate)
+                
+        self._results['signing'] = results
+        self._outMsg = "Signing benchmark completed for {0} key sizes.".format(len(results))
+        
+        return results
+    
+    def benchmarkAll(self, payloadSizes=(64, 4096, 1048576), keySizes=(RSAKeySize.sz1024, RSAKeySize.sz2048, RSAKeySize.sz4096), minTime=0.2):
+        """
+        Runs every benchmark.
+        
+        @return Dictionary
+        """
+        self.benchmarkDigests(payloadSizes, minTime)
+        self.benchmarkFernet(payloadSizes, minTime)
+        self.benchmarkRSA(keySizes, minTime)
+        self.benchmarkSigning(keySizes)
+        
+        return self._results
+    
+    def selectFastest(self, choiceFile=None, payloadSize=4096, minTime=0.2):
+        """
+        Measures which Blake2 digest size is fastest on this host and records the choice
+        (optionally to a JSON file).  The choice is not applied here: 'DigestSize.auto' only uses a
+        size pinned with 'loadChoice', so every host sharing stored digests loads the same file.
+        
+        @param choiceFile (optional): full path to a JSON file to record the choice in
+        @type choiceFile: String
+        
+        @param payloadSize (optional): payload size in bytes the choice is optimized for
+        @type payloadSize: Integer
+        
+        @param minTime (optional): minimum number of seconds to run each measurement
+        @type minTime: Float
+        
+        @return Dictionary
+        """
+        digests = self.benchmarkDigests((payloadSize,), minTime)
+        blake2 = DigestSize.sz64 if digests['blake2b'][payloadSize] >= digests['blake2s'][payloadSize] else DigestSize.sz32
+        
+        p = Platform()
+        choice = {
+            'host': p.getHostName(),
+            'machine': p.getMachineType(),
+            'is64bit': p.isPlatform64Bits(),
+            'measured': datetime.now().isoformat(),
+            'payloadSize': payloadSize,
+            'blake2DigestSize': blake2.name
+        }
+        self._results['auto'] = choice
+        
+        if choiceFile is not None:
+            try:
+                with open(choiceFile, 'w') as cf:
+                    json.dump(choice, cf, indent=2)
+            except OSError as oerr:
+                self._errMsg = "There was a critical error attempting to write file '{0}'.  OSError={1}".format(choiceFile, str(oerr))
+                
+        self._outMsg = "Selected Blake2 digest size {0}.".format(blake2.name)
+        return choice
+    
+    def loadChoice(self, choiceFile):
+        """
+        Pins the Blake2 digest size used by 'DigestSize.auto' to a choice recorded by 'selectFastest'.
+        
+        @param choiceFile: full path to the JSON file the choice was recorded in
+        @type choiceFile: String
+        
+        @return Boolean
+        """
+        try:
+            with open(choiceFile, 'r') as cf:
+                choice = json.load(cf)
+            Encrypter().setAutoDigestSize(DigestSize[choice['blake2DigestSize']])
+        except (OSError, ValueError, KeyError) as err:
+            self._errMsg = "The choice file '{0}' could not be loaded.  Error={1}".format(choiceFile, str(err))
+            return False
+        
+        self._results['auto'] = choice
+        return True
+    
+    def _timeOperation(self, operation, minTime):
+        """
+        Runs an operation repeatedly for at least minTime seconds.
+        
+        @return Float operations per second
+        """
+        count = 0
+        start = time.perf_counter()
+        elapsed = 0
+        while elapsed < minTime or count == 0:
+            operation()
+            count += 1
+            elapsed = time.perf_counter() - start
+            
+        return count / elapsed
+    
+if __name__ == "__main__":
+    b = EncrypterBenchmark()
+    b.benchmarkAll()
+    for algorithm, rates in b.getResults()['digests'].items():
+        print("{0}: {1}".format(algorithm, ", ".join("{0}B {1:,.1f} MB/s".format(size, rate) for size, rate in sorted(rates.items()))))
+    for size, (encrate, decrate) in sorted(b.getResults()['fernet'].items()):
+        print("Fernet {0}B: encrypt {1:,.1f} MB/s, decrypt {2:,.1f} MB/s".format(size, encrate, decrate))
+    for bits, (genrate, encrate, decrate) in sorted(b.getResults()['rsa'].items()):
+        print("RSA-{0}: {1:,.2f} key pairs/sec, {2:,.0f} encryptions/sec, {3:,.0f} decryptions/sec".format(bits, genrate, encrate, decrate))
+    for bits, (signrate, verifyrate) in sorted(b.getResults()['signing'].items()):
+        print("RSA-{0}: {1:,.0f} signatures/sec, {2:,.0f} verifications/sec".format(bits, signrate, verifyrate))
+    print("Auto selection: {0}".format(b.selectFastest()))
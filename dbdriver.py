@@ -0,0 +1,499 @@
+#! /usr/bin/python36
+#[][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][]
+#[]  Script: dbdriver.py                                                       []
+#[]  Script Language: Python 3.6(.4)                                           []
+#[]  Description: Database drivers for the OracleDB class: cx_Oracle itself,   []
+#[]               or a SQLite stand-in exposing the same interface so OracleDB []
+#[]               can run (and be benchmarked) without an Oracle database.     []
+#[]  Author: Paul J. Laue                                                      []
+#[]  Created: October 19, 2026 08:00:00 PM                                     []
+#[] ========================================================================== []
+#[]  CHANGE LOG                                                                []
+#[]  ----------                                                                []
+#[]                                                                            []
+#[] ========================================================================== []
+#[][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][]
+from decimal import Decimal
+import itertools
+import os
+import sqlite3
+import threading
+
+# environment variable naming the default driver ('cx_Oracle' or 'sqlite')
+DRIVER_VARIABLE = 'ORACLEDB_DRIVER'
+
+def getDriver(name=None):
+    """
+    Returns a driver for the OracleDB class.  A driver is anything exposing the part of the
+    cx_Oracle module interface OracleDB uses: connect, SessionPool, SPOOL_ATTRVAL_WAIT, the
+    DatabaseError exception and the type constants (NUMBER, STRING, CURSOR, CLOB, ...).
+    
+    @param name (optional): 'cx_Oracle' or 'sqlite', the ORACLEDB_DRIVER environment variable (or 'cx_Oracle') when omitted
+    @type name: String
+    
+    @return the cx_Oracle module or a SQLiteDriver
+    
+    @raise ImportError when cx_Oracle is asked for but not installed.
+    @raise ValueError when the driver name is unknown.
+    """
+    name = name if name is not None else os.environ.get(DRIVER_VARIABLE, 'cx_Oracle')
+    if name.lower() in ('cx_oracle', 'oracle'):
+        import cx_Oracle
+        return cx_Oracle
+    elif name.lower() in ('sqlite', 'sqlite3'):
+        return SQLiteDriver()
+    raise ValueError("Unknown database driver '{0}'.".format(name))
+
+def _adaptBinds(binds):
+    """
+    Converts Decimal bind values, which cx_Oracle binds as numbers, to strings SQLite can bind.
+    Only this driver's statements are affected, unlike a process wide sqlite3 adapter.
+    """
+    if isinstance(binds, dict):
+        return {name: str(value) if isinstance(value, Decimal) else value for name, value in binds.items()}
+    return [str(value) if isinstance(value, Decimal) else value for value in binds]
+
+class _BatchError:
+    """
+    A row error of an array DML call, as returned by cursor.getbatcherrors().
+    """
+    __slots__ = ('offset', 'message', 'code')
+    
+    def __init__(self, offset, message):
+        """
+        Creates a new _BatchError object.
+        
+        @param offset: position of the failed row in the batch
+        @type offset: Integer
+        
+        @param message: the error message of the row
+        @type message: String
+        """
+        self.offset = offset
+        self.message = message
+        self.code = 0
+
+class SQLiteVariable:
+    """
+    A bind variable created by cursor.var().
+    """
+    def __init__(self, dbType, size=0):
+        """
+        Creates a new SQLiteVariable object.
+        
+        @param dbType: the driver type of the variable
+        @type dbType: String
+        
+        @param size (optional): maximum size of a string/raw value
+        @type size: Integer
+        """
+        self.type = dbType
+        self.size = size
+        self._value = None
+    
+    def getvalue(self, pos=0):
+        """
+        Returns the value of the variable.
+        
+        @return Object
+        """
+        return self._value
+    
+    def setvalue(self, pos, value):
+        """
+        Sets the value of the variable.
+        
+        @param pos: array position, ignored since variables hold one value
+        @type pos: Integer
+        
+        @param value: the new value
+        @type value: Object
+        """
+        self._value = value
+
+class SQLiteCursor:
+    """
+    A cursor of the SQLite stand-in with the cx_Oracle cursor attributes OracleDB uses.
+    """
+    def __init__(self, connection):
+        """
+        Creates a new SQLiteCursor object on a connection.
+        
+        @param connection: the connection the cursor belongs to
+        @type connection: SQLiteConnection
+        """
+        self.connection = connection
+        self.arraysize = 100
+        self.prefetchrows = 2
+        self.rowfactory = None
+        self.outputtypehandler = None
+        self._cursor = connection._connection.cursor()
+        self._batcherrors = []
+    
+    @property
+    def description(self):
+        """
+        Returns the column descriptions of the last query, None after other statements.
+        
+        @return List of Tuples
+        """
+        return self._cursor.description
+    
+    @property
+    def rowcount(self):
+        """
+        Returns the number of rows the last statement changed.
+        
+        @return Integer
+        """
+        return self._cursor.rowcount
+    
+    def execute(self, sql, binds=None, **keywordBinds):
+        """
+        Executes a statement with positional or named bind values.
+        
+        @param sql: the SQL statement
+        @type sql: String
+        
+        @param binds (optional): positional (List/Tuple) or named (Dictionary) bind values
+        @type binds: List/Dictionary
+        
+        @return the cursor for a query, None otherwise
+        """
+        self._cursor.execute(sql, _adaptBinds(binds if binds is not None else keywordBinds))
+        return self if self._cursor.description is not None else None
+    
+    def executemany(self, sql, rows, batcherrors=False, arraydmlrowcounts=False):
+        """
+        Executes a statement once for every row of bind values.
+        
+        @param sql: the SQL statement
+        @type sql: String
+        
+        @param rows: the bind values of each execution
+        @type rows: List/Sequence
+        
+        @param batcherrors (optional): keep the rows that succeed and collect the errors of the others
+        @type batcherrors: Boolean
+        
+        @param arraydmlrowcounts (optional): accepted for cx_Oracle compatibility, ignored
+        @type arraydmlrowcounts: Boolean
+        """
+        self._batcherrors = []
+        rows = [_adaptBinds(row) for row in rows]
+        if not batcherrors:
+            self._cursor.executemany(sql, rows)
+            return
+        
+        # like Oracle, keep the rows that succeed and collect the errors of the ones that fail
+        self._cursor.execute("SAVEPOINT batch_rows")
+        try:
+            self._cursor.executemany(sql, rows)
+        except sqlite3.DatabaseError:
+            self._cursor.execute("ROLLBACK TO SAVEPOINT batch_rows")
+            for offset, row in enumerate(rows):
+                try:
+                    self._cursor.execute(sql, row)
+                except sqlite3.DatabaseError as e:
+                    self._batcherrors.append(_BatchError(offset, str(e)))
+        finally:
+            self._cursor.execute("RELEASE SAVEPOINT batch_rows")
+    
+    def getbatcherrors(self):
+        """
+        Returns the row errors of the last executemany call with batcherrors.
+        
+        @return List of _BatchError
+        """
+        return self._batcherrors
+    
+    def parse(self, sql):
+        """
+        Does nothing, SQLite parses statements when they are executed.
+        """
+        pass
+    
+    def prepare(self, sql):
+        """
+        Does nothing, SQLite prepares statements when they are executed.
+        """
+        pass
+    
+    def var(self, dbType, size=0, arraysize=None):
+        """
+        Creates a bind variable.
+        
+        @param dbType: the driver type of the variable
+        @type dbType: String
+        
+        @param size (optional): maximum size of a string/raw value
+        @type size: Integer
+        
+        @param arraysize (optional): accepted for cx_Oracle compatibility, ignored
+        @type arraysize: Integer
+        
+        @return SQLiteVariable
+        """
+        return SQLiteVariable(dbType, size)
+    
+    def callproc(self, name, parameters=(), keywordParameters=None):
+        """
+        Stored procedures are not supported by SQLite.
+        
+        @raise sqlite3.NotSupportedError always.
+        """
+        raise sqlite3.NotSupportedError("Stored procedures are not supported by the SQLite stand-in.")
+    
+    def fetchone(self):
+        """
+        Returns the next row of the query, None when there are no more rows.
+        
+        @return Tuple (or rowfactory object)
+        """
+        row = self._cursor.fetchone()
+        return self.rowfactory(*row) if row is not None and self.rowfactory is not None else row
+    
+    def fetchmany(self, numRows=None):
+        """
+        Returns the next rows of the query.
+        
+        @param numRows (optional): number of rows to fetch, arraysize when omitted
+        @type numRows: Integer
+        
+        @return List
+        """
+        rows = self._cursor.fetchmany(numRows if numRows else self.arraysize)
+        return [self.rowfactory(*row) for row in rows] if self.rowfactory is not None else rows
+    
+    def fetchall(self):
+        """
+        Returns the remaining rows of the query.
+        
+        @return List
+        """
+        rows = self._cursor.fetchall()
+        return [self.rowfactory(*row) for row in rows] if self.rowfactory is not None else rows
+    
+    def close(self):
+        """
+        Closes the cursor.
+        """
+        self._cursor.close()
+    
+    def __iter__(self):
+        """
+        Returns an iterator over the remaining rows of the query.
+        
+        @return Iterator
+        """
+        return iter(self.fetchone, None)
+
+class SQLiteConnection:
+    """
+    A connection of the SQLite stand-in with the cx_Oracle connection attributes OracleDB uses.
+    """
+    def __init__(self, database):
+        """
+        Creates a new SQLiteConnection object.
+        
+        @param database: SQLite database URI
+        @type database: String
+        """
+        self.stmtcachesize = 20
+        self.call_timeout = 0
+        self.outputtypehandler = None
+        self._connection = sqlite3.connect(database, uri=True, check_same_thread=False, cached_statements=self.stmtcachesize)
+    
+    def cursor(self):
+        """
+        Opens a cursor on the connection.
+        
+        @return SQLiteCursor
+        """
+        return SQLiteCursor(self)
+    
+    def begin(self):
+        """
+        Does nothing, SQLite starts transactions implicitly.
+        """
+        pass
+    
+    def commit(self):
+        """
+        Commits the current transaction.
+        """
+        self._connection.commit()
+    
+    def rollback(self):
+        """
+        Rolls back the current transaction.
+        """
+        self._connection.rollback()
+    
+    def ping(self):
+        """
+        Checks that the connection still works.
+        """
+        self._connection.execute("SELECT 1")
+    
+    def close(self):
+        """
+        Closes the connection.
+        """
+        self._connection.close()
+
+class SQLiteSessionPool:
+    """
+    A session pool of the SQLite stand-in, handing out up to max connections and waiting for a
+    free one when all are busy.
+    """
+    def __init__(self, database, min=1, max=4, increment=1, **keywordArgs):
+        """
+        Creates a new SQLiteSessionPool object with min connections opened.
+        
+        @param database: SQLite database URI
+        @type database: String
+        
+        @param min (optional): number of connections opened up front
+        @type min: Integer
+        
+        @param max (optional): maximum number of connections handed out at once
+        @type max: Integer
+        
+        @param increment (optional): accepted for cx_Oracle compatibility
+        @type increment: Integer
+        """
+        self.min = min
+        self.max = max
+        self.increment = increment
+        self.stmtcachesize = 20
+        self.opened = 0
+        self.busy = 0
+        self._database = database
+        self._free = []
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max)
+        for _ in range(min):
+            self._free.append(SQLiteConnection(database))
+            self.opened += 1
+    
+    def acquire(self):
+        """
+        Hands out a free connection, opening one if needed and waiting while max are busy.
+        
+        @return SQLiteConnection
+        """
+        self._slots.acquire()
+        with self._lock:
+            self.busy += 1
+            if self._free:
+                return self._free.pop()
+            self.opened += 1
+        return SQLiteConnection(self._database)
+    
+    def release(self, connection):
+        """
+        Returns a connection to the pool.
+        
+        @param connection: a connection handed out by 'acquire'
+        @type connection: SQLiteConnection
+        """
+        with self._lock:
+            self.busy -= 1
+            self._free.append(connection)
+        self._slots.release()
+    
+    def drop(self, connection):
+        """
+        Closes a connection handed out by 'acquire' instead of returning it to the pool.
+        
+        @param connection: a connection handed out by 'acquire'
+        @type connection: SQLiteConnection
+        """
+        with self._lock:
+            self.busy -= 1
+            self.opened -= 1
+        connection.close()
+        self._slots.release()
+    
+    def close(self, force=False):
+        """
+        Closes the free connections of the pool.
+        
+        @param force (optional): accepted for cx_Oracle compatibility
+        @type force: Boolean
+        """
+        with self._lock:
+            for connection in self._free:
+                connection.close()
+            self.opened -= len(self._free)
+            self._free = []
+
+class SQLiteDriver:
+    """
+    A stand-in for the cx_Oracle module backed by SQLite.  Every connection and pooled session of
+    one driver opens the same database (a shared in-memory database unless a file is given), the
+    connection string is ignored, and a one row DUAL table is created so 'SELECT ... FROM dual'
+    works.  SQL is passed to SQLite as is, so statements must be valid in both dialects, and
+    stored procedures are not supported.
+    """
+    _ids = itertools.count(1)
+    
+    SPOOL_ATTRVAL_WAIT = 1
+    NUMBER = 'NUMBER'
+    NATIVE_FLOAT = 'NATIVE_FLOAT'
+    STRING = 'STRING'
+    FIXED_CHAR = 'FIXED_CHAR'
+    DATETIME = 'DATETIME'
+    CLOB = 'CLOB'
+    NCLOB = 'NCLOB'
+    BLOB = 'BLOB'
+    LONG_STRING = 'LONG_STRING'
+    LONG_BINARY = 'LONG_BINARY'
+    CURSOR = 'CURSOR'
+    
+    Error = sqlite3.Error
+    DatabaseError = sqlite3.DatabaseError
+    InterfaceError = sqlite3.InterfaceError
+    IntegrityError = sqlite3.IntegrityError
+    
+    def __init__(self, databaseFile=None):
+        """
+        Creates a new SQLiteDriver object.
+        
+        @param databaseFile (optional): SQLite database file, a private shared in-memory database when omitted
+        @type databaseFile: String
+        """
+        if databaseFile is None:
+            self._database = "file:oracledb_standin_{0}_{1}?mode=memory&cache=shared".format(os.getpid(), next(SQLiteDriver._ids))
+        else:
+            self._database = "file:{0}".format(databaseFile)
+        
+        # keeps a shared in-memory database alive while the driver exists
+        self._keeper = sqlite3.connect(self._database, uri=True, check_same_thread=False)
+        self._keeper.execute("CREATE TABLE IF NOT EXISTS dual (dummy TEXT)")
+        if self._keeper.execute("SELECT COUNT(*) FROM dual").fetchone()[0] == 0:
+            self._keeper.execute("INSERT INTO dual VALUES ('X')")
+        self._keeper.commit()
+    
+    def connect(self, connectionString=None, *args, **keywordArgs):
+        """
+        Opens a connection to the driver's database.
+        
+        @return SQLiteConnection
+        """
+        return SQLiteConnection(self._database)
+    
+    def SessionPool(self, user=None, password=None, dsn=None, min=1, max=4, increment=1, **keywordArgs):
+        """
+        Opens a session pool on the driver's database.
+        
+        @return SQLiteSessionPool
+        """
+        return SQLiteSessionPool(self._database, min=min, max=max, increment=increment)
+    
+    def close(self):
+        """
+        Closes the driver, discarding a shared in-memory database once its connections are closed.
+        """
+        self._keeper.close()
@@ -18,11 +18,16 @@ from cryptography.fernet import Fernet
 import base64
 import os.path
 import hashlib
+import hmac
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.asymmetric import rsa
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives.asymmetric import padding
+from cryptography.exceptions import InvalidSignature
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from collections import deque
+from itertools import islice, repeat
 from enum import Enum
 
 class PublicKeyFormatType(Enum):
@@ -37,7 +42,8 @@ class DigestSize(Enum):
     A enumeration of valid digest sizes
     """
     sz32 = 32,
-    sz64 = 64
+    sz64 = 64,
+    auto = 0
 
 class RSAKeySize(Enum):
     """
@@ -47,6 +53,8 @@ class RSAKeySize(Enum):
     sz2048 = 2048,
     sz4096 = 4096
 
+_autoDigestSize = None
+
 class Encrypter:
     """
     This class handles an implementation for a set of basic encryption/decryption, and
@@ -64,6 +72,10 @@ class Encrypter:
         """
         self._errMsg = ''
         self._outMsg = ''        
+        self._securekey = None
+        self._securekeyfile = None
+        self._cipher = None
+        self._blindindexkey = None
         if not keyFile is None and not self.setSecureKey(keyFile):
             raise OSError("The key file '{keyFile}' does not exist or is invalid!".format(keyFile=keyFile))
         
@@ -169,18 +181,100 @@ class Encrypter:
         @param textToHash: input text to output as a hash digest
         @type textToHas: String
         
-        @param digestSize = specifies the digest size to use for platform dependency.
+        @param digestSize = specifies the digest size to use for platform dependency (auto uses the size pinned with 'setAutoDigestSize').
         @type digestSize: Enumerator
         
-        @return String
+        @return String (None when auto is requested but no size has been pinned)
         """
         if len(textToHash) > 0:
+            if digestSize == DigestSize.auto:
+                digestSize = self.getAutoDigestSize()
+                if digestSize is None:
+                    self._errMsg = "No digest size has been pinned for 'DigestSize.auto'.  Load a choice file with 'EncrypterBenchmark.loadChoice' first."
+                    return None
+                
             if digestSize == DigestSize.sz64:
                 return hashlib.blake2b(str.encode(textToHash), digest_size=64).hexdigest()
             else:
                 return hashlib.blake2s(str.encode(textToHash), digest_size=32).hexdigest()
         else:
             return None
+        
+    def getAutoDigestSize(self):
+        """
+        Returns the Blake2 digest size pinned for 'DigestSize.auto'.  It is never measured
+        implicitly, since digests of one size cannot be compared with digests of the other; every
+        host sharing stored digests must load the same choice file.
+        
+        @return Enumerator (DigestSize), None when no size has been pinned
+        """
+        return _autoDigestSize
+    
+    def setAutoDigestSize(self, digestSize):
+        """
+        Pins the Blake2 digest size to use when 'DigestSize.auto' is requested, normally the choice
+        recorded by 'EncrypterBenchmark.selectFastest' and loaded by 'EncrypterBenchmark.loadChoice'.
+        
+        @param digestSize: the digest size to use (None makes auto unavailable again)
+        @type digestSize: Enumerator (DigestSize)
+        """
+        global _autoDigestSize
+        if digestSize is None or digestSize in (DigestSize.sz32, DigestSize.sz64):
+            _autoDigestSize = digestSize
+        
+    def getBlindIndex(self, textToIndex, context=None):
+        """
+        Returns a deterministic keyed (HMAC-SHA256) blind index digest of some text.  The digest
+        is keyed from the secure key, so equal values produce equal digests without revealing the
+        value, and the same value under a different context (e.g. a field name) produces a
+        different digest.
+        
+        @param textToIndex: input text to output as a blind index digest
+        @type textToIndex: String
+        
+        @param context (optional): a name that separates the digests of different fields
+        @type context: String
+        
+        @return String
+        """
+        if textToIndex is None or len(textToIndex) == 0:
+            return None
+        
+        digest = hmac.new(self._getBlindIndexKey(), digestmod=hashlib.sha256)
+        if context:
+            digest.update(str.encode(context) + b'\x00')
+        digest.update(str.encode(textToIndex))
+        
+        return digest.hexdigest()
+    
+    def getBlindIndexMany(self, textsToIndex, context=None):
+        """
+        Returns blind index digests for many strings of text.
+        
+        @param textsToIndex: an iterable of strings to index
+        @type textsToIndex: List/Sequence
+        
+        @param context (optional): a name that separates the digests of different fields
+        @type context: String
+        
+        @return List of Strings in input order
+        """
+        return [self.getBlindIndex(text, context) for text in textsToIndex]
+    
+    def encryptWithBlindIndex(self, textToEncrypt, context):
+        """
+        Encrypts some text and returns its blind index digest alongside the ciphertext.
+        
+        @param textToEncrypt: a string of text the encrypt
+        @type textToEncrypt: String
+        
+        @param context: the name of the field the text belongs to; BlindIndex computes its digests
+                        with the field name as context, so pass the same name to 'BlindIndex.addDigests'
+        @type context: String
+        
+        @return Tuple containing ciphertext and blind index digest
+        """
+        return self.encrypt(textToEncrypt), self.getBlindIndex(textToEncrypt, context)
 
     def setSecureKey(self, keyFile):
         """
@@ -199,6 +293,8 @@ class Encrypter:
             self._securekeyfile = keyFile
             with open(keyFile) as key:
                 self._securekey = str.encode(key.read())
+            self._cipher = None
+            self._blindindexkey = None
             return True
         except OSError as oerr:
             self._errMsg = "There was a critical error attempting to open key file '{0}'.  OSError={1}".format(keyFile, str(oerr))
@@ -227,17 +323,34 @@ class Encrypter:
             self._errMsg = "A string to encrypt was not provided."
             return None
         else:
-            # is the encryption key set? if not throw error.
-            if self._securekey is None:
-                raise Exception("The secure key used for encryption has not been set.  Use 'setSecureKey' to set the key file.")
-    
-            thiskey = base64.urlsafe_b64decode(self._securekey)
-            thiscipher = Fernet(thiskey)
-            
             texttoencryptasbytes = str.encode(textToEncrypt)
-            encodedtextasbytes = thiscipher.encrypt(texttoencryptasbytes)
+            encodedtextasbytes = self._getCipher().encrypt(texttoencryptasbytes)
         
             return encodedtextasbytes.decode('utf-8')
+        
+    def encryptMany(self, textsToEncrypt):
+        """
+        Uses the secure key to encrypt many strings of text with a single cipher.  Empty or
+        missing values are passed through unchanged.
+        
+        @param textsToEncrypt: an iterable of strings to encrypt
+        @type textsToEncrypt: List/Sequence
+        
+        @return List of Strings in input order
+        """
+        return _fernetMany(self._getCipher(), textsToEncrypt, False)
+    
+    def decryptMany(self, encryptedTexts):
+        """
+        Uses the secure key to decrypt many strings of encrypted text with a single cipher.  Empty or
+        missing values are passed through unchanged.
+        
+        @param encryptedTexts: an iterable of encrypted strings to decrypt
+        @type encryptedTexts: List/Sequence
+        
+        @return List of Strings in input order
+        """
+        return _fernetMany(self._getCipher(), encryptedTexts, True)
                 
     def encryptRSA(self, textToEncrypt, keyFormat):
         """
@@ -313,15 +426,8 @@ class Encrypter:
             self._errMsg = "A string to decrypt was not provided."
             return None
         else:
-            # is the encryption key set? if not throw error.
-            if self._securekey is None:
-                raise Exception("The secure key used for encryption has not been set.  Use 'setSecureKey' to set the key file.")
-
-            thiskey = base64.urlsafe_b64decode(self._securekey)        
-            thiscipher = Fernet(thiskey)
-        
             texttodecryptasbytes = str.encode(encryptedText)
-            decodedtextasbytes = thiscipher.decrypt(texttodecryptasbytes)
+            decodedtextasbytes = self._getCipher().decrypt(texttodecryptasbytes)
         
             return decodedtextasbytes.decode('utf-8')
         
@@ -332,25 +438,146 @@ class Encrypter:
         @param textToSign: some text to add signature to
         @type String
         
-        @return String
+        @return Bytes
         """
         if (len(textToSign) == 0): 
             self._errMsg = "A string to sign was not provided."
             return None
-        else:
-            if self._securekeyfile is not None:
-                with open(self._securekeyfile, 'rb') as key_file:
-                    if self._passPhrase:
-                        key = serialization.load_pem_private_key(key_file.read(), password=self._passPhrase, backend=default_backend())
-                    else:
-                        key = serialization.load_pem_private_key(key_file.read(), backend=default_backend())
-                        
-                    ciphertext = key.sign(str.encode(textToSign), padding.PSS(mfg=padding.MGF1(hashes.SHA256()), salt_length=padding.PSS.MAX_LENGTH), hashes.SHA256())
-                    
-                    return ciphertext.decode('utf-8')
-            else:
-                self._errMsg = "Key file is missing or invalid!"
-                return None
+        
+        signatures = self.signMany([textToSign])
+        return signatures[0] if signatures is not None else None
+    
+    def verify(self, textToVerify, signature, keyFormat=PublicKeyFormatType.PEM):
+        """
+        Verify an RSA signature using the public key file.
+        
+        @param textToVerify: the text that was signed
+        @type textToVerify: String
+        
+        @param signature: the signature produced by 'sign'
+        @type signature: Bytes
+        
+        @param keyFormat (optional): format type of key file (OpenSSH, PEM)
+        @type keyFormat: Enumerator (PublicKeyFormatType)
+        
+        @return Boolean
+        """
+        results = self.verifyMany([textToVerify], [signature], keyFormat)
+        return results[0] if results else False
+    
+    def signMany(self, textsToSign, processes=1, chunkSize=64):
+        """
+        Sign many strings using RSA.  The private key is read once, and when more than one process
+        is requested the signing is spread across a process pool.
+        
+        @param textsToSign: an iterable of strings to sign
+        @type textsToSign: List/Sequence
+        
+        @param processes (optional): number of worker processes to use (1 signs in this process)
+        @type processes: Integer
+        
+        @param chunkSize (optional): number of messages handed to a worker at a time
+        @type chunkSize: Integer
+        
+        @return List of signatures in input order
+        """
+        keybytes = self._readKeyFile()
+        if keybytes is None:
+            return None
+        
+        password = str.encode(self._passPhrase) if self._passPhrase else None
+        return _runKeyJobs(_signChunk, _RSAKeyKind.PRIVATE, keybytes, password, textsToSign, processes, chunkSize)
+    
+    def verifyMany(self, textsToVerify, signatures, keyFormat=PublicKeyFormatType.PEM, processes=1, chunkSize=64):
+        """
+        Verify many RSA signatures using the public key file.  The public key is read once, and when
+        more than one process is requested the verification is spread across a process pool.
+        
+        @param textsToVerify: an iterable of strings that were signed
+        @type textsToVerify: List/Sequence
+        
+        @param signatures: an iterable of signatures, one for each string
+        @type signatures: List/Sequence
+        
+        @param keyFormat (optional): format type of key file (OpenSSH, PEM)
+        @type keyFormat: Enumerator (PublicKeyFormatType)
+        
+        @param processes (optional): number of worker processes to use (1 verifies in this process)
+        @type processes: Integer
+        
+        @param chunkSize (optional): number of messages handed to a worker at a time
+        @type chunkSize: Integer
+        
+        @return List of Booleans in input order, or False (see 'getErrorMsg') when the number of strings
+                and signatures differ or the key file cannot be read
+        """
+        textsToVerify = list(textsToVerify)
+        signatures = list(signatures)
+        if len(textsToVerify) != len(signatures):
+            self._errMsg = "There are {texts} strings to verify but {signatures} signatures.".format(texts=len(textsToVerify), signatures=len(signatures))
+            return False
+        
+        if keyFormat not in (PublicKeyFormatType.OpenSSH, PublicKeyFormatType.PEM):
+            raise ValueError("The key format '{keyFormat}' is not valid!".format(keyFormat=keyFormat))
+        
+        keybytes = self._readKeyFile()
+        if keybytes is None:
+            return False
+        
+        keykind = _RSAKeyKind.OPENSSH if keyFormat == PublicKeyFormatType.OpenSSH else _RSAKeyKind.PEM
+        return _runKeyJobs(_verifyChunk, keykind, keybytes, None, zip(textsToVerify, signatures), processes, chunkSize)
+        
+    def getSecureKey(self):
+        """
+        Returns the secure key read from the key file.
+        
+        @return Bytes
+        """
+        return self._securekey
+        
+    def _getCipher(self):
+        """
+        Returns the Fernet cipher for the secure key, building it once per key.
+        
+        @return Fernet
+        """
+        # is the encryption key set? if not throw error.
+        if self._securekey is None:
+            raise Exception("The secure key used for encryption has not been set.  Use 'setSecureKey' to set the key file.")
+        
+        if self._cipher is None:
+            self._cipher = Fernet(base64.urlsafe_b64decode(self._securekey))
+        return self._cipher
+        
+    def _getBlindIndexKey(self):
+        """
+        Returns the HMAC key used for blind indexes, derived from (and separate to) the secure key.
+        
+        @return Bytes
+        """
+        if self._securekey is None:
+            raise Exception("The secure key used for encryption has not been set.  Use 'setSecureKey' to set the key file.")
+        
+        if self._blindindexkey is None:
+            self._blindindexkey = hmac.new(base64.urlsafe_b64decode(self._securekey), b'blind-index', hashlib.sha256).digest()
+        return self._blindindexkey
+        
+    def _readKeyFile(self):
+        """
+        Reads the raw contents of the key file.
+        
+        @return Bytes
+        """
+        if self._securekeyfile is None:
+            self._errMsg = "Key file is missing or invalid!"
+            return None
+        
+        try:
+            with open(self._securekeyfile, 'rb') as key_file:
+                return key_file.read()
+        except OSError as oerr:
+            self._errMsg = "There was a critical error attempting to open key file '{0}'.  OSError={1}".format(self._securekeyfile, str(oerr))
+            return None
         
     def generateKey(self):
         """
@@ -414,7 +641,7 @@ class Encrypter:
         
         return public_key, pem
         
-    def writeRSAKeyPair(self, publicKey, privateKey, keySize=None, publicKeyFormat=PublicKeyFormatType.PEM, passPhrase=None):
+    def writeRSAKeyPair(self, publicKey, privateKey, keySize=None, publicKeyFormat=PublicKeyFormatType.PEM, passPhrase=None, keyPair=None):
         """
         Writes an RSA key pair to disk that is generated by hazardous materials (hazmat) within cryptography module.
         
@@ -433,9 +660,14 @@ class Encrypter:
         @param passPhrase (optional): a phrase to use when serializing the private key
         @type passPhrase: String
         
+        @param keyPair (optional): an already generated key pair (public, private) to write instead of generating one
+        @type keyPair: Tuple
+        
         @return Boolean
         """
-        if passPhrase:
+        if keyPair is not None:
+            pubkey, pem = keyPair
+        elif passPhrase:
             if publicKeyFormat:
                 pubkey, pem = self.generateRSAKeyPair(keySize, publicKeyFormat, passPhrase)
             else:
@@ -464,4 +696,279 @@ class Encrypter:
             
         self._outMsg = pubkeystr
         
-        return True
\ No newline at end of file
+        return True
+
+
+def _fernetMany(cipher, texts, decrypt):
+    """
+    Encrypts or decrypts many strings with one Fernet cipher, passing empty values through.
+    """
+    operation = cipher.decrypt if decrypt else cipher.encrypt
+    return [operation(str.encode(str(text))).decode('utf-8') if text not in (None, '') else text for text in texts]
+
+class _RSAKeyKind(Enum):
+    """
+    An enumeration of the kinds of RSA key a signing/verification worker can load.
+    """
+    PRIVATE = 0,
+    PEM = 1,
+    OPENSSH = 2
+
+# the key a worker process loaded last, with the key material it was loaded from
+_workerKey = None
+_workerKeySource = None
+
+def _signaturePadding():
+    """
+    Returns the PSS padding used for RSA signatures.
+    """
+    return padding.PSS(mgf=padding.MGF1(hashes.SHA256()), salt_length=padding.PSS.MAX_LENGTH)
+
+def _loadRSAKey(keyKind, keyBytes, password):
+    """
+    Deserializes an RSA key of the given kind.
+    """
+    if keyKind == _RSAKeyKind.PRIVATE:
+        return serialization.load_pem_private_key(keyBytes, password=password, backend=default_backend())
+    elif keyKind == _RSAKeyKind.OPENSSH:
+        return serialization.load_ssh_public_key(keyBytes, backend=default_backend())
+    else:
+        return serialization.load_pem_public_key(keyBytes, backend=default_backend())
+
+def _runKeyChunk(job, keyKind, keyBytes, password, chunk):
+    """
+    Runs a signing/verification job on a chunk inside a worker process.  The key material comes
+    with every chunk, but the key is only deserialized when it differs from the worker's last one.
+    """
+    global _workerKey, _workerKeySource
+    if _workerKeySource != (keyKind, keyBytes, password):
+        _workerKey = _loadRSAKey(keyKind, keyBytes, password)
+        _workerKeySource = (keyKind, keyBytes, password)
+    return job(chunk, _workerKey)
+
+def _signChunk(texts, key):
+    """
+    Signs a chunk of strings with a private key.
+    """
+    pad = _signaturePadding()
+    return [key.sign(text if isinstance(text, bytes) else str.encode(text), pad, hashes.SHA256()) for text in texts]
+
+def _verifyChunk(pairs, key):
+    """
+    Verifies a chunk of (string, signature) pairs with a public key.
+    """
+    pad = _signaturePadding()
+    results = []
+    for text, signature in pairs:
+        try:
+            key.verify(signature, text if isinstance(text, bytes) else str.encode(text), pad, hashes.SHA256())
+            results.append(True)
+        except InvalidSignature:
+            results.append(False)
+    return results
+
+def _chunked(iterable, chunkSize):
+    """
+    Splits an iterable into lists of at most chunkSize items.
+    """
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, chunkSize))
+        if not chunk:
+            return
+        yield chunk
+
+def _runKeyJobs(job, keyKind, keyBytes, password, items, processes, chunkSize):
+    """
+    Runs a signing/verification job over items either in this process or across a process pool,
+    returning the flattened results in input order.
+    """
+    chunkSize = chunkSize if chunkSize > 0 else 64
+    results = []
+    if processes is None or processes > 1:
+        # Python 3.6 has no pool initializer, so the key material travels with each chunk
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            for chunkresults in executor.map(_runKeyChunk, repeat(job), repeat(keyKind), repeat(keyBytes), repeat(password), _chunked(items, chunkSize)):
+                results.extend(chunkresults)
+    else:
+        key = _loadRSAKey(keyKind, keyBytes, password)
+        for chunk in _chunked(items, chunkSize):
+            results.extend(job(chunk, key))
+    return results
+
+def _generateRSAKeyPairWorker(keySize, publicKeyFormat, passPhrase):
+    """
+    Generates a single RSA key pair inside a worker process.
+    
+    @return Tuple containing public and private key
+    """
+    return Encrypter().generateRSAKeyPair(keySize, publicKeyFormat, passPhrase)
+
+
+class RSAKeyFactory:
+    """
+    This class pre-generates RSA key pairs in a pool of worker processes and keeps them
+    stocked up to a target count, so that callers can be handed a ready key pair immediately
+    instead of waiting on key generation.
+    """
+    def __init__(self, targetStock=10, keySize=RSAKeySize.sz2048, publicKeyFormat=PublicKeyFormatType.PEM, passPhrase=None, maxWorkers=None):
+        """
+        Creates a new RSAKeyFactory object.  Call 'start' to begin generating key pairs.
+        
+        @param targetStock (optional): number of key pairs to keep stocked
+        @type targetStock: Integer
+        
+        @param keySize (optional): a reference to the size of key to use during generation.
+        @type keySize: Enumerator
+        
+        @param publicKeyFormat (optional): format type of public key to generate
+        @type publicKeyFormat: Enumerator
+        
+        @param passPhrase (optional): a phrase to use when serializing the private key
+        @type passPhrase: String
+        
+        @param maxWorkers (optional): number of worker processes (defaults to the cpu count)
+        @type maxWorkers: Integer
+        """
+        self._errMsg = ''
+        self._outMsg = ''
+        self._targetstock = targetStock if targetStock > 0 else 1
+        self._keysize = keySize
+        self._pubformat = publicKeyFormat
+        self._passPhrase = passPhrase
+        self._maxworkers = maxWorkers
+        self._executor = None
+        self._pending = deque()
+        self._stock = deque()
+        
+    def __enter__(self):
+        self.start()
+        return self
+    
+    def __exit__(self, excType, excValue, traceback):
+        self.shutdown()
+        
+    def getErrorMsg(self):
+        """
+        Returns any error messages on the stack.
+        
+        @return String
+        """
+        return self._errMsg
+    
+    def getOutputMsg(self):
+        """
+        Returns any output messages on the stack.
+        
+        @return String
+        """
+        return self._outMsg
+    
+    def start(self):
+        """
+        Starts the worker process pool and begins filling the stock of key pairs.
+        """
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self._maxworkers)
+        self.replenish()
+        
+    def shutdown(self, wait=True):
+        """
+        Stops the worker process pool.  Key pairs already in stock remain available.
+        
+        @param wait (optional): wait for pending key generation to finish
+        @type wait: Boolean
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+            self._harvest()
+            self._pending.clear()
+            
+    def replenish(self):
+        """
+        Queues enough key generation jobs to bring the stock back up to the target.
+        """
+        if self._executor is None:
+            return
+        
+        self._harvest()
+        while len(self._stock) + len(self._pending) < self._targetstock:
+            self._pending.append(self._executor.submit(_generateRSAKeyPairWorker, self._keysize, self._pubformat, self._passPhrase))
+            
+    def getStockCount(self):
+        """
+        Returns the number of key pairs that are ready to be handed out.
+        
+        @return Integer
+        """
+        self._harvest()
+        return len(self._stock)
+    
+    def getPendingCount(self):
+        """
+        Returns the number of key pairs currently being generated.
+        
+        @return Integer
+        """
+        self._harvest()
+        return len(self._pending)
+        
+    def getKeyPair(self, block=True):
+        """
+        Returns a ready key pair from stock.  When the stock is empty the next pending key pair is
+        awaited, or one is generated in the calling process if the pool has not been started.
+        
+        @param block (optional): when False, return None instead of waiting on an empty stock
+        @type block: Boolean
+        
+        @return Tuple containing public and private key
+        """
+        self._harvest()
+        if len(self._stock) == 0:
+            if not block:
+                return None
+            
+            while len(self._stock) == 0 and len(self._pending) > 0:
+                wait(self._pending, return_when=FIRST_COMPLETED)
+                self._harvest()
+            
+            if len(self._stock) == 0:
+                self._stock.append(_generateRSAKeyPairWorker(self._keysize, self._pubformat, self._passPhrase))
+                
+        keypair = self._stock.popleft()
+        self.replenish()
+        
+        return keypair
+    
+    def writeRSAKeyPairs(self, keyFiles):
+        """
+        Writes a stocked key pair to each public/private key file pair.
+        
+        @param keyFiles: a list of (publicKeyFile, privateKeyFile) paths
+        @type keyFiles: List/Sequence
+        
+        @return Boolean
+        """
+        enc = Encrypter()
+        written = 0
+        for publicKey, privateKey in keyFiles:
+            if not enc.writeRSAKeyPair(publicKey, privateKey, keyPair=self.getKeyPair()):
+                self._errMsg = enc.getErrorMsg()
+                self._outMsg = "Wrote {written} key pairs.".format(written=written)
+                return False
+            written += 1
+            
+        self._outMsg = "Wrote {written} key pairs.".format(written=written)
+        return True
+    
+    def _harvest(self):
+        """
+        Moves finished key generation jobs into the stock.
+        """
+        for fut in [f for f in self._pending if f.done()]:
+            self._pending.remove(fut)
+            try:
+                self._stock.append(fut.result())
+            except Exception as err:
+                self._errMsg = "Critical error while generating rsa key pair. Error={err}".format(err=err)
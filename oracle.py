@@ -3,7 +3,8 @@
 #[]  Script: oracle.py                                                         []
 #[]  Script Language: Python 3.6(.4)                                           []
 #[]  Description: This class can be used to connect to an Oracle database and  []
-#[]               execute sql commands by using the cx_Oracle module.          []
+#[]               execute sql commands by using the cx_Oracle module (or a     []
+#[]               stand-in driver from dbdriver, e.g. SQLite).                 []
 #[]  Author: Paul J. Laue                                                      []
 #[]  Created: February 23, 2018 4:03:00 PM                                     []
 #[] ========================================================================== []
@@ -12,24 +13,131 @@
 #[]                                                                            []
 #[] ========================================================================== []
 #[][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][]
-import cx_Oracle
+from dbdriver import getDriver
 import os.path
 import sys
+from contextlib import contextmanager
+from functools import partial
+from itertools import chain, islice
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import array
+from querycache import QueryResultCache
+from rowtypes import getRowClass
+from sqltext import getStatementType, splitStatements
+from sqlinstrument import SQLInstrumentation
+from watermarkstate import WatermarkState
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+import base64
+import csv
+import gzip
+import json
+import queue
+import re
+import shutil
+import threading
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+try:
+    import cx_Oracle
+except ImportError:
+    cx_Oracle = None
+import time
+
+# number of distinct statement texts tracked by the parse statistics
+_MAX_TRACKED_STATEMENTS = 10000
+
+# marks a savepoint in the transaction queue
+_SAVEPOINT = object()
+
+# marks the end of a range in the merged stream of a parallel extraction
+_RANGE_DONE = object()
+
+# a plain, optionally qualified (schema.table, schema.package.procedure), table, column or procedure name
+_IDENTIFIER = re.compile(r'^[A-Za-z][A-Za-z0-9_$#]*(\.[A-Za-z][A-Za-z0-9_$#]*){0,2}$')
+
+def _inlineLOBHandler(driver, cursor, name, defaultType, size, precision, scale):
+    """
+    Output type handler that fetches CLOB/NCLOB columns as strings and BLOB columns as bytes in the
+    fetch round trip, instead of as LOB locators that each cost another round trip to read.  The
+    type constants come from the driver, which is bound with functools.partial.
+    """
+    if defaultType in (driver.CLOB, driver.NCLOB):
+        return cursor.var(driver.LONG_STRING, arraysize=cursor.arraysize)
+    if defaultType == driver.BLOB:
+        return cursor.var(driver.LONG_BINARY, arraysize=cursor.arraysize)
+
+class ExportFormat(Enum):
+    """
+    An enumeration of file formats query results can be exported to.
+    """
+    CSV = 0,
+    JSONL = 1
+
+class RowFormat(Enum):
+    """
+    An enumeration of the objects query rows are returned as.
+    """
+    TUPLE = 0,
+    NAMEDTUPLE = 1,
+    SLOTS = 2
+
+class OutParameter:
+    """
+    Marks an OUT (or IN OUT) parameter of a stored procedure call.  Use the driver's CURSOR type
+    (cx_Oracle.CURSOR) for a REF CURSOR.
+    """
+    def __init__(self, dbType=None, size=0, value=None):
+        """
+        Creates a new OutParameter object.
+        
+        @param dbType (optional): the driver type of the parameter, the driver's STRING when omitted
+        @type dbType: cx_Oracle type
+        
+        @param size (optional): maximum size of a string/raw parameter
+        @type size: Integer
+        
+        @param value (optional): the value passed in for an IN OUT parameter
+        @type value: Object
+        """
+        self.dbType = dbType
+        self.size = size
+        self.value = value
+        
+    def isRefCursor(self, driver=None):
+        """
+        Returns whether the parameter is a REF CURSOR.
+        
+        @param driver (optional): the driver the parameter is bound with, cx_Oracle when omitted
+        @type driver: Module/SQLiteDriver
+        
+        @return Boolean
+        """
+        driver = driver if driver is not None else cx_Oracle
+        return driver is not None and self.dbType == driver.CURSOR
 
 class OracleDB:
     """
     This class handles the connection to an Oracle database and execution of 
     SQL statement(s) or stored procedures.
     """
-    def __init__(self, connectionString=None):
+    def __init__(self, connectionString=None, driver=None):
         """
         Create a new empty OracleDB object.
         
         @param connectionString: an oracle database connection string
         @type connectionString: String 
+        
+        @param driver (optional): the database driver or its name ('cx_Oracle' or 'sqlite'), see 'dbdriver.getDriver'
+        @type driver: Module/SQLiteDriver/String
         """
         self._errMsg = ''
         self._outMsg = ''
+        self._driver = getDriver(driver) if driver is None or type(driver) == str else driver
         
         if connectionString is not None:
             self.setConnectionString(connectionString)
@@ -38,8 +146,27 @@ class OracleDB:
             
         self._sql = ''
         self._connection = None
+        self._pool = None
+        self._pingonacquire = True
         self._queryresults = []
+        self._columnresults = None
         self._transactions = []
+        self._batcherrors = []
+        self._bulkstats = None
+        self._stmtcachesize = None
+        self._resultcache = None
+        self._exportstats = None
+        self._executecount = 0
+        self._statementtexts = set()
+        self._statslock = threading.Lock()
+        self._instrumentation = None
+        self._local = threading.local()
+        self._inlinelobs = False
+        self._lobhandler = partial(_inlineLOBHandler, self._driver)
+        self._extractprogress = []
+        self._procedureresults = {}
+        self._scriptresults = []
+        self._rowformat = RowFormat.TUPLE
         
     def open(self, connectionString=None):
         """
@@ -54,22 +181,162 @@ class OracleDB:
             self.setConnectionString(connectionString)
             
         try:
-            self._connection = cx_Oracle.connect(self._connectionstr)
-            self._outMsg = "Oracle database connection opened."
+            self._connection = self._connect()
         
-        except cx_Oracle.DatabaseError as e:
-            error, = e.args
-            self._errMsg = "[Oracle-Error-Message: " + str(error.message) + "] with [System Error: " + str(sys.stderr) + "]"
+        except self._driver.DatabaseError as e:
+            self._setDatabaseError(e)
             return False
         
         return True
     
     def close(self):
         """
-        Attempts to close the database connection if it is open.
+        Attempts to close the database connection and session pool if they are open.
         """
         if not self._connection is None:
             self._connection.close()
+            self._connection = None
+            
+        self.closePool()
+            
+    def openPool(self, minSessions=1, maxSessions=4, increment=1, connectionString=None, pingOnAcquire=True):
+        """
+        Attempts to open a session pool.  While a pool is open, statements borrow a pooled session
+        for their duration instead of using a dedicated connection.
+        
+        @param minSessions (optional): number of sessions opened up front
+        @type minSessions: Integer
+        
+        @param maxSessions (optional): maximum number of sessions in the pool
+        @type maxSessions: Integer
+        
+        @param increment (optional): number of sessions opened when the pool needs to grow
+        @type increment: Integer
+        
+        @param connectionString (optional): an oracle database connection string
+        @type connectionString: String
+        
+        @param pingOnAcquire (optional): check each session is alive before handing it out
+        @type pingOnAcquire: Boolean
+        
+        @return Boolean
+        """
+        if not connectionString is None:
+            self.setConnectionString(connectionString)
+            
+        if self._pool is not None:
+            self.closePool()
+            
+        user, password, dsn = self._splitConnectionString()
+        try:
+            self._pool = self._driver.SessionPool(user, password, dsn, min=minSessions, max=maxSessions, increment=increment, threaded=True, getmode=self._driver.SPOOL_ATTRVAL_WAIT)
+            if self._stmtcachesize is not None:
+                self._pool.stmtcachesize = self._stmtcachesize
+            self._pingonacquire = pingOnAcquire
+            self._outMsg = "Oracle session pool opened with {minSessions} to {maxSessions} sessions.".format(minSessions=minSessions, maxSessions=maxSessions)
+        
+        except self._driver.DatabaseError as e:
+            self._setDatabaseError(e)
+            return False
+        
+        return True
+    
+    def closePool(self):
+        """
+        Attempts to close the session pool if it is open.
+        """
+        if not self._pool is None:
+            self._pool.close(force=True)
+            self._pool = None
+            
+    def isPooled(self):
+        """
+        Returns whether statements are run on pooled sessions.
+        
+        @return Boolean
+        """
+        return self._pool is not None
+    
+    def acquireSession(self):
+        """
+        Borrows a session from the pool.  Sessions that fail a health check are dropped and
+        replaced.  Every acquired session must be handed back with 'releaseSession'.
+        
+        @return Connection
+        """
+        if self._pool is None:
+            raise Exception("A session pool is required before calling the 'acquireSession' method!  Use 'openPool' to open one.")
+        
+        connection = self._pool.acquire()
+        if self._pingonacquire:
+            try:
+                connection.ping()
+            except self._driver.DatabaseError:
+                self._pool.drop(connection)
+                connection = self._pool.acquire()
+                
+        return connection
+    
+    def releaseSession(self, connection, rollback=False):
+        """
+        Hands a borrowed session back to the pool.
+        
+        @param connection: a session returned by 'acquireSession'
+        @type connection: Connection
+        
+        @param rollback (optional): rollback any uncommitted work before releasing
+        @type rollback: Boolean
+        """
+        if self._pool is not None and connection is not None:
+            if rollback:
+                connection.rollback()
+            self._pool.release(connection)
+            
+    @contextmanager
+    def acquire(self):
+        """
+        Context manager that borrows a pooled session (or the dedicated connection when no pool
+        is open) and hands it back when the block exits.  Uncommitted work on a pooled session is
+        rolled back if the block raises.
+        
+        @return Connection
+        """
+        with self._session() as connection:
+            yield connection
+            
+    def checkPoolHealth(self):
+        """
+        Borrows a session and pings the database to verify the pool can serve requests.
+        
+        @return Boolean
+        """
+        if self._pool is None:
+            self._errMsg = "No session pool is open."
+            return False
+        
+        try:
+            connection = self._pool.acquire()
+            try:
+                connection.ping()
+            finally:
+                self._pool.release(connection)
+            self._outMsg = "Session pool is healthy: {opened} opened, {busy} busy.".format(opened=self._pool.opened, busy=self._pool.busy)
+        except self._driver.DatabaseError as e:
+            self._setDatabaseError(e)
+            return False
+        
+        return True
+    
+    def getPoolStatistics(self):
+        """
+        Returns the size and usage of the session pool.
+        
+        @return Dictionary
+        """
+        if self._pool is None:
+            return None
+        
+        return {'min': self._pool.min, 'max': self._pool.max, 'increment': self._pool.increment, 'opened': self._pool.opened, 'busy': self._pool.busy}
             
     def begin(self):
         """
@@ -92,37 +359,335 @@ class OracleDB:
         if not self._connection is None:
             self._connection.rollback()
         
-    def runStoredProcedure(self, storedProcedureName, params=[]):
+    def runStoredProcedure(self, storedProcedureName, params=[], keywordParams=None, arraySize=1000):
+        """
+        Use existing database connection (or a pooled session) to execute a stored procedure.
+        Parameters are always sent as bind variables.  OUT and IN OUT parameters are given as
+        OutParameter objects and their values are kept for 'getProcedureResults'; the rows of a
+        REF CURSOR are fetched in batches of arraySize into a list.
+        
+        @param storedProcedureName: name of stored procedure
+        @type storedProcedureName: String
+        
+        @param params: a list of positional parameters to be used when calling stored procedure
+        @type params: List
+        
+        @param keywordParams (optional): a dictionary of named parameters to be used when calling stored procedure
+        @type keywordParams: Dictionary
+        
+        @param arraySize (optional): number of REF CURSOR rows fetched from the database per round trip
+        @type arraySize: Integer
+        
+        @return Boolean
+        """
+        self._procedureresults = {}
+        try:
+            with self._session() as db:
+                cursor = db.cursor()
+                try:
+                    outputs = self._callprocWithOutputs(cursor, storedProcedureName, params, keywordParams)
+                    for key, value in outputs:
+                        self._procedureresults[key] = self._fetchRefCursor(value, arraySize) if self._isCursor(value) else value
+                finally:
+                    cursor.close()
+                
+            return True
+        except self._driver.DatabaseError as e:
+            self._setDatabaseError(e)
+            return False
+    
+    def executeProcedureStream(self, storedProcedureName, params=[], keywordParams=None, cursorKey=None, arraySize=1000, batches=False):
         """
-        Use existing database connection to execute a stored procedure.
+        Executes a stored procedure and yields the rows of one of its REF CURSOR parameters as they
+        are fetched, through the same batched fetch path as 'executeQueryStream'.  The session is held
+        until the generator is exhausted or closed.  The other OUT parameters (and the rows of any
+        other REF CURSOR) are available from 'getProcedureResults' once the first row is yielded.
         
         @param storedProcedureName: name of stored procedure
         @type storedProcedureName: String
         
-        @param params: a list of parameters to be used when calling stored procedure
+        @param params: a list of positional parameters, with OutParameter objects for OUT parameters
         @type params: List
         
+        @param keywordParams (optional): a dictionary of named parameters, with OutParameter objects for OUT parameters
+        @type keywordParams: Dictionary
+        
+        @param cursorKey (optional): position (Integer) or name (String) of the REF CURSOR to stream, the first one when omitted
+        @type cursorKey: Integer/String
+        
+        @param arraySize (optional): number of rows fetched from the database per round trip
+        @type arraySize: Integer
+        
+        @param batches (optional): yield lists of up to arraySize rows instead of single rows
+        @type batches: Boolean
+        
+        @return Generator of rows (Tuples) or batches (Lists of Tuples)
+        
+        @raise cx_Oracle.DatabaseError when the call fails (the message is also put on the error stack).
+        """
+        self._procedureresults = {}
+        rowcount = 0
+        try:
+            with self._session() as db:
+                cursor = db.cursor()
+                try:
+                    outputs = self._callprocWithOutputs(cursor, storedProcedureName, params, keywordParams)
+                    refcursors = [key for key, value in outputs if self._isCursor(value)]
+                    if cursorKey is None and refcursors:
+                        cursorKey = refcursors[0]
+                    if cursorKey not in refcursors:
+                        raise ValueError("The stored procedure '{0}' has no REF CURSOR parameter '{1}'.".format(storedProcedureName, cursorKey))
+                    
+                    streamed = None
+                    for key, value in outputs:
+                        if key == cursorKey:
+                            streamed = value
+                        else:
+                            self._procedureresults[key] = self._fetchRefCursor(value, arraySize) if self._isCursor(value) else value
+                            
+                    self._setFetchSize(streamed, arraySize)
+                    for batch in self._fetchBatches(streamed, arraySize):
+                        rowcount += len(batch)
+                        if batches:
+                            yield batch
+                        else:
+                            yield from batch
+                finally:
+                    cursor.close()
+                    
+            self._outMsg = "REF CURSOR returned {rowcount} rows".format(rowcount=rowcount)
+        except self._driver.DatabaseError as e:
+            self._setDatabaseError(e)
+            raise
+        
+    def runStoredProcedureMany(self, storedProcedureName, paramSets, batchSize=10000, commit=True, connectionString=None):
+        """
+        Runs a stored procedure once for each set of IN parameters, sending batchSize sets per round
+        trip as an array-bound anonymous block ("BEGIN proc(:1, :2); END;") instead of one call each.
+        Use 'getBulkStatistics' to inspect the outcome.
+        
+        @param storedProcedureName: name of stored procedure
+        @type storedProcedureName: String
+        
+        @param paramSets: an iterable of positional parameter tuples (or dictionaries of named parameters)
+        @type paramSets: Iterable
+        
+        @param batchSize (optional): number of calls sent per round trip
+        @type batchSize: Integer
+        
+        @param commit (optional): commit once every batch has been sent
+        @type commit: Boolean
+        
+        @param connectionString (optional): an oracle database connection string
+        @type connectionString: String
+        
         @return Boolean
         """
-        if self._connection is None:
-            db = self.open(self.setConnectionString(self._connectionstr))
+        if not _IDENTIFIER.match(storedProcedureName):
+            self._errMsg = "'{0}' is not a valid stored procedure name.".format(storedProcedureName)
+            return False
+        
+        iterator = iter(paramSets)
+        first = next(iterator, None)
+        if first is None:
+            self._errMsg = "No parameter sets were given for stored procedure '{0}'.".format(storedProcedureName)
+            return False
+        
+        if isinstance(first, dict):
+            arguments = ", ".join("{0} => :{0}".format(name) for name in first)
         else:
-            db = self._connection
+            arguments = ", ".join(":{0}".format(position) for position in range(1, len(first) + 1))
+            
+        sql = "BEGIN {name}({arguments}); END;".format(name=storedProcedureName, arguments=arguments)
+        return self.executeMany(sql, chain([first], iterator), batchSize, commit, connectionString)
+    
+    def getProcedureResults(self):
+        """
+        Returns the OUT parameter values of the last stored procedure call, keyed by position
+        (Integer) for positional parameters and by name for keyword parameters.  REF CURSORs are
+        returned as lists of rows.
         
-        try:    
-            cursor = db.cursor()
-            if len(params) > 0:
-                cursor.callproc(storedProcedureName, params)
-            else:
-                cursor.callproc(storedProcedureName)
+        @return Dictionary
+        """
+        return self._procedureresults
+    
+    def setStatementCacheSize(self, size):
+        """
+        Set the number of statements cached per connection/session on the client, so repeated
+        statements using bind variables are not parsed again.  Applies to connections and pools
+        opened as well as any already open.
+        
+        @param size: number of statements to cache (0 disables the cache)
+        @type size: Integer
+        """
+        if type(size) == int and size >= 0:
+            self._stmtcachesize = size
+            if self._connection is not None:
+                self._connection.stmtcachesize = size
+            if self._pool is not None:
+                self._pool.stmtcachesize = size
                 
-            return True
-        except cx_Oracle.DatabaseError as e:
-            error, = e.args
-            self._errMsg = "[Oracle-Error-Message: " + str(error.message) + "] with [System Error: " + str(sys.stderr) + "]"
+    def getParseStatistics(self):
+        """
+        Returns statement execution counts.  'executions' and 'distinctStatements' are counted on the
+        client; a distinct statement text costs at least one parse, so a count close to the number of
+        executions means literals are defeating the statement cache.  The session's server side
+        'parse count (total)', 'parse count (hard)' and 'execute count' statistics are included when
+        the user can read v$mystat (for a pool these belong to the session that was borrowed).
+        Statement texts are tracked by hash up to a limit; once it is reached 'distinctStatements'
+        stops growing and 'distinctStatementsCapped' is True.
+        
+        @return Dictionary
+        """
+        with self._statslock:
+            stats = {'executions': self._executecount, 'distinctStatements': len(self._statementtexts),
+                     'distinctStatementsCapped': len(self._statementtexts) >= _MAX_TRACKED_STATEMENTS}
+        
+        try:
+            with self._session() as conn:
+                sqlcursor = conn.cursor()
+                try:
+                    sqlcursor.execute("SELECT n.name, s.value FROM v$mystat s JOIN v$statname n ON n.statistic# = s.statistic# "
+                                      "WHERE n.name IN ('parse count (total)', 'parse count (hard)', 'execute count')")
+                    for name, value in sqlcursor.fetchall():
+                        stats[name] = value
+                finally:
+                    sqlcursor.close()
+        except self._driver.DatabaseError as e:
+            self._setDatabaseError(e)
+            
+        return stats
+    
+    def resetParseStatistics(self):
+        """
+        Clears out the client side execution counts.
+        """
+        with self._statslock:
+            self._executecount = 0
+            self._statementtexts.clear()
+    
+    def enableResultCache(self, maxBytes=67108864, defaultTTL=300, cacheFile=None):
+        """
+        Turns on the query result cache used by 'executeCommand(useCache=True)'.  Results are keyed by
+        normalized SQL plus bind values, expire after their time to live and the least recently used
+        results are evicted beyond maxBytes.
+        
+        @param maxBytes (optional): approximate upper bound of the memory used by cached results
+        @type maxBytes: Integer
+        
+        @param defaultTTL (optional): seconds a result is kept when no time to live is given
+        @type defaultTTL: Integer
+        
+        @param cacheFile (optional): full path to a file the cache is loaded from and saved to between runs
+        @type cacheFile: String
+        """
+        self._resultcache = QueryResultCache(maxBytes, defaultTTL, cacheFile)
+        
+    def disableResultCache(self, save=False):
+        """
+        Turns off the query result cache.
+        
+        @param save (optional): save the cache to its cache file first
+        @type save: Boolean
+        """
+        if self._resultcache is not None and save:
+            self.saveResultCache()
+        self._resultcache = None
+        
+    def saveResultCache(self, cacheFile=None):
+        """
+        Writes the query result cache to disk so a later run can reuse it.
+        
+        @param cacheFile (optional): full path to the file, the cache file given to 'enableResultCache' when omitted
+        @type cacheFile: String
+        
+        @return Boolean
+        """
+        if self._resultcache is None:
+            self._errMsg = "The result cache is not enabled."
             return False
-        finally:
-            cursor.close()
+        
+        if not self._resultcache.save(cacheFile):
+            self._errMsg = self._resultcache.getErrorMsg()
+            return False
+        
+        self._outMsg = self._resultcache.getOutputMsg()
+        return True
+    
+    def invalidateResultCache(self, sql=None, binds=None):
+        """
+        Removes results from the query result cache: everything, every result of one query, or the
+        result of one query for the given bind values.
+        
+        @param sql (optional): the SQL query to remove
+        @type sql: String
+        
+        @param binds (optional): the bind values of the query to remove
+        @type binds: List/Dictionary
+        
+        @return Integer number of results removed
+        """
+        return self._resultcache.invalidate(sql, binds) if self._resultcache is not None else 0
+    
+    def getResultCacheStatistics(self):
+        """
+        Returns the hit/miss counters and size of the query result cache.
+        
+        @return Dictionary
+        """
+        return self._resultcache.getStatistics() if self._resultcache is not None else None
+    
+    def enableInstrumentation(self, slowQueryThreshold=None, slowQueryLogFile=None, measureParse=False, sessionStatistics=False):
+        """
+        Turns on per statement instrumentation: connect, parse, execute and fetch durations plus rows
+        fetched for every statement, a slow query log and an aggregate report (see 'getStatementReport').
+        
+        @param slowQueryThreshold (optional): seconds after which a statement is written to the slow query log
+        @type slowQueryThreshold: Float
+        
+        @param slowQueryLogFile (optional): full path to the slow query log (the 'oracle.slowquery' logger is used either way)
+        @type slowQueryLogFile: String
+        
+        @param measureParse (optional): parse each statement in its own round trip so parse time is measured
+                                        separately from execute time
+        @type measureParse: Boolean
+        
+        @param sessionStatistics (optional): sample the session's round trips and bytes from v$mystat around
+                                             each statement (costs two extra round trips per statement)
+        @type sessionStatistics: Boolean
+        """
+        self.disableInstrumentation()
+        self._instrumentation = SQLInstrumentation(slowQueryThreshold, slowQueryLogFile, measureParse, sessionStatistics, maxStatements=_MAX_TRACKED_STATEMENTS)
+        
+    def disableInstrumentation(self):
+        """
+        Turns off per statement instrumentation.
+        """
+        if self._instrumentation is not None:
+            self._instrumentation.close()
+            self._instrumentation = None
+            
+    def getInstrumentation(self):
+        """
+        Returns the instrumentation collecting statement records, or None when it is off.
+        
+        @return SQLInstrumentation
+        """
+        return self._instrumentation
+    
+    def getStatementReport(self, top=10, orderBy='total'):
+        """
+        Returns the statements that cost the most, with their totals per phase.
+        
+        @param top (optional): number of statements to return
+        @type top: Integer
+        
+        @param orderBy (optional): the total to order by ('total', 'count', 'max', 'rows', 'connect', 'parse', 'execute' or 'fetch')
+        @type orderBy: String
+        
+        @return List of Dictionaries
+        """
+        return self._instrumentation.getReport(top, orderBy) if self._instrumentation is not None else []
     
     def getErrorMsg(self):
         """
@@ -183,7 +748,7 @@ class OracleDB:
         @return List of all transactions in queue.
         """
         if not self._transactions is None:
-            return self._transactions
+            return [tran for tran, binds in self._transactions]
         
     def removeTransactionFromQueue(self, itemIndex):
         """
@@ -198,22 +763,25 @@ class OracleDB:
         
         try:
             if not self._transactions is None:
-                self._transactions.remove(itemIndex)
+                del self._transactions[itemIndex]
                 
             return True
-        except ValueError as verr:
+        except IndexError as verr:
             self._errMsg = "No item at index {itemIndex} could be found! Error: {verr}".format(itemIndex=itemIndex, verr=verr)
             return False
             
-    def addTransactionToQueue(self, transaction):
+    def addTransactionToQueue(self, transaction, binds=None):
         """
         Adds a new transaction to the transaction list.
         
         @param transaction: a transaction statement to add to the queue.
         @type transaction: String
+        
+        @param binds (optional): positional (List/Tuple) or named (Dictionary) bind values for the statement
+        @type binds: List/Dictionary
         """
         if not self._transactions is None:
-            self._transactions.append(transaction)
+            self._transactions.append((transaction, binds))
             
     def getTransactionFromQueue(self, itemIndex=None):
         """
@@ -226,9 +794,9 @@ class OracleDB:
         """
         if not self._transactions is None:
             if itemIndex is None:
-                return str(self._transactions.pop())
+                return str(self._transactions.pop()[0])
             else:
-                return str(self._transactions.pop(itemIndex))
+                return str(self._transactions.pop(itemIndex)[0])
         else:
             return ''
             
@@ -309,7 +877,7 @@ class OracleDB:
             self._errMsg = "The file '{file}' does not exist or is invalid!".format(file=file)
             return False
         
-    def executeCommand(self, connectionString=None, sql=None, sqlFile=None):
+    def executeCommand(self, connectionString=None, sql=None, sqlFile=None, binds=None, useCache=False, cacheTTL=None):
         """
         Runs sql command/statement and stores results in a list array.  Uses connection string and 
         sql if passed in as arguments.
@@ -323,6 +891,15 @@ class OracleDB:
         @param sqlFile (optional): full path to a file containing SQL statements to run via SQLPlus
         @type sqlFile: String
         
+        @param binds (optional): positional (List/Tuple) or named (Dictionary) bind values
+        @type binds: List/Dictionary
+        
+        @param useCache (optional): serve the results from the result cache when cached (see 'enableResultCache')
+        @type useCache: Boolean
+        
+        @param cacheTTL (optional): seconds to keep the results in the result cache, the cache default when omitted
+        @type cacheTTL: Integer
+        
         @return Boolean
         """
         if connectionString is not None:
@@ -334,13 +911,27 @@ class OracleDB:
         if sqlFile is not None:
             self.setSQLFromFile(sqlFile)
             
+        statement = self._getStatement()
+        usecache = useCache and self._resultcache is not None
+        if usecache:
+            results = self._resultcache.get(statement, binds, self._rowformat.name)
+            if results is not None:
+                self._queryresults = results
+                self._outMsg = "Query returned {rowcount} rows from the result cache".format(rowcount=len(results))
+                return True
+            
         try:
-            if self._connection is None:
-                self.open(self._connectionstr)
+            with self._session() as conn:
+                sqlcursor = conn.cursor()
+                try:
+                    self._execute(sqlcursor, statement, binds)
+                    results = list(self._fetchAll(sqlcursor))
+                finally:
+                    sqlcursor.close()
+                    
+            if usecache:
+                self._resultcache.put(statement, binds, results, cacheTTL, self._rowformat.name)
                 
-            sqlcursor = self._connection.cursor()
-            sqlcursor.execute(self._sql)
-            results = sqlcursor.fetchall()
             rowcount = len(results)
             if rowcount > 0:
                 self._outMsg = "Query returned {rowcount} rows".format(rowcount=rowcount)
@@ -349,115 +940,1115 @@ class OracleDB:
                 self._outMsg = "Query return 0 rows."
                 
             return True
-        except cx_Oracle.DatabaseError as e:
-            error, = e.args
-            self._errormsg = "[Oracle-Error-Message: " + str(error.message) + "] with [System Error: " + str(sys.stderr) + "]"
+        except self._driver.DatabaseError as e:
+            self._setDatabaseError(e)
             return False
-        finally:
-            sqlcursor.close()
             
-    def executeBasicTransaction(self, connectionString=None, transaction=None, transFile=None):
+    def executeScript(self, connectionString=None, sql=None, sqlFile=None, stopOnError=True, commit=True):
         """
-        Attempts to perform a basic (simple) transaction.  Uses connection string and sql if passed
-        in as arguments.
+        Runs a multi-statement SQL script one statement at a time on a single reused cursor, instead
+        of sending the whole text as one statement.  The script is split like SQL*Plus does (see
+        'sqltext.splitStatements'): SQL statements end at ';' or a '/' line, PL/SQL blocks at a '/'
+        line, and SQL*Plus commands are skipped.  Each statement is timed; see 'getScriptResults'.
         
         @param connectionString (optional): an oracle database connection string
         @type connectionString: String
         
-        @param transaction (optional): a series of SQL statements to run via SQLPlus
-        @type transaction: String
+        @param sql (optional): the text of a SQL script
+        @type sql: String
         
-        @param transFile (optional): full path to a file containing SQL statements to run via SQLPlus
-        @type transFile: String
+        @param sqlFile (optional): full path to a SQL script file
+        @type sqlFile: String
         
-        @return Boolean
+        @param stopOnError (optional): stop (and rollback uncommitted work) at the first failing statement
+        @type stopOnError: Boolean
+        
+        @param commit (optional): commit once the script has run
+        @type commit: Boolean
+        
+        @return Boolean (False when any statement failed)
         """
         if connectionString is not None:
             self.setConnectionString(connectionString)
             
-        if transaction is not None:
-            self.setSQL(transaction)
+        if sql is not None:
+            self.setSQL(sql)
             
-        if transFile is not None:
-            self.setSQLFromFile(transFile)
+        if sqlFile is not None:
+            self.setSQLFromFile(sqlFile)
             
+        self._scriptresults = []
+        statements = splitStatements(self._getStatement())
+        failed = 0
+        start = time.perf_counter()
         try:
-            if self._connection is None:
-                self.open(self._connectionstr)
-                
-            self.begin()
-            
-            sqlcursor = self._connection.cursor()
-            sqlcursor.execute(self._sql)
-            results = sqlcursor.fetchall()
-            rowcount = len(results)
-            if rowcount > 0:
-                self._outMsg = "Query returned {rowcount} rows".format(rowcount=rowcount)
-                self._queryresults = results;
-            else:
-                self._outMsg = "Query return 0 rows."
-                
-            self.commit()    
-                
-            return True
-        except cx_Oracle.DatabaseError as e:
-            error, = e.args
-            self._errormsg = "[Oracle-Error-Message: " + str(error.message) + "] with [System Error: " + str(sys.stderr) + "]"
-            self.rollback()
+            with self._session() as conn:
+                sqlcursor = conn.cursor()
+                try:
+                    for line, statement in statements:
+                        result = {'line': line, 'sql': statement, 'rows': 0, 'results': None, 'seconds': 0.0, 'error': None}
+                        self._scriptresults.append(result)
+                        statementstart = time.perf_counter()
+                        try:
+                            self._execute(sqlcursor, statement)
+                            if sqlcursor.description is not None:
+                                result['results'] = list(self._fetchAll(sqlcursor))
+                                result['rows'] = len(result['results'])
+                            else:
+                                result['rows'] = sqlcursor.rowcount
+                        except self._driver.DatabaseError as e:
+                            result['error'] = self._formatDatabaseError(e)
+                            failed += 1
+                            if stopOnError:
+                                conn.rollback()
+                                self._errMsg = "Statement {index} (line {line}) of the script failed: {error}".format(index=len(self._scriptresults), line=line, error=result['error'])
+                                return False
+                        finally:
+                            result['seconds'] = time.perf_counter() - statementstart
+                            
+                    if commit:
+                        conn.commit()
+                finally:
+                    sqlcursor.close()
+        except self._driver.DatabaseError as e:
+            self._setDatabaseError(e)
             return False
-        finally:
-            sqlcursor.close()
-            
-    def executeMultiTransaction(self, transactionFirst, transactionSecond, connectionString=None):
-        """
-        Attempts to perform an advanced transaction using 2 sql (transaction) statements. Uses connection string
-        if passed in as argument.
         
-        @param transactionFirst: first transaction to perform in scope
-        @type transactionFirst: String
+        self._outMsg = "Ran {count} statements in {seconds:.3f} seconds with {failed} errors.".format(count=len(statements), seconds=time.perf_counter() - start, failed=failed)
+        if failed > 0:
+            self._errMsg = "{failed} of {count} statements of the script failed.".format(failed=failed, count=len(statements))
+            return False
         
-        @param transactionSecond: second transaction to perform in scope
-        @type transactionSecond: String
+        return True
+    
+    def getScriptResults(self):
+        """
+        Returns the outcome of each statement run by the last 'executeScript': its starting line,
+        text, rows (fetched or affected), query results, elapsed seconds and error.
         
-        @param connectionString (optional): an oracle database connection string
-        @type connectionString: String
+        @return List of Dictionaries
+        """
+        return self._scriptresults
+    
+    def executeQueryStream(self, connectionString=None, sql=None, sqlFile=None, arraySize=1000, prefetchRows=None, batches=False, binds=None):
+        """
+        Runs a query and yields its rows (or batches of rows) as they are fetched from the cursor,
+        instead of storing every row in the query results list.  Only one batch of rows is held in
+        memory at a time, and the session is held until the generator is exhausted or closed.
+        
+        @param connectionString (optional): an oracle database connection string
+        @type connectionString: String
+        
+        @param sql (optional): a SQL query to run
+        @type sql: String
+        
+        @param sqlFile (optional): full path to a file containing a SQL query to run
+        @type sqlFile: String
+        
+        @param arraySize (optional): number of rows fetched from the database per round trip
+        @type arraySize: Integer
+        
+        @param prefetchRows (optional): number of rows returned with the execute round trip
+        @type prefetchRows: Integer
+        
+        @param batches (optional): yield lists of up to arraySize rows instead of single rows
+        @type batches: Boolean
+        
+        @param binds (optional): positional (List/Tuple) or named (Dictionary) bind values
+        @type binds: List/Dictionary
+        
+        @return Generator of rows (Tuples) or batches (Lists of Tuples)
+        
+        @raise cx_Oracle.DatabaseError when the query fails (the message is also put on the error stack).
+        """
+        if connectionString is not None:
+            self.setConnectionString(connectionString)
+            
+        if sql is not None:
+            self.setSQL(sql)
+            
+        if sqlFile is not None:
+            self.setSQLFromFile(sqlFile)
+            
+        rowcount = 0
+        try:
+            with self._session() as conn:
+                sqlcursor = conn.cursor()
+                try:
+                    self._setFetchSize(sqlcursor, arraySize, prefetchRows)
+                    self._execute(sqlcursor, self._getStatement(), binds)
+                    for batch in self._fetchBatches(sqlcursor, arraySize):
+                        rowcount += len(batch)
+                        if batches:
+                            yield batch
+                        else:
+                            yield from batch
+                finally:
+                    sqlcursor.close()
+                    
+            self._outMsg = "Query returned {rowcount} rows".format(rowcount=rowcount)
+        except self._driver.DatabaseError as e:
+            self._setDatabaseError(e)
+            raise
+            
+    def executeColumnar(self, connectionString=None, sql=None, sqlFile=None, binds=None, arraySize=10000, useNumpy=True):
+        """
+        Runs a query and stores its results column-wise instead of as a list of row tuples.  Numeric
+        columns are filled batch by batch into typed arrays (int64 or float64, NULL stored as NaN),
+        returned as NumPy arrays when NumPy is installed and array.array otherwise; other columns are
+        returned as lists.  Use 'getQueryResultsAsColumns' to retrieve the columns.
+        
+        @param connectionString (optional): an oracle database connection string
+        @type connectionString: String
+        
+        @param sql (optional): a SQL query to run
+        @type sql: String
+        
+        @param sqlFile (optional): full path to a file containing a SQL query to run
+        @type sqlFile: String
+        
+        @param binds (optional): positional (List/Tuple) or named (Dictionary) bind values
+        @type binds: List/Dictionary
+        
+        @param arraySize (optional): number of rows fetched from the database per round trip
+        @type arraySize: Integer
+        
+        @param useNumpy (optional): convert typed arrays to NumPy arrays when NumPy is installed
+        @type useNumpy: Boolean
+        
+        @return Boolean
+        """
+        if connectionString is not None:
+            self.setConnectionString(connectionString)
+            
+        if sql is not None:
+            self.setSQL(sql)
+            
+        if sqlFile is not None:
+            self.setSQLFromFile(sqlFile)
+            
+        try:
+            with self._session() as conn:
+                sqlcursor = conn.cursor()
+                try:
+                    self._setFetchSize(sqlcursor, arraySize)
+                    self._execute(sqlcursor, self._getStatement(), binds)
+                    if sqlcursor.description is None:
+                        self._errMsg = "The statement did not return any columns."
+                        return False
+                    
+                    names = [col[0] for col in sqlcursor.description]
+                    columns = [self._createColumn(col) for col in sqlcursor.description]
+                    rowcount = 0
+                    for batch in self._fetchBatches(sqlcursor, arraySize, rowFactory=False):
+                        rowcount += len(batch)
+                        for i, column in enumerate(columns):
+                            columns[i] = self._extendColumn(column, [row[i] for row in batch])
+                finally:
+                    sqlcursor.close()
+        except self._driver.DatabaseError as e:
+            self._setDatabaseError(e)
+            return False
+        
+        if useNumpy and numpy is not None:
+            columns = [numpy.frombuffer(column, dtype=column.typecode) if type(column) == array.array else column for column in columns]
+            
+        self._columnresults = dict(zip(names, columns))
+        self._outMsg = "Query returned {rowcount} rows".format(rowcount=rowcount)
+        
+        return True
+    
+    def getQueryResultsAsColumns(self):
+        """
+        Returns the columns stored by 'executeColumnar'.
+        
+        @return Dictionary of column name to array (or list)
+        """
+        return self._columnresults
+    
+    def exportQuery(self, outputFile, connectionString=None, sql=None, sqlFile=None, binds=None, fileFormat=None, compress=None, arraySize=1000):
+        """
+        Runs a query and streams its rows straight into a CSV or JSON Lines file, one cursor batch at
+        a time, optionally gzip compressed.  The CSV header (and the JSON keys) come from the cursor
+        description.  Use 'getExportStatistics' for the rows and bytes written.
+        
+        @param outputFile: full path to the file to write
+        @type outputFile: String
+        
+        @param connectionString (optional): an oracle database connection string
+        @type connectionString: String
+        
+        @param sql (optional): a SQL query to run
+        @type sql: String
+        
+        @param sqlFile (optional): full path to a file containing a SQL query to run
+        @type sqlFile: String
+        
+        @param binds (optional): positional (List/Tuple) or named (Dictionary) bind values
+        @type binds: List/Dictionary
+        
+        @param fileFormat (optional): format of the file, derived from the file name when omitted
+        @type fileFormat: Enumerator (ExportFormat)
+        
+        @param compress (optional): gzip the file, derived from a '.gz' file name when omitted
+        @type compress: Boolean
+        
+        @param arraySize (optional): number of rows fetched from the database per round trip
+        @type arraySize: Integer
+        
+        @return Boolean
+        """
+        if connectionString is not None:
+            self.setConnectionString(connectionString)
+            
+        if sql is not None:
+            self.setSQL(sql)
+            
+        if sqlFile is not None:
+            self.setSQLFromFile(sqlFile)
+            
+        start = time.perf_counter()
+        rowcount = 0
+        try:
+            with self._session() as conn:
+                sqlcursor = conn.cursor()
+                try:
+                    self._setFetchSize(sqlcursor, arraySize)
+                    self._execute(sqlcursor, self._getStatement(), binds)
+                    names = [col[0] for col in sqlcursor.description] if sqlcursor.description is not None else []
+                    with self._openExportFile(outputFile, compress) as fl:
+                        rowcount = self._writeRows(fl, self._getExportFormat(outputFile, fileFormat), names, self._fetchBatches(sqlcursor, arraySize))
+                finally:
+                    sqlcursor.close()
+        except self._driver.DatabaseError as e:
+            self._setDatabaseError(e)
+            return False
+        except OSError as oerr:
+            self._errMsg = "There was a critical error attempting to write file '{0}'.  OSError={1}".format(outputFile, str(oerr))
+            return False
+        
+        self._setExportStatistics(outputFile, rowcount, start)
+        return True
+    
+    def getExportStatistics(self):
+        """
+        Returns the rows, bytes written (on disk) and elapsed seconds of the last export.
+        
+        @return Dictionary
+        """
+        return self._exportstats
+    
+    def setRowFormat(self, rowFormat):
+        """
+        Set the objects query rows are returned as.  NAMEDTUPLE and SLOTS rows allow column access by
+        name (row.EMPLOYEE_ID) without a dictionary per row; their class is built once per set of
+        column names and set as the cursor's row factory (see 'rowtypes.getRowClass').  Applies to
+        every method that fetches rows.
+        
+        @param rowFormat: the row format
+        @type rowFormat: Enumerator (RowFormat)
+        """
+        self._rowformat = rowFormat if rowFormat is not None else RowFormat.TUPLE
+        
+    def getRowFormat(self):
+        """
+        Returns the objects query rows are returned as.
+        
+        @return Enumerator (RowFormat)
+        """
+        return self._rowformat
+    
+    def setInlineLOBs(self, inline=True):
+        """
+        Set whether CLOB/NCLOB and BLOB columns are fetched inline as strings and bytes.  Inline LOBs
+        arrive with the rows instead of costing a round trip per LOB locator, which suits documents
+        that fit comfortably in memory; leave it off for large LOBs and stream them with 'streamLOB',
+        'exportLOB' and 'importLOB' instead.
+        
+        @param inline (optional): fetch LOB columns inline
+        @type inline: Boolean
+        """
+        self._inlinelobs = bool(inline)
+        
+    def streamLOB(self, lob, chunkSize=None):
+        """
+        Yields the contents of a LOB locator in chunks (strings for a CLOB, bytes for a BLOB) so a
+        large LOB is never held in memory at once.  The locator's connection must still be open.
+        
+        @param lob: a LOB locator fetched from a query
+        @type lob: cx_Oracle.LOB
+        
+        @param chunkSize (optional): characters/bytes read per round trip, a multiple of the LOB chunk size when omitted
+        @type chunkSize: Integer
+        
+        @return Generator of Strings/Bytes
+        """
+        amount = chunkSize if chunkSize else self._getLOBChunkSize(lob)
+        offset = 1
+        while True:
+            data = lob.read(offset, amount)
+            if not data:
+                return
+            offset += len(data)
+            yield data
+            
+    def exportLOB(self, outputFile, connectionString=None, sql=None, sqlFile=None, binds=None, chunkSize=None):
+        """
+        Runs a query and streams the LOB in the first column of its first row into a file, chunk by
+        chunk.  A CLOB is written UTF-8 encoded, a BLOB as is.
+        
+        @param outputFile: full path to the file to write
+        @type outputFile: String
+        
+        @param connectionString (optional): an oracle database connection string
+        @type connectionString: String
+        
+        @param sql (optional): a SQL query selecting the LOB
+        @type sql: String
+        
+        @param sqlFile (optional): full path to a file containing a SQL query selecting the LOB
+        @type sqlFile: String
+        
+        @param binds (optional): positional (List/Tuple) or named (Dictionary) bind values
+        @type binds: List/Dictionary
+        
+        @param chunkSize (optional): characters/bytes read per round trip, a multiple of the LOB chunk size when omitted
+        @type chunkSize: Integer
+        
+        @return Boolean
+        """
+        if connectionString is not None:
+            self.setConnectionString(connectionString)
+            
+        if sql is not None:
+            self.setSQL(sql)
+            
+        if sqlFile is not None:
+            self.setSQLFromFile(sqlFile)
+            
+        start = time.perf_counter()
+        try:
+            with self._session() as conn:
+                sqlcursor = conn.cursor()
+                try:
+                    self._execute(sqlcursor, self._getStatement(), binds)
+                    row = next(self._fetchAll(sqlcursor), None)
+                    if row is None or row[0] is None:
+                        self._errMsg = "The query did not return a LOB to export."
+                        return False
+                    
+                    with open(outputFile, 'wb') as fl:
+                        value = row[0]
+                        chunks = self.streamLOB(value, chunkSize) if hasattr(value, 'read') else [value]
+                        for chunk in chunks:
+                            fl.write(chunk.encode('utf-8') if type(chunk) == str else chunk)
+                finally:
+                    sqlcursor.close()
+        except self._driver.DatabaseError as e:
+            self._setDatabaseError(e)
+            return False
+        except OSError as oerr:
+            self._errMsg = "There was a critical error attempting to write file '{0}'.  OSError={1}".format(outputFile, str(oerr))
+            return False
+        
+        self._setExportStatistics(outputFile, 1, start)
+        return True
+    
+    def importLOB(self, inputFile, sql, binds=None, lobBind='lob', binary=True, connectionString=None, chunkSize=None, commit=True):
+        """
+        Streams a file into a LOB chunk by chunk.  The statement either returns a new empty LOB, e.g.
+        "INSERT INTO docs (id, doc) VALUES (:id, EMPTY_BLOB()) RETURNING doc INTO :lob", or is a query
+        selecting the LOB to overwrite, e.g. "SELECT doc FROM docs WHERE id = :id FOR UPDATE".
+        
+        @param inputFile: full path to the file to read
+        @type inputFile: String
+        
+        @param sql: the statement returning (or query selecting) the LOB
+        @type sql: String
+        
+        @param binds (optional): named bind values of the statement
+        @type binds: Dictionary
+        
+        @param lobBind (optional): name of the RETURNING INTO bind variable
+        @type lobBind: String
+        
+        @param binary (optional): the LOB is a BLOB (True) or a CLOB read from a UTF-8 text file (False)
+        @type binary: Boolean
+        
+        @param connectionString (optional): an oracle database connection string
+        @type connectionString: String
+        
+        @param chunkSize (optional): characters/bytes written per round trip, a multiple of the LOB chunk size when omitted
+        @type chunkSize: Integer
+        
+        @param commit (optional): commit once the whole file is written
+        @type commit: Boolean
+        
+        @return Boolean
+        """
+        if connectionString is not None:
+            self.setConnectionString(connectionString)
+            
+        if not os.path.isfile(inputFile):
+            self._errMsg = "The file '{file}' does not exist or is invalid!".format(file=inputFile)
+            return False
+        
+        start = time.perf_counter()
+        written = 0
+        try:
+            with self._session() as conn:
+                sqlcursor = conn.cursor()
+                try:
+                    binds = dict(binds) if binds is not None else {}
+                    isquery = getStatementType(sql) in ('SELECT', 'WITH')
+                    if not isquery:
+                        binds[lobBind] = sqlcursor.var(self._driver.BLOB if binary else self._driver.CLOB)
+                    self._execute(sqlcursor, sql, binds)
+                    if isquery:
+                        row = next(self._fetchAll(sqlcursor), None)
+                        lob = row[0] if row is not None else None
+                        if lob is not None:
+                            lob.trim(0)
+                    else:
+                        lob = binds[lobBind].getvalue()
+                        lob = lob[0] if type(lob) == list else lob
+                    
+                    if lob is None:
+                        self._errMsg = "The statement did not return a LOB to write to."
+                        conn.rollback()
+                        return False
+                    
+                    amount = chunkSize if chunkSize else self._getLOBChunkSize(lob)
+                    with open(inputFile, 'rb') if binary else open(inputFile, 'r', encoding='utf-8', newline='') as fl:
+                        lob.open()
+                        try:
+                            offset = 1
+                            for data in iter(lambda: fl.read(amount), b'' if binary else ''):
+                                lob.write(data, offset)
+                                offset += len(data)
+                            written = offset - 1
+                        finally:
+                            lob.close()
+                finally:
+                    sqlcursor.close()
+                    
+                if commit:
+                    conn.commit()
+        except self._driver.DatabaseError as e:
+            self._setDatabaseError(e)
+            return False
+        except OSError as oerr:
+            self._errMsg = "There was a critical error attempting to read file '{0}'.  OSError={1}".format(inputFile, str(oerr))
+            return False
+        
+        self._outMsg = "Wrote {count} {unit} from '{file}' in {seconds:.3f} seconds.".format(count=written, unit='bytes' if binary else 'characters',
+                                                                                              file=inputFile, seconds=time.perf_counter() - start)
+        return True
+    
+    def executeConcurrent(self, jobs, maxWorkers=4, timeout=None):
+        """
+        Runs many independent queries concurrently, each on its own pooled session, and yields each
+        result as soon as its query completes.  When no session pool is open, one sized to maxWorkers
+        is opened for the duration of the call and closed afterwards.
+        
+        @param jobs: a list of SQL strings or (sql, binds) tuples
+        @type jobs: List/Sequence
+        
+        @param maxWorkers (optional): maximum number of queries running at once
+        @type maxWorkers: Integer
+        
+        @param timeout (optional): seconds each query may run before it is cancelled by the database
+        @type timeout: Float
+        
+        @return Generator of Tuples containing the job index, the rows (None if it failed) and an error message
+        """
+        maxWorkers = maxWorkers if maxWorkers > 0 else 1
+        ownpool = self._openCallPool(maxWorkers)
+        try:
+            with ThreadPoolExecutor(max_workers=maxWorkers) as executor:
+                futures = {}
+                for index, job in enumerate(jobs):
+                    sql, binds = (job, None) if type(job) == str else job
+                    futures[executor.submit(self._runConcurrentJob, sql, binds, timeout)] = index
+                    
+                completed = 0
+                try:
+                    for future in as_completed(futures):
+                        rows, error = future.result()
+                        completed += 1
+                        yield futures[future], rows, error
+                finally:
+                    for future in futures:
+                        future.cancel()
+        finally:
+            if ownpool:
+                self.closePool()
+                
+        self._outMsg = "Ran {completed} of {count} concurrent queries.".format(completed=completed, count=len(futures))
+        
+    def extractTable(self, tableName, ranges=4, keyColumn=None, columns='*', where=None, binds=None, maxWorkers=None, retries=2,
+                     arraySize=1000, progress=None, batches=False):
+        """
+        Splits a table into ranges and fetches them concurrently, each on its own pooled session,
+        yielding the rows of every range merged into one stream as they arrive (rows of different
+        ranges interleave).  Ranges are ROWID ranges of roughly equal row counts, or equal width
+        ranges of a numeric key column when keyColumn is given, plus a final range for the rows whose
+        key is NULL.  Each range reads its own snapshot.  A range that fails before any of its rows
+        were yielded is retried; one that fails later cannot be retried without repeating rows, so
+        the error is raised.  When no session pool is open, one sized to maxWorkers is opened for
+        the duration of the call and closed afterwards.  See 'getExtractionProgress' for the rows,
+        attempts and status of each range.
+        
+        @param tableName: name of the table, optionally schema qualified
+        @type tableName: String
+        
+        @param ranges (optional): number of ranges to split the table into
+        @type ranges: Integer
+        
+        @param keyColumn (optional): numeric column to split on, the ROWID when omitted
+        @type keyColumn: String
+        
+        @param columns (optional): the select list
+        @type columns: String
+        
+        @param where (optional): a condition rows must meet
+        @type where: String
+        
+        @param binds (optional): named bind values used by the condition
+        @type binds: Dictionary
+        
+        @param maxWorkers (optional): maximum number of ranges fetched at once, one per range when omitted
+        @type maxWorkers: Integer
+        
+        @param retries (optional): number of times a failed range is retried
+        @type retries: Integer
+        
+        @param arraySize (optional): number of rows fetched from the database per round trip
+        @type arraySize: Integer
+        
+        @param progress (optional): called with the range index and its row count after every batch (from worker threads)
+        @type progress: Function
+        
+        @param batches (optional): yield lists of up to arraySize rows instead of single rows
+        @type batches: Boolean
+        
+        @return Generator of rows (Tuples) or batches (Lists of Tuples)
+        
+        @raise cx_Oracle.DatabaseError when the ranges cannot be computed or a range fails, ValueError
+               when the table or key column is not a valid name.
+        """
+        try:
+            jobs, maxWorkers = self._prepareExtraction(tableName, ranges, keyColumn, columns, where, binds, maxWorkers)
+            ownpool = self._openCallPool(maxWorkers)
+        except self._driver.DatabaseError as e:
+            self._setDatabaseError(e)
+            raise
+        except ValueError as verr:
+            self._errMsg = str(verr)
+            raise
+        
+        try:
+            yield from self._mergeExtraction(tableName, jobs, maxWorkers, retries, arraySize, progress, batches)
+        finally:
+            if ownpool:
+                self.closePool()
+                
+    def _mergeExtraction(self, tableName, jobs, maxWorkers, retries, arraySize, progress, batches):
+        """
+        Fetches the ranges of 'extractTable' on worker threads and yields their rows or batches
+        through one bounded queue.
+        """
+        output = queue.Queue(maxsize=maxWorkers * 2)
+        stop = threading.Event()
+        
+        @contextmanager
+        def deliver(index, names):
+            yield lambda batch: self._putExtracted(output, batch, stop)
+            
+        def run(index, sql, rangebinds):
+            try:
+                self._extractRange(index, sql, rangebinds, arraySize, retries, deliver, False, progress, stop)
+            finally:
+                self._putExtracted(output, (_RANGE_DONE, index), stop)
+                
+        rowcount = 0
+        with ThreadPoolExecutor(max_workers=maxWorkers) as executor:
+            for index, (sql, rangebinds) in enumerate(jobs):
+                executor.submit(run, index, sql, rangebinds)
+                
+            try:
+                pending = len(jobs)
+                while pending > 0:
+                    item = output.get()
+                    if type(item) == tuple and item[0] is _RANGE_DONE:
+                        pending -= 1
+                        status = self._extractprogress[item[1]]
+                        if status['status'] != 'done':
+                            self._errMsg = "Range {index} of table '{table}' failed: {error}".format(index=item[1], table=tableName, error=status['error'])
+                            raise self._driver.DatabaseError(self._errMsg)
+                        continue
+                    
+                    rowcount += len(item)
+                    if batches:
+                        yield item
+                    else:
+                        yield from item
+            finally:
+                stop.set()
+                
+        self._outMsg = "Extracted {rows} rows from '{table}' in {count} ranges.".format(rows=rowcount, table=tableName, count=len(jobs))
+        
+    def extractTableToFile(self, outputFile, tableName, ranges=4, keyColumn=None, columns='*', where=None, binds=None, separateFiles=False,
+                           fileFormat=None, compress=None, maxWorkers=None, retries=2, arraySize=1000, progress=None):
+        """
+        Splits a table into ranges (see 'extractTable', including its session pool handling) and
+        exports them concurrently to CSV or JSON Lines files, one file per range named like
+        'table.part001.csv'.  Unless separateFiles is set, the parts are then joined in range order
+        into outputFile (with a single CSV header) and removed.  A failed range is retried from
+        scratch, up to retries times.  Use 'getExtractionProgress' for per range progress and
+        'getExportStatistics' for the totals.
+        
+        @param outputFile: full path to the file to write (the name the part files are derived from)
+        @type outputFile: String
+        
+        @param tableName: name of the table, optionally schema qualified
+        @type tableName: String
+        
+        @param ranges (optional): number of ranges to split the table into
+        @type ranges: Integer
+        
+        @param keyColumn (optional): numeric column to split on, the ROWID when omitted
+        @type keyColumn: String
+        
+        @param columns (optional): the select list
+        @type columns: String
+        
+        @param where (optional): a condition rows must meet
+        @type where: String
+        
+        @param binds (optional): named bind values used by the condition
+        @type binds: Dictionary
+        
+        @param separateFiles (optional): keep one file per range instead of joining them
+        @type separateFiles: Boolean
+        
+        @param fileFormat (optional): format of the file(s), derived from the file name when omitted
+        @type fileFormat: Enumerator (ExportFormat)
+        
+        @param compress (optional): gzip the file(s), derived from a '.gz' file name when omitted
+        @type compress: Boolean
+        
+        @param maxWorkers (optional): maximum number of ranges fetched at once, one per range when omitted
+        @type maxWorkers: Integer
+        
+        @param retries (optional): number of times a failed range is retried
+        @type retries: Integer
+        
+        @param arraySize (optional): number of rows fetched from the database per round trip
+        @type arraySize: Integer
+        
+        @param progress (optional): called with the range index and its row count after every batch (from worker threads)
+        @type progress: Function
+        
+        @return Boolean
+        """
+        start = time.perf_counter()
+        try:
+            jobs, maxWorkers = self._prepareExtraction(tableName, ranges, keyColumn, columns, where, binds, maxWorkers)
+            ownpool = self._openCallPool(maxWorkers)
+        except self._driver.DatabaseError as e:
+            self._setDatabaseError(e)
+            return False
+        except ValueError as verr:
+            self._errMsg = str(verr)
+            return False
+        
+        fileFormat = self._getExportFormat(outputFile, fileFormat)
+        compress = outputFile.lower().endswith('.gz') if compress is None else compress
+        partfiles = [self._getPartFileName(outputFile, index) for index in range(len(jobs))]
+        
+        @contextmanager
+        def deliver(index, names):
+            with self._openExportFile(partfiles[index], compress) as fl:
+                self._writeRows(fl, fileFormat, names, [], writeHeader=separateFiles or index == 0)
+                yield lambda batch: self._writeRows(fl, fileFormat, names, [batch], writeHeader=False)
+                
+        try:
+            with ThreadPoolExecutor(max_workers=maxWorkers) as executor:
+                futures = [executor.submit(self._extractRange, index, sql, rangebinds, arraySize, retries, deliver, True, progress, None)
+                           for index, (sql, rangebinds) in enumerate(jobs)]
+                for future in futures:
+                    future.result()
+        finally:
+            if ownpool:
+                self.closePool()
+                
+        
+        failed = [status for status in self._extractprogress if status['status'] != 'done']
+        try:
+            if failed:
+                self._errMsg = "{count} of {total} ranges of table '{table}' failed.  First error={error}".format(count=len(failed), total=len(jobs),
+                                                                                                                  table=tableName, error=failed[0]['error'])
+                if not separateFiles:
+                    self._removeFiles(partfiles)
+                return False
+            
+            if not separateFiles:
+                with open(outputFile, 'wb') as outfl:
+                    for partfile in partfiles:
+                        with open(partfile, 'rb') as partfl:
+                            shutil.copyfileobj(partfl, outfl)
+                self._removeFiles(partfiles)
+        except OSError as oerr:
+            self._errMsg = "There was a critical error attempting to write file '{0}'.  OSError={1}".format(outputFile, str(oerr))
+            return False
+        
+        rowcount = sum(status['rows'] for status in self._extractprogress)
+        if separateFiles:
+            size = sum(os.path.getsize(partfile) for partfile in partfiles if os.path.isfile(partfile))
+            self._exportstats = {'rows': rowcount, 'bytes': size, 'seconds': time.perf_counter() - start, 'files': partfiles}
+            self._outMsg = "Exported {rows} rows ({bytes} bytes) to {count} files.".format(rows=rowcount, bytes=size, count=len(partfiles))
+        else:
+            self._setExportStatistics(outputFile, rowcount, start)
+            
+        return True
+    
+    def extractIncremental(self, outputFile, tableName, watermarkColumn, stateFile, columns='*', where=None, binds=None, initialWatermark=None,
+                           fileFormat=None, compress=None, arraySize=1000, connectionString=None):
+        """
+        Exports only the rows of a table whose monotonic column (a timestamp, SCN or increasing id)
+        is past the watermark stored by the last successful run, in column order, streaming them
+        into a CSV or JSON Lines file like 'exportQuery'.  The highest value exported becomes the new
+        watermark, which is written to the state file (atomically, by replacing it) only after every
+        row has been written.  A run that fails leaves the watermark alone, so the next run repeats
+        it.  Rows committed late with a value below the watermark are not picked up, and rows whose
+        watermark column is NULL are never exported, since they cannot be placed after a watermark.
+        
+        @param outputFile: full path to the file to write
+        @type outputFile: String
+        
+        @param tableName: name of the table, optionally schema qualified
+        @type tableName: String
+        
+        @param watermarkColumn: the monotonic column, which must be part of the select list
+        @type watermarkColumn: String
+        
+        @param stateFile: full path to the JSON file holding the watermarks (see WatermarkState)
+        @type stateFile: String
+        
+        @param columns (optional): the select list
+        @type columns: String
+        
+        @param where (optional): a condition rows must meet
+        @type where: String
+        
+        @param binds (optional): named bind values used by the condition
+        @type binds: Dictionary
+        
+        @param initialWatermark (optional): watermark of the first run, every row is exported when omitted
+        @type initialWatermark: Object
+        
+        @param fileFormat (optional): format of the file, derived from the file name when omitted
+        @type fileFormat: Enumerator (ExportFormat)
+        
+        @param compress (optional): gzip the file, derived from a '.gz' file name when omitted
+        @type compress: Boolean
+        
+        @param arraySize (optional): number of rows fetched from the database per round trip
+        @type arraySize: Integer
+        
+        @param connectionString (optional): an oracle database connection string
+        @type connectionString: String
+        
+        @return Boolean
+        """
+        if connectionString is not None:
+            self.setConnectionString(connectionString)
+            
+        for identifier in (tableName, watermarkColumn):
+            if not _IDENTIFIER.match(identifier):
+                self._errMsg = "'{0}' is not a valid table or column name.".format(identifier)
+                return False
+            
+        state = WatermarkState(stateFile)
+        name = "{0}.{1}".format(tableName, watermarkColumn).upper()
+        watermark = state.getWatermark(name)
+        watermark = watermark if watermark is not None else initialWatermark
+        
+        conditions = ["({0})".format(where)] if where else []
+        conditions.append("{0} IS NOT NULL".format(watermarkColumn))
+        querybinds = dict(binds) if binds is not None else {}
+        if watermark is not None:
+            conditions.append("{0} > :watermark".format(watermarkColumn))
+            querybinds['watermark'] = watermark
+        sql = "SELECT {columns} FROM {table} WHERE {where} ORDER BY {column}".format(columns=columns, table=tableName, column=watermarkColumn,
+                                                                                    where=" AND ".join(conditions))
+        
+        start = time.perf_counter()
+        rowcount = 0
+        highest = watermark
+        try:
+            with self._session() as conn:
+                sqlcursor = conn.cursor()
+                try:
+                    self._setFetchSize(sqlcursor, arraySize)
+                    self._execute(sqlcursor, sql, querybinds or None)
+                    names = [col[0] for col in sqlcursor.description]
+                    upper = [col.upper() for col in names]
+                    column = watermarkColumn.split('.')[-1].upper()
+                    if column not in upper:
+                        self._errMsg = "The watermark column '{0}' must be part of the select list.".format(watermarkColumn)
+                        return False
+                    
+                    position = upper.index(column)
+                    with self._openExportFile(outputFile, compress) as fl:
+                        fileFormat = self._getExportFormat(outputFile, fileFormat)
+                        self._writeRows(fl, fileFormat, names, [], writeHeader=True)
+                        for batch in self._fetchBatches(sqlcursor, arraySize):
+                            rowcount += self._writeRows(fl, fileFormat, names, [batch], writeHeader=False)
+                            # rows arrive in watermark order without NULLs, so the last row holds the highest value
+                            highest = batch[-1][position]
+                finally:
+                    sqlcursor.close()
+        except self._driver.DatabaseError as e:
+            self._setDatabaseError(e)
+            return False
+        except OSError as oerr:
+            self._errMsg = "There was a critical error attempting to write file '{0}'.  OSError={1}".format(outputFile, str(oerr))
+            return False
+        
+        if rowcount > 0 and highest is not None and not state.setWatermark(name, highest, rowcount):
+            self._errMsg = state.getErrorMsg()
+            return False
+        
+        self._setExportStatistics(outputFile, rowcount, start)
+        self._exportstats['watermark'] = highest
+        return True
+    
+    def getExtractionProgress(self):
+        """
+        Returns the progress of each range of the last (or running) extraction: its bounds, rows
+        fetched, attempts, status ('pending', 'running', 'done', 'failed' or 'cancelled'), elapsed
+        seconds and last error.
+        
+        @return List of Dictionaries
+        """
+        return [dict(status) for status in self._extractprogress]
+    
+    def executeMany(self, sql, rows, batchSize=10000, commit=True, connectionString=None):
+        """
+        Runs one DML statement for many sets of bind values using array DML (executemany).  Rows are
+        read from the iterable and sent in chunks of batchSize, so the input is never held in memory
+        in full.  Rows that fail are collected instead of stopping the load; use 'getBatchErrors'
+        and 'getBulkStatistics' to inspect the outcome.
+        
+        @param sql: a DML statement using bind variables, e.g. 'insert into t (a, b) values (:1, :2)'
+        @type sql: String
+        
+        @param rows: an iterable of bind tuples (or dictionaries for named binds)
+        @type rows: Iterable
+        
+        @param batchSize (optional): number of rows sent per round trip
+        @type batchSize: Integer
+        
+        @param commit (optional): commit once every chunk has been sent
+        @type commit: Boolean
+        
+        @param connectionString (optional): an oracle database connection string
+        @type connectionString: String
+        
+        @return Boolean (False when the load fails as a whole; rows that failed individually are in 'getBatchErrors')
+        """
+        if connectionString is not None:
+            self.setConnectionString(connectionString)
+            
+        batchSize = batchSize if batchSize > 0 else 10000
+        self._batcherrors = []
+        rowcount = 0
+        start = time.perf_counter()
+        # batch errors are only available for DML, not for PL/SQL blocks
+        batcherrors = getStatementType(sql) in ('INSERT', 'UPDATE', 'DELETE', 'MERGE')
+        
+        try:
+            with self._session() as conn:
+                sqlcursor = conn.cursor()
+                try:
+                    iterator = iter(rows)
+                    while True:
+                        chunk = list(islice(iterator, batchSize))
+                        if not chunk:
+                            break
+                        
+                        if batcherrors:
+                            self._executemany(sqlcursor, sql, chunk, batcherrors=True)
+                            for error in sqlcursor.getbatcherrors():
+                                self._batcherrors.append((rowcount + error.offset, error.message))
+                        else:
+                            self._executemany(sqlcursor, sql, chunk)
+                        rowcount += len(chunk)
+                        
+                    if commit:
+                        conn.commit()
+                except self._driver.DatabaseError:
+                    conn.rollback()
+                    raise
+                finally:
+                    sqlcursor.close()
+        except self._driver.DatabaseError as e:
+            self._setDatabaseError(e)
+            self._setBulkStatistics(rowcount, start)
+            return False
+        
+        self._setBulkStatistics(rowcount, start)
+        self._outMsg = "Bulk DML sent {rows} rows with {errors} row errors ({rate:,.0f} rows/sec).".format(rows=rowcount, errors=len(self._batcherrors), rate=self._bulkstats['rowsPerSecond'])
+        
+        return True
+    
+    def getBatchErrors(self):
+        """
+        Returns the rows that failed in the last 'executeMany' call.
+        
+        @return List of Tuples containing the zero based row offset and the error message
+        """
+        return self._batcherrors
+    
+    def getBulkStatistics(self):
+        """
+        Returns the row count, error count, elapsed seconds and rows per second of the last 'executeMany' call.
+        
+        @return Dictionary
+        """
+        return self._bulkstats
+    
+    def executeBasicTransaction(self, connectionString=None, transaction=None, transFile=None, binds=None):
+        """
+        Attempts to perform a basic (simple) transaction.  Uses connection string and sql if passed
+        in as arguments.
+        
+        @param connectionString (optional): an oracle database connection string
+        @type connectionString: String
+        
+        @param transaction (optional): a series of SQL statements to run via SQLPlus
+        @type transaction: String
+        
+        @param transFile (optional): full path to a file containing SQL statements to run via SQLPlus
+        @type transFile: String
+        
+        @param binds (optional): positional (List/Tuple) or named (Dictionary) bind values
+        @type binds: List/Dictionary
         
         @return Boolean
         """
         if connectionString is not None:
             self.setConnectionString(connectionString)
             
-        try:
-            if self._connection is None:
-                self.open(self._connectionstr)
-                
-            self.begin()
+        if transaction is not None:
+            self.setSQL(transaction)
             
-            trans1 = self._connection.cursor()
-            trans1.execute(transactionFirst)
+        if transFile is not None:
+            self.setSQLFromFile(transFile)
             
-            trans2 = self._connection.cursor()
-            trans2.execute(transactionSecond)
+        try:
+            with self._session() as conn:
+                try:
+                    conn.begin()
+                    sqlcursor = conn.cursor()
+                    try:
+                        self._execute(sqlcursor, self._getStatement(), binds)
+                        results = list(self._fetchAll(sqlcursor))
+                    finally:
+                        sqlcursor.close()
+                        
+                    rowcount = len(results)
+                    if rowcount > 0:
+                        self._outMsg = "Query returned {rowcount} rows".format(rowcount=rowcount)
+                        self._queryresults = results;
+                    else:
+                        self._outMsg = "Query return 0 rows."
+                        
+                    conn.commit()
+                except self._driver.DatabaseError:
+                    conn.rollback()
+                    raise
+                
+            return True
+        except self._driver.DatabaseError as e:
+            self._setDatabaseError(e)
+            return False
             
-            self.commit()
+    def executeMultiTransaction(self, transactionFirst, transactionSecond, connectionString=None, bindsFirst=None, bindsSecond=None):
+        """
+        Attempts to perform an advanced transaction using 2 sql (transaction) statements. Uses connection string
+        if passed in as argument.
+        
+        @param transactionFirst: first transaction to perform in scope
+        @type transactionFirst: String
+        
+        @param transactionSecond: second transaction to perform in scope
+        @type transactionSecond: String
+        
+        @param connectionString (optional): an oracle database connection string
+        @type connectionString: String
+        
+        @param bindsFirst (optional): bind values for the first transaction
+        @type bindsFirst: List/Dictionary
+        
+        @param bindsSecond (optional): bind values for the second transaction
+        @type bindsSecond: List/Dictionary
+        
+        @return Boolean
+        """
+        if connectionString is not None:
+            self.setConnectionString(connectionString)
             
-        except cx_Oracle.DatabaseError as e:
-            error, = e.args
-            self._errormsg = "[Oracle-Error-Message: " + str(error.message) + "] with [System Error: " + str(sys.stderr) + "]"
-            self.rollback()
+        try:
+            with self._session() as conn:
+                try:
+                    conn.begin()
+                    
+                    trans1 = conn.cursor()
+                    try:
+                        self._execute(trans1, transactionFirst, bindsFirst)
+                    finally:
+                        trans1.close()
+                    
+                    trans2 = conn.cursor()
+                    try:
+                        self._execute(trans2, transactionSecond, bindsSecond)
+                    finally:
+                        trans2.close()
+                    
+                    conn.commit()
+                except self._driver.DatabaseError:
+                    conn.rollback()
+                    raise
+                
+            return True
+        except self._driver.DatabaseError as e:
+            self._setDatabaseError(e)
             return False
-        finally:
-            trans1.close()
-            trans2.close()
             
-    def executeAdvancedTransaction(self, connectionString=None):
+    def executeAdvancedTransaction(self, connectionString=None, batchStatements=False, batchSize=10000, commitToLastSavepoint=False):
         """
         Attempts to perform an advanced transaction using many sql transaction statements.  Uses connection string
-        if passed in as an argument.
+        if passed in as an argument.  All statements run on one cursor.  With batchStatements, consecutive
+        statements queued with bind values and the same SQL text are sent together with executemany, so round
+        trips scale with the number of distinct statements rather than the queue length.  Statements without
+        bind values always run one at a time, exactly as written.
         
         @param connectionString (optional): an oracle database connection string
         @type connectionString: String
         
+        @param batchStatements (optional): group consecutive statements with the same SQL and bind style into array DML
+        @type batchStatements: Boolean
+        
+        @param batchSize (optional): maximum number of statements sent in one round trip
+        @type batchSize: Integer
+        
+        @param commitToLastSavepoint (optional): on failure, keep (commit) the work done before the last savepoint
+                                                 reached (see 'addSavepointToQueue') instead of rolling back everything
+        @type commitToLastSavepoint: Boolean
+        
         @return Boolean
         """
         if connectionString is not None:
@@ -467,21 +2058,734 @@ class OracleDB:
             self._errMsg = "Advanced transaction must have at least 1 transaction."
             return False
         
+        statements = 0
+        roundtrips = 0
+        lastsavepoint = None
+        try:
+            with self._session() as conn:
+                tc = conn.cursor()
+                try:
+                    conn.begin()
+                    for tran, bindsets in self._groupTransactions(batchStatements, batchSize):
+                        if bindsets is _SAVEPOINT:
+                            self._execute(tc, tran)
+                            lastsavepoint = tran.split()[-1]
+                        elif len(bindsets) == 1:
+                            self._execute(tc, tran, bindsets[0])
+                        else:
+                            self._executemany(tc, tran, bindsets)
+                        statements += 1 if bindsets is _SAVEPOINT else len(bindsets)
+                        roundtrips += 1
+                    
+                    conn.commit()
+                except self._driver.DatabaseError:
+                    if commitToLastSavepoint and lastsavepoint is not None:
+                        tc.execute("ROLLBACK TO SAVEPOINT " + lastsavepoint)
+                        conn.commit()
+                    else:
+                        conn.rollback()
+                    raise
+                finally:
+                    tc.close()
+                    
+            self._outMsg = "Advanced transaction ran {statements} statements in {roundtrips} round trips.".format(statements=statements, roundtrips=roundtrips)
+            return True
+        except self._driver.DatabaseError as e:
+            self._setDatabaseError(e)
+            if commitToLastSavepoint and lastsavepoint is not None:
+                self._outMsg = "Work up to savepoint '{savepoint}' was committed.".format(savepoint=lastsavepoint)
+            return False
+        
+    def addSavepointToQueue(self, savepointName):
+        """
+        Adds a savepoint to the transaction queue.  When 'executeAdvancedTransaction' fails with
+        commitToLastSavepoint, the work queued before the last savepoint reached is kept.
+        
+        @param savepointName: name of the savepoint (a valid Oracle identifier)
+        @type savepointName: String
+        
+        @return Boolean
+        """
+        if savepointName is None or not re.match(r'^[A-Za-z][A-Za-z0-9_$#]{0,29}$', savepointName):
+            self._errMsg = "The savepoint name '{savepointName}' is not a valid identifier!".format(savepointName=savepointName)
+            return False
+        
+        if not self._transactions is None:
+            self._transactions.append(("SAVEPOINT " + savepointName, _SAVEPOINT))
+        return True
+    
+    def savepoint(self, savepointName):
+        """
+        Attempts to set a savepoint in the transaction on the current connection.
+        
+        @param savepointName: name of the savepoint (a valid Oracle identifier)
+        @type savepointName: String
+        """
+        if not self._connection is None and re.match(r'^[A-Za-z][A-Za-z0-9_$#]{0,29}$', savepointName):
+            cursor = self._connection.cursor()
+            try:
+                cursor.execute("SAVEPOINT " + savepointName)
+            finally:
+                cursor.close()
+                
+    def rollbackToSavepoint(self, savepointName):
+        """
+        Attempts to rollback the transaction on the current connection to a savepoint.
+        
+        @param savepointName: name of the savepoint (a valid Oracle identifier)
+        @type savepointName: String
+        """
+        if not self._connection is None and re.match(r'^[A-Za-z][A-Za-z0-9_$#]{0,29}$', savepointName):
+            cursor = self._connection.cursor()
+            try:
+                cursor.execute("ROLLBACK TO SAVEPOINT " + savepointName)
+            finally:
+                cursor.close()
+        
+    def _groupTransactions(self, batchStatements, batchSize):
+        """
+        Walks the transaction queue and yields (sql, list of bind values) groups of consecutive statements
+        sharing their SQL text and bind style, at most batchSize statements each.  Statements without bind
+        values are never grouped.  Savepoints are yielded as (sql, _SAVEPOINT).
+        """
+        batchSize = batchSize if batchSize > 0 else 10000
+        shape = None
+        bindsets = []
+        for tran, binds in self._transactions:
+            if binds is _SAVEPOINT:
+                if bindsets:
+                    yield shape[0], bindsets
+                    shape, bindsets = None, []
+                yield tran, _SAVEPOINT
+                continue
+            
+            thisshape = (tran, type(binds))
+            if bindsets and (not batchStatements or binds is None or thisshape != shape or len(bindsets) >= batchSize):
+                yield shape[0], bindsets
+                bindsets = []
+                
+            shape = thisshape
+            bindsets.append(binds)
+            
+        if bindsets:
+            yield shape[0], bindsets
+            
+    @contextmanager
+    def _session(self):
+        """
+        Borrows a pooled session for the duration of a statement when a pool is open, otherwise
+        yields the dedicated connection (opening it if needed).
+        """
+        start = time.perf_counter() if self._instrumentation is not None else None
+        if self._pool is not None:
+            connection = self.acquireSession()
+            if start is not None:
+                self._local.connecttime = time.perf_counter() - start
+            failed = False
+            try:
+                yield connection
+            except BaseException:
+                failed = True
+                raise
+            finally:
+                self.releaseSession(connection, rollback=failed)
+        else:
+            if self._connection is None:
+                self._connection = self._connect()
+            if start is not None:
+                self._local.connecttime = time.perf_counter() - start
+            yield self._connection
+            
+    def _connect(self):
+        """
+        Opens a dedicated connection using the connection string.
+        
+        @return Connection
+        """
+        connection = self._driver.connect(self._connectionstr)
+        if self._stmtcachesize is not None:
+            connection.stmtcachesize = self._stmtcachesize
+        self._outMsg = "Oracle database connection opened."
+        
+        return connection
+    
+    def _execute(self, cursor, sql, binds=None):
+        """
+        Executes a statement on a cursor with optional positional (List/Tuple) or named (Dictionary)
+        bind values, and counts executions and distinct statement texts.  When instrumentation is on,
+        the statement is measured; the record of a query stays open until its rows are fetched.
+        """
+        self._countStatement(sql)
+        if self._inlinelobs:
+            cursor.outputtypehandler = self._lobhandler
+        if self._instrumentation is None:
+            if binds is None:
+                return cursor.execute(sql)
+            else:
+                return cursor.execute(sql, binds)
+        
+        record = self._startRecord(cursor, sql)
+        try:
+            if self._instrumentation.measuresParse():
+                cursor.parse(sql)
+                record.mark('parse')
+            result = cursor.execute(sql) if binds is None else cursor.execute(sql, binds)
+            record.mark('execute')
+        except self._driver.DatabaseError as e:
+            record.mark('execute')
+            record.error = self._formatDatabaseError(e)
+            self._finishRecord(cursor, record)
+            raise
+        
+        if cursor.description is None:
+            record.rows = cursor.rowcount
+            self._finishRecord(cursor, record)
+        else:
+            self._local.record = record
+            
+        return result
+    
+    def _countStatement(self, sql):
+        """
+        Counts an execution and remembers the hash of its statement text, up to a limit.  Worker
+        threads of concurrent and parallel calls count through here too, hence the lock.
+        """
+        with self._statslock:
+            self._executecount += 1
+            if len(self._statementtexts) < _MAX_TRACKED_STATEMENTS:
+                self._statementtexts.add(hash(sql))
+    
+    def _executemany(self, cursor, sql, rows, **kwargs):
+        """
+        Executes a statement for many sets of bind values, counting and measuring it like '_execute'.
+        """
+        self._countStatement(sql)
+        if self._instrumentation is None:
+            return cursor.executemany(sql, rows, **kwargs)
+        
+        record = self._startRecord(cursor, sql)
         try:
-            self.begin()
-            trancursors = []
-            for tran in self.getAllTransactionsInQueue():
-                tc = self._connection.cursor()
-                tc.execute(tran)
-                trancursors.append(tc)
+            result = cursor.executemany(sql, rows, **kwargs)
+            record.rows = len(rows)
+        except self._driver.DatabaseError as e:
+            record.error = self._formatDatabaseError(e)
+            raise
+        finally:
+            record.mark('execute')
+            self._finishRecord(cursor, record)
             
-            self.commit()
+        return result
+    
+    def _callproc(self, cursor, name, params, keywordParams):
+        """
+        Calls a stored procedure, counting and measuring it like '_execute'.
+        """
+        self._countStatement(name)
+        record = self._startRecord(cursor, name) if self._instrumentation is not None else None
+        try:
+            if len(params) > 0 or keywordParams:
+                return cursor.callproc(name, params, keywordParams or {})
+            else:
+                return cursor.callproc(name)
+        except self._driver.DatabaseError as e:
+            if record is not None:
+                record.error = self._formatDatabaseError(e)
+            raise
+        finally:
+            if record is not None:
+                record.mark('execute')
+                self._finishRecord(cursor, record)
                 
-        except cx_Oracle.DatabaseError as e:
-            error, = e.args
-            self._errormsg = "[Oracle-Error-Message: " + str(error.message) + "] with [System Error: " + str(sys.stderr) + "]"
-            self.rollback()
-            return False
+    def _callprocWithOutputs(self, cursor, name, params, keywordParams):
+        """
+        Calls a stored procedure, binding a variable for each OutParameter.
+        
+        @return List of (key, value) Tuples for the OUT parameters, keyed by position (1 based) or name
+        """
+        outputs = []
+        params = list(params)
+        for index, param in enumerate(params):
+            if isinstance(param, OutParameter):
+                params[index] = self._createOutVariable(cursor, param)
+                outputs.append((index + 1, params[index]))
+                
+        keywordParams = dict(keywordParams) if keywordParams else None
+        for keyword, param in (keywordParams or {}).items():
+            if isinstance(param, OutParameter):
+                keywordParams[keyword] = self._createOutVariable(cursor, param)
+                outputs.append((keyword, keywordParams[keyword]))
+                
+        self._callproc(cursor, name, params, keywordParams)
+        return [(key, variable.getvalue()) for key, variable in outputs]
+    
+    def _createOutVariable(self, cursor, param):
+        """
+        Creates the bind variable of an OUT parameter, set to its value for an IN OUT parameter.
+        """
+        dbtype = param.dbType if param.dbType is not None else self._driver.STRING
+        variable = cursor.var(dbtype, param.size) if param.size else cursor.var(dbtype)
+        if param.value is not None:
+            variable.setvalue(0, param.value)
+        return variable
+    
+    def _isCursor(self, value):
+        """
+        Returns whether an OUT parameter value is a REF CURSOR.
+        """
+        return hasattr(value, 'fetchmany') and hasattr(value, 'description')
+    
+    def _fetchRefCursor(self, refCursor, arraySize):
+        """
+        Fetches every row of a REF CURSOR in batches of arraySize and closes it.
+        
+        @return List
+        """
+        try:
+            self._setFetchSize(refCursor, arraySize)
+            rows = []
+            for batch in self._fetchBatches(refCursor, arraySize):
+                rows.extend(batch)
+            return rows
+        finally:
+            refCursor.close()
+            
+    def _startRecord(self, cursor, sql):
+        """
+        Starts an instrumentation record, charging it the time spent getting the session.
+        """
+        pending = getattr(self._local, 'record', None)
+        if pending is not None:
+            self._local.record = None
+            self._finishRecord(cursor, pending)
+            
+        record = self._instrumentation.startStatement(sql)
+        record.connect = getattr(self._local, 'connecttime', 0.0)
+        self._local.connecttime = 0.0
+        if self._instrumentation.samplesSessionStatistics():
+            record.baseline = self._sampleSession(cursor.connection)
+            record.restart()
+            
+        return record
+    
+    def _finishRecord(self, cursor, record):
+        """
+        Completes an instrumentation record, adding the session's round trips and bytes when sampled.
+        """
+        if record.baseline is not None:
+            sample = self._sampleSession(cursor.connection)
+            if sample is not None:
+                # the baseline query itself costs one round trip
+                record.roundTrips = max(sample[0] - record.baseline[0] - 1, 0)
+                record.bytesSent = sample[1] - record.baseline[1]
+                record.bytesReceived = sample[2] - record.baseline[2]
+                
+        self._instrumentation.finishStatement(record)
+        
+    def _sampleSession(self, connection):
+        """
+        Reads the session's round trips and bytes sent/received from v$mystat.
+        
+        @return Tuple containing round trips, bytes sent and bytes received (None when not readable)
+        """
+        try:
+            cursor = connection.cursor()
+            try:
+                cursor.execute("SELECT n.name, s.value FROM v$mystat s JOIN v$statname n ON n.statistic# = s.statistic# "
+                               "WHERE n.name IN ('SQL*Net roundtrips to/from client', 'bytes sent via SQL*Net to client', 'bytes received via SQL*Net from client')")
+                values = dict(cursor.fetchall())
+            finally:
+                cursor.close()
+        except self._driver.DatabaseError:
+            return None
+        
+        return (values.get('SQL*Net roundtrips to/from client', 0), values.get('bytes received via SQL*Net from client', 0), values.get('bytes sent via SQL*Net to client', 0))
+    
+    def _getStatement(self):
+        """
+        Returns the SQL set by 'setSQL' as text.
+        
+        @return String
+        """
+        return self._sql.decode('utf-8') if type(self._sql) == bytes else self._sql
+    
+    def _setFetchSize(self, cursor, arraySize, prefetchRows=None):
+        """
+        Tunes how many rows a cursor fetches per round trip.  Must be called before executing.
+        """
+        if arraySize is not None and arraySize > 0:
+            cursor.arraysize = arraySize
+        if prefetchRows is not None and hasattr(cursor, 'prefetchrows'):
+            cursor.prefetchrows = prefetchRows
+            
+    def _fetchBatches(self, cursor, arraySize=None, rowFactory=True):
+        """
+        Yields lists of rows from an executed cursor, one fetch at a time, as the objects of the
+        row format unless rowFactory is False.
+        """
+        record = getattr(self._local, 'record', None)
+        self._local.record = None
+        
+        try:
+            if cursor.description is None:
+                return
+            
+            if rowFactory and self._rowformat != RowFormat.TUPLE:
+                cursor.rowfactory = getRowClass([col[0] for col in cursor.description], self._rowformat == RowFormat.SLOTS)
+                
+            while True:
+                if record is not None:
+                    record.restart()
+                batch = cursor.fetchmany(arraySize) if arraySize else cursor.fetchmany()
+                if record is not None:
+                    record.mark('fetch')
+                    record.rows += len(batch)
+                if not batch:
+                    return
+                yield batch
         finally:
-            for curs in trancursors:
-                curs.close()
\ No newline at end of file
+            if record is not None:
+                self._finishRecord(cursor, record)
+            
+    def _getLOBChunkSize(self, lob):
+        """
+        Returns the amount read or written per LOB round trip: a multiple of the LOB's chunk size
+        of about half a megabyte.
+        """
+        chunksize = lob.getchunksize() if hasattr(lob, 'getchunksize') else 0
+        if chunksize <= 0:
+            return 524288
+        return chunksize * max(524288 // chunksize, 1)
+    
+    def _prepareExtraction(self, tableName, ranges, keyColumn, columns, where, binds, maxWorkers):
+        """
+        Validates the arguments of a parallel extraction, computes the ranges and resets the progress
+        of each range.  Extractions on a key column get a final range for the rows whose key is NULL,
+        which equal width ranges cannot hold.
+        
+        @return Tuple containing a list of (sql, binds) jobs and the number of workers
+        """
+        for identifier in (tableName, keyColumn):
+            if identifier is not None and not _IDENTIFIER.match(identifier):
+                raise ValueError("'{0}' is not a valid table or column name.".format(identifier))
+            
+        ranges = ranges if ranges > 0 else 1
+        maxWorkers = maxWorkers if maxWorkers else ranges
+        bounds = self._getExtractRanges(tableName, ranges, keyColumn, where, binds)
+        column = keyColumn if keyColumn is not None else 'ROWID'
+        keyranges = len(bounds)
+        if keyColumn is not None:
+            bounds.append((None, None))
+            
+        jobs = []
+        self._extractprogress = []
+        for index, (low, high) in enumerate(bounds):
+            rangebinds = dict(binds) if binds is not None else {}
+            if keyColumn is None:
+                condition = "ROWID BETWEEN CHARTOROWID(:range_lo) AND CHARTOROWID(:range_hi)"
+            elif index == keyranges:
+                condition = "{0} IS NULL".format(column)
+            elif index == keyranges - 1:
+                condition = "{0} >= :range_lo AND {0} <= :range_hi".format(column)
+            else:
+                condition = "{0} >= :range_lo AND {0} < :range_hi".format(column)
+                
+            sql = "SELECT {columns} FROM {table} WHERE {condition}".format(columns=columns, table=tableName, condition=condition)
+            if where:
+                sql += " AND ({0})".format(where)
+            if index < keyranges:
+                rangebinds.update(range_lo=low, range_hi=high)
+            jobs.append((sql, rangebinds or None))
+            self._extractprogress.append({'range': index, 'low': low, 'high': high, 'rows': 0, 'attempts': 0, 'status': 'pending', 'seconds': 0.0, 'error': None})
+            
+        return jobs, maxWorkers
+    
+    def _getExtractRanges(self, tableName, ranges, keyColumn, where, binds):
+        """
+        Computes the bounds of the ranges of a parallel extraction: ROWID ranges holding about the
+        same number of rows (one scan of the ROWIDs), or equal width ranges between the smallest and
+        largest key.
+        
+        @return List of (low, high) Tuples, both inclusive for ROWID ranges
+        """
+        condition = " WHERE {0}".format(where) if where else ""
+        rangebinds = dict(binds) if binds is not None else {}
+        with self._session() as conn:
+            sqlcursor = conn.cursor()
+            try:
+                if keyColumn is None:
+                    rangebinds['range_count'] = ranges
+                    self._execute(sqlcursor, "SELECT ROWIDTOCHAR(MIN(rid)), ROWIDTOCHAR(MAX(rid)) FROM (SELECT ROWID rid, NTILE(:range_count) OVER (ORDER BY ROWID) bucket "
+                                             "FROM {table}{condition}) GROUP BY bucket ORDER BY bucket".format(table=tableName, condition=condition), rangebinds)
+                    return [tuple(row) for row in self._fetchAll(sqlcursor)]
+                
+                self._execute(sqlcursor, "SELECT MIN({key}), MAX({key}) FROM {table}{condition}".format(key=keyColumn, table=tableName, condition=condition), rangebinds or None)
+                low, high = next(self._fetchAll(sqlcursor))
+            finally:
+                sqlcursor.close()
+                
+        if low is None:
+            return []
+        
+        if all(value == int(value) for value in (low, high)):
+            low, high = int(low), int(high)
+            ranges = min(ranges, high - low + 1)
+            edges = [low + (high - low + 1) * index // ranges for index in range(ranges)] + [high]
+        else:
+            edges = [low + (high - low) * index / ranges for index in range(ranges)] + [high]
+            
+        return [(edges[index], edges[index + 1]) for index in range(ranges)]
+    
+    def _extractRange(self, index, sql, binds, arraySize, retries, deliver, restartable, progress, stop):
+        """
+        Fetches one range of a parallel extraction on a borrowed session and hands its batches to the
+        writer yielded by deliver(index, names), retrying a failed range when it can be restarted
+        (or has not delivered any rows yet).
+        """
+        status = self._extractprogress[index]
+        start = time.perf_counter()
+        while True:
+            status['attempts'] += 1
+            status['status'] = 'running'
+            status['rows'] = 0
+            try:
+                with self._session() as conn:
+                    sqlcursor = conn.cursor()
+                    try:
+                        self._setFetchSize(sqlcursor, arraySize)
+                        self._execute(sqlcursor, sql, binds)
+                        with deliver(index, [col[0] for col in sqlcursor.description]) as write:
+                            for batch in self._fetchBatches(sqlcursor, arraySize):
+                                if stop is not None and stop.is_set():
+                                    status['status'] = 'cancelled'
+                                    return
+                                write(batch)
+                                status['rows'] += len(batch)
+                                if progress is not None:
+                                    progress(index, status['rows'])
+                    finally:
+                        sqlcursor.close()
+                        
+                status['status'] = 'done'
+                return
+            except (self._driver.DatabaseError, OSError) as e:
+                status['error'] = self._formatDatabaseError(e) if isinstance(e, self._driver.DatabaseError) else str(e)
+                if status['attempts'] > retries or (not restartable and status['rows'] > 0) or (stop is not None and stop.is_set()):
+                    status['status'] = 'failed'
+                    return
+            finally:
+                status['seconds'] = time.perf_counter() - start
+                
+    def _putExtracted(self, output, item, stop):
+        """
+        Puts an item on the merged stream of a parallel extraction, giving up once the stream is closed.
+        """
+        while not stop.is_set():
+            try:
+                output.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+            
+    def _getPartFileName(self, outputFile, index):
+        """
+        Returns the name of the part file of a range, e.g. 'table.part001.csv.gz' for 'table.csv.gz'.
+        """
+        directory, name = os.path.split(outputFile)
+        base, sep, extension = name.partition('.')
+        return os.path.join(directory, "{0}.part{1:03d}{2}{3}".format(base, index + 1, sep, extension))
+    
+    def _removeFiles(self, files):
+        """
+        Removes files that exist, ignoring any that cannot be removed.
+        """
+        for fl in files:
+            try:
+                if os.path.isfile(fl):
+                    os.remove(fl)
+            except OSError:
+                pass
+            
+    def _openCallPool(self, maxSessions):
+        """
+        Opens a session pool for the duration of a concurrent call when none is open.  The caller
+        must close it with 'closePool' when this returns True, so later calls on this object keep
+        using the dedicated connection.
+        
+        @return Boolean (whether the pool was opened here)
+        
+        @raise cx_Oracle.DatabaseError when the pool cannot be opened.
+        """
+        if self._pool is not None:
+            return False
+        
+        if not self.openPool(minSessions=1, maxSessions=maxSessions, increment=1):
+            raise self._driver.DatabaseError(self._errMsg)
+        return True
+    
+    def _runConcurrentJob(self, sql, binds, timeout):
+        """
+        Runs one query of a concurrent fan-out on a borrowed session.
+        
+        @return Tuple containing the rows (None if it failed) and an error message
+        """
+        try:
+            with self._session() as conn:
+                if timeout:
+                    conn.call_timeout = int(timeout * 1000)
+                sqlcursor = conn.cursor()
+                try:
+                    self._execute(sqlcursor, sql, binds)
+                    return list(self._fetchAll(sqlcursor)), None
+                finally:
+                    sqlcursor.close()
+                    if timeout:
+                        conn.call_timeout = 0
+        except self._driver.DatabaseError as e:
+            return None, self._formatDatabaseError(e)
+        
+    def _fetchAll(self, cursor):
+        """
+        Yields every row of an executed cursor, or nothing for statements that are not queries.
+        """
+        for batch in self._fetchBatches(cursor):
+            yield from batch
+            
+    def _createColumn(self, description):
+        """
+        Creates an empty column for a cursor description entry: an int64 array for integer
+        NUMBER columns, a float64 array for other numeric columns and a list otherwise.
+        """
+        dbtype, precision, scale = description[1], description[4], description[5]
+        if dbtype == self._driver.NUMBER:
+            if scale == 0 and precision is not None and 0 < precision <= 18:
+                return array.array('q')
+            return array.array('d')
+        elif dbtype == self._driver.NATIVE_FLOAT:
+            return array.array('d')
+        return []
+    
+    def _extendColumn(self, column, values):
+        """
+        Appends a batch of values to a column.  An integer column that meets a NULL is widened to
+        float64 so the NULL can be stored as NaN.
+        
+        @return the (possibly widened) column
+        """
+        if type(column) != array.array:
+            column.extend(values)
+            return column
+        
+        if None in values:
+            if column.typecode == 'q':
+                column = array.array('d', column)
+            values = [float('nan') if value is None else value for value in values]
+            
+        column.extend(values)
+        return column
+    
+    def _getExportFormat(self, outputFile, fileFormat):
+        """
+        Returns the export format, derived from the file name when not given.
+        """
+        if fileFormat is not None:
+            return fileFormat
+        
+        name = outputFile.lower()
+        if name.endswith('.gz'):
+            name = name[:-3]
+        return ExportFormat.JSONL if name.endswith('.jsonl') or name.endswith('.json') else ExportFormat.CSV
+    
+    def _openExportFile(self, outputFile, compress):
+        """
+        Opens an export file for writing text, gzip compressed when asked or when named '.gz'.
+        """
+        if compress is None:
+            compress = outputFile.lower().endswith('.gz')
+        if compress:
+            return gzip.open(outputFile, 'wt', encoding='utf-8', newline='')
+        return open(outputFile, 'w', encoding='utf-8', newline='')
+    
+    def _writeRows(self, fl, fileFormat, names, batches, writeHeader=True):
+        """
+        Writes batches of rows to an open export file.
+        
+        @return Integer number of rows written
+        """
+        rowcount = 0
+        if fileFormat == ExportFormat.JSONL:
+            for batch in batches:
+                fl.writelines(json.dumps(dict(zip(names, row)), default=self._toJSON) + "\n" for row in batch)
+                rowcount += len(batch)
+        else:
+            writer = csv.writer(fl)
+            if writeHeader:
+                writer.writerow(names)
+            for batch in batches:
+                writer.writerows(batch)
+                rowcount += len(batch)
+                
+        return rowcount
+    
+    def _toJSON(self, value):
+        """
+        Converts column values json cannot serialize on its own.
+        """
+        if isinstance(value, (datetime, date)):
+            return value.isoformat()
+        elif isinstance(value, Decimal):
+            return str(value)
+        elif isinstance(value, (bytes, bytearray)):
+            return base64.b64encode(value).decode('ascii')
+        elif hasattr(value, 'read'):
+            return self._toJSON(value.read())
+        raise TypeError("Object of type '{0}' is not JSON serializable".format(type(value).__name__))
+    
+    def _setExportStatistics(self, outputFile, rowCount, start):
+        """
+        Records the outcome of an export.
+        """
+        seconds = time.perf_counter() - start
+        size = os.path.getsize(outputFile) if os.path.isfile(outputFile) else 0
+        self._exportstats = {'rows': rowCount, 'bytes': size, 'seconds': seconds}
+        self._outMsg = "Exported {rows} rows ({bytes} bytes) to '{file}'.".format(rows=rowCount, bytes=size, file=outputFile)
+        
+    def _setBulkStatistics(self, rowCount, start):
+        """
+        Records the outcome of a bulk DML call.
+        """
+        seconds = time.perf_counter() - start
+        self._bulkstats = {'rows': rowCount, 'errors': len(self._batcherrors), 'seconds': seconds, 'rowsPerSecond': rowCount / seconds if seconds > 0 else 0.0}
+        
+    def _splitConnectionString(self):
+        """
+        Splits a connection string in format 'username/password@db' into its parts.
+        
+        @return Tuple containing username, password and db
+        """
+        if self._connectionstr is None:
+            raise Exception("A connection string is required before calling the 'openPool' method!")
+        
+        credentials, sep, dsn = self._connectionstr.rpartition('@')
+        if not sep:
+            credentials, dsn = self._connectionstr, None
+        user, sep, password = credentials.partition('/')
+        
+        return user, password, dsn
+    
+    def _setDatabaseError(self, e):
+        """
+        Puts a cx_Oracle error on the error message stack.
+        
+        @param e: the error raised by cx_Oracle
+        @type e: cx_Oracle.Error
+        """
+        self._errMsg = self._formatDatabaseError(e)
+        
+    def _formatDatabaseError(self, e):
+        """
+        Formats a cx_Oracle error as an error message.
+        
+        @return String
+        """
+        error = e.args[0] if len(e.args) > 0 else e
+        return "[Oracle-Error-Message: " + str(getattr(error, 'message', error)) + "] with [System Error: " + str(sys.stderr) + "]"
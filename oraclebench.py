@@ -0,0 +1,351 @@
+#! /usr/bin/python36
+#[][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][]
+#[]  Script: oraclebench.py                                                    []
+#[]  Script Language: Python 3.6(.4)                                           []
+#[]  Description: This class can be used to measure the throughput of the      []
+#[]               OracleDB class (fetch, bulk insert, transaction queue and    []
+#[]               pooled concurrency) against Oracle or the SQLite stand-in,   []
+#[]               and to track the results between versions.                   []
+#[]  Author: Paul J. Laue                                                      []
+#[]  Created: October 19, 2026 09:00:00 PM                                     []
+#[] ========================================================================== []
+#[]  CHANGE LOG                                                                []
+#[]  ----------                                                                []
+#[]                                                                            []
+#[] ========================================================================== []
+#[][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][]
+import os.path
+import subprocess
+import sys
+import time
+import json
+from datetime import datetime
+from oracle import OracleDB
+from plat4rm import Platform
+
+BENCH_TABLE = 'oradb_bench'
+
+class OracleDBBenchmark:
+    """
+    This class runs timed benchmarks of the OracleDB class in a scratch table and keeps the
+    results, optionally appending them to a JSON history file so versions can be compared.
+    """
+    def __init__(self, connectionString=None, driver='sqlite'):
+        """
+        Creates a new OracleDBBenchmark object.
+        
+        @param connectionString (optional): an oracle database connection string (ignored by the SQLite stand-in)
+        @type connectionString: String
+        
+        @param driver (optional): the database driver or its name, the SQLite stand-in when omitted
+        @type driver: Module/SQLiteDriver/String
+        """
+        self._errMsg = ''
+        self._outMsg = ''
+        self._connectionstr = connectionString if connectionString is not None else 'bench/bench@localhost'
+        self._driver = driver
+        self._drivername = driver if type(driver) == str else getattr(driver, '__name__', type(driver).__name__)
+        self._results = {}
+    
+    def getErrorMsg(self):
+        """
+        Returns any error messages on the stack.
+        
+        @return String
+        """
+        return self._errMsg
+    
+    def getOutputMsg(self):
+        """
+        Returns any output messages on the stack.
+        
+        @return String
+        """
+        return self._outMsg
+    
+    def getResults(self):
+        """
+        Returns all benchmark results gathered so far.
+        
+        @return Dictionary
+        """
+        return self._results
+    
+    def benchmarkFetch(self, rowCount=100000, arraySizes=(100, 1000, 10000)):
+        """
+        Measures how fast a query's rows are streamed for each fetch array size.
+        
+        @param rowCount (optional): number of rows in the scratch table
+        @type rowCount: Integer
+        
+        @param arraySizes (optional): fetch array sizes to measure
+        @type arraySizes: List/Sequence
+        
+        @return Dictionary of array size to rows per second
+        """
+        results = {}
+        db = self._createTable(rowCount)
+        try:
+            for arraySize in arraySizes:
+                start = time.perf_counter()
+                fetched = sum(len(batch) for batch in db.executeQueryStream(sql="SELECT id, name, amount FROM {0}".format(BENCH_TABLE),
+                                                                             arraySize=arraySize, batches=True))
+                results[arraySize] = fetched / (time.perf_counter() - start)
+        finally:
+            self._dropTable(db)
+        
+        self._results['fetch'] = results
+        return results
+    
+    def benchmarkBulkInsert(self, rowCount=100000, batchSizes=(1000, 10000)):
+        """
+        Measures array DML ('executeMany') inserts for each batch size.
+        
+        @param rowCount (optional): number of rows inserted per measurement
+        @type rowCount: Integer
+        
+        @param batchSizes (optional): rows sent per round trip
+        @type batchSizes: List/Sequence
+        
+        @return Dictionary of batch size to rows per second
+        """
+        results = {}
+        db = self._createTable(0)
+        try:
+            for batchSize in batchSizes:
+                db.executeBasicTransaction(transaction="DELETE FROM {0}".format(BENCH_TABLE))
+                if not db.executeMany(self._insertStatement(), self._rows(rowCount), batchSize=batchSize):
+                    self._errMsg = db.getErrorMsg()
+                results[batchSize] = db.getBulkStatistics()['rowsPerSecond']
+        finally:
+            self._dropTable(db)
+        
+        self._results['bulkInsert'] = results
+        return results
+    
+    def benchmarkTransactionQueue(self, statementCount=5000):
+        """
+        Measures 'executeAdvancedTransaction' on a queue of single row inserts with bind values, run
+        one by one and batched into array DML.
+        
+        @param statementCount (optional): number of queued statements
+        @type statementCount: Integer
+        
+        @return Dictionary of mode ('single', 'batched') to statements per second
+        """
+        results = {}
+        db = self._createTable(0)
+        try:
+            for mode, batchStatements in (('single', False), ('batched', True)):
+                db.executeBasicTransaction(transaction="DELETE FROM {0}".format(BENCH_TABLE))
+                db.clearAllTransactionsFromQueue()
+                for row in self._rows(statementCount):
+                    db.addTransactionToQueue(self._insertStatement(), row)
+                
+                start = time.perf_counter()
+                if not db.executeAdvancedTransaction(batchStatements=batchStatements):
+                    self._errMsg = db.getErrorMsg()
+                results[mode] = statementCount / (time.perf_counter() - start)
+        finally:
+            db.clearAllTransactionsFromQueue()
+            self._dropTable(db)
+        
+        self._results['transactionQueue'] = results
+        return results
+    
+    def benchmarkConcurrency(self, rowCount=20000, queryCount=32, workerCounts=(1, 2, 4, 8)):
+        """
+        Measures 'executeConcurrent' running aggregate queries over pooled sessions for each
+        number of workers.
+        
+        @param rowCount (optional): number of rows in the scratch table
+        @type rowCount: Integer
+        
+        @param queryCount (optional): number of queries run per measurement
+        @type queryCount: Integer
+        
+        @param workerCounts (optional): numbers of concurrent workers (and pooled sessions) to measure
+        @type workerCounts: List/Sequence
+        
+        @return Dictionary of worker count to queries per second
+        """
+        results = {}
+        db = self._createTable(rowCount)
+        try:
+            jobs = ["SELECT COUNT(*), SUM(amount) FROM {0} WHERE id > {1}".format(BENCH_TABLE, index) for index in range(queryCount)]
+            for workers in workerCounts:
+                db.closePool()
+                start = time.perf_counter()
+                errors = [error for index, rows, error in db.executeConcurrent(jobs, maxWorkers=workers) if error is not None]
+                results[workers] = queryCount / (time.perf_counter() - start)
+                if errors:
+                    self._errMsg = errors[0]
+        finally:
+            db.closePool()
+            self._dropTable(db)
+        
+        self._results['concurrency'] = results
+        return results
+    
+    def benchmarkAll(self):
+        """
+        Runs every benchmark.
+        
+        @return Dictionary
+        """
+        self.benchmarkFetch()
+        self.benchmarkBulkInsert()
+        self.benchmarkTransactionQueue()
+        self.benchmarkConcurrency()
+        
+        return self._results
+    
+    def recordResults(self, historyFile, version=None):
+        """
+        Appends the results gathered so far to a JSON history file, with the version measured and
+        the host and driver they were measured on.
+        
+        @param historyFile: full path to the JSON history file
+        @type historyFile: String
+        
+        @param version (optional): the version measured, 'git describe' of this directory when omitted
+        @type version: String
+        
+        @return Dictionary holding the recorded entry
+        """
+        p = Platform()
+        entry = {
+            'version': version if version is not None else self._getVersion(),
+            'measured': datetime.now().isoformat(),
+            'host': p.getHostName(),
+            'machine': p.getMachineType(),
+            'driver': self._drivername,
+            'results': self._flatten(self._results)
+        }
+        
+        history = self.loadHistory(historyFile)
+        history.append(entry)
+        try:
+            tmpfile = historyFile + ".tmp"
+            with open(tmpfile, 'w') as hf:
+                json.dump(history, hf, indent=2)
+            os.replace(tmpfile, historyFile)
+        except OSError as oerr:
+            self._errMsg = "There was a critical error attempting to write file '{0}'.  OSError={1}".format(historyFile, str(oerr))
+        
+        return entry
+    
+    def loadHistory(self, historyFile):
+        """
+        Returns the entries recorded in a JSON history file, oldest first.
+        
+        @param historyFile: full path to the JSON history file
+        @type historyFile: String
+        
+        @return List of Dictionaries
+        """
+        if not os.path.isfile(historyFile):
+            return []
+        
+        try:
+            with open(historyFile, 'r') as hf:
+                return json.load(hf)
+        except (OSError, ValueError) as err:
+            self._errMsg = "The history file '{0}' could not be loaded.  Error={1}".format(historyFile, str(err))
+            return []
+    
+    def compareWithHistory(self, historyFile, tolerance=0.1):
+        """
+        Compares the results gathered so far with the last entry recorded for the same host and
+        driver.  Every result is a rate, so lower is slower.
+        
+        @param historyFile: full path to the JSON history file
+        @type historyFile: String
+        
+        @param tolerance (optional): fraction a rate may drop before it is reported as a regression
+        @type tolerance: Float
+        
+        @return Dictionary of result name to (previous rate, current rate, change as a fraction) for the
+                results that regressed, or None when there is no earlier entry to compare with
+        """
+        host = Platform().getHostName()
+        previous = [entry for entry in self.loadHistory(historyFile) if entry['host'] == host and entry['driver'] == self._drivername]
+        if not previous:
+            return None
+        
+        baseline = previous[-1]['results']
+        regressions = {}
+        for name, rate in self._flatten(self._results).items():
+            if name in baseline and baseline[name] > 0:
+                change = (rate - baseline[name]) / baseline[name]
+                if change < -tolerance:
+                    regressions[name] = (baseline[name], rate, change)
+        
+        self._outMsg = "{0} results regressed by more than {1:.0%} since version '{2}'.".format(len(regressions), tolerance, previous[-1]['version'])
+        return regressions
+    
+    def _createTable(self, rowCount):
+        """
+        Creates the scratch table holding rowCount rows.
+        
+        @return OracleDB
+        """
+        db = OracleDB(self._connectionstr, driver=self._driver)
+        db.executeBasicTransaction(transaction="DROP TABLE {0}".format(BENCH_TABLE))
+        if not db.executeBasicTransaction(transaction="CREATE TABLE {0} (id NUMBER(10), name VARCHAR2(40), amount NUMBER(12,2))".format(BENCH_TABLE)):
+            raise Exception("The benchmark table could not be created.  " + db.getErrorMsg())
+        if rowCount > 0:
+            db.executeMany(self._insertStatement(), self._rows(rowCount))
+        return db
+    
+    def _dropTable(self, db):
+        """
+        Drops the scratch table and closes the connection.
+        """
+        db.executeBasicTransaction(transaction="DROP TABLE {0}".format(BENCH_TABLE))
+        db.close()
+    
+    def _insertStatement(self):
+        """
+        Returns the insert statement of the scratch table.
+        """
+        return "INSERT INTO {0} (id, name, amount) VALUES (:1, :2, :3)".format(BENCH_TABLE)
+    
+    def _rows(self, rowCount):
+        """
+        Yields rowCount rows for the scratch table.
+        """
+        for index in range(rowCount):
+            yield (index, "name {0}".format(index), round(index * 1.25, 2))
+    
+    def _flatten(self, results):
+        """
+        Flattens nested results into 'benchmark.parameter' names, e.g. 'fetch.1000'.
+        """
+        return {"{0}.{1}".format(benchmark, parameter): rate for benchmark, rates in results.items() for parameter, rate in rates.items()}
+    
+    def _getVersion(self):
+        """
+        Returns 'git describe' of the directory this module is in, or 'unknown'.
+        """
+        try:
+            output = subprocess.check_output(['git', 'describe', '--always', '--dirty'], cwd=os.path.dirname(os.path.abspath(__file__)), stderr=subprocess.DEVNULL)
+            return output.decode('utf-8').strip()
+        except (OSError, subprocess.CalledProcessError):
+            return 'unknown'
+
+if __name__ == "__main__":
+    b = OracleDBBenchmark()
+    b.benchmarkAll()
+    for arraySize, rate in sorted(b.getResults()['fetch'].items()):
+        print("Fetch arraysize {0}: {1:,.0f} rows/sec".format(arraySize, rate))
+    for batchSize, rate in sorted(b.getResults()['bulkInsert'].items()):
+        print("Bulk insert batch {0}: {1:,.0f} rows/sec".format(batchSize, rate))
+    for mode, rate in sorted(b.getResults()['transactionQueue'].items()):
+        print("Transaction queue ({0}): {1:,.0f} statements/sec".format(mode, rate))
+    for workers, rate in sorted(b.getResults()['concurrency'].items()):
+        print("Concurrent queries, {0} workers: {1:,.1f} queries/sec".format(workers, rate))
+    if len(sys.argv) > 1:
+        # usage: python oraclebench.py <history file>
+        print("Regressions: {0}".format(b.compareWithHistory(sys.argv[1])))
+        b.recordResults(sys.argv[1])
@@ -0,0 +1,304 @@
+#! /usr/bin/python36
+#[][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][]
+#[]  Script: querycache.py                                                     []
+#[]  Script Language: Python 3.6(.4)                                           []
+#[]  Description: This class keeps query results in memory with a time to live []
+#[]               and a memory bound (least recently used entries are evicted) []
+#[]               with optional persistence to disk between runs.              []
+#[]  Author: Paul J. Laue                                                      []
+#[]  Created: October 19, 2026 03:00:00 PM                                     []
+#[] ========================================================================== []
+#[]  CHANGE LOG                                                                []
+#[]  ----------                                                                []
+#[]                                                                            []
+#[] ========================================================================== []
+#[][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][]
+from collections import OrderedDict
+import os
+import pickle
+import threading
+import time
+
+class QueryResultCache:
+    """
+    This class caches query results keyed by normalized SQL plus bind values (and an optional
+    variant, such as the shape of the cached rows).  Each entry expires
+    after its time to live, and the least recently used entries are evicted once the cache holds
+    more than its memory bound.
+    """
+    def __init__(self, maxBytes=67108864, defaultTTL=300, cacheFile=None):
+        """
+        Creates a new empty QueryResultCache object.
+        
+        @param maxBytes (optional): approximate upper bound of the memory used by cached results
+        @type maxBytes: Integer
+        
+        @param defaultTTL (optional): seconds a result is kept when no time to live is given
+        @type defaultTTL: Integer
+        
+        @param cacheFile (optional): full path to a file the cache is loaded from and saved to
+        @type cacheFile: String
+        """
+        self._errMsg = ''
+        self._outMsg = ''
+        self._maxbytes = maxBytes
+        self._defaultttl = defaultTTL
+        self._cachefile = cacheFile
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+        
+        if cacheFile is not None and os.path.isfile(cacheFile):
+            self.load()
+    
+    def getErrorMsg(self):
+        """
+        Returns any error messages on the stack.
+        
+        @return String
+        """
+        return self._errMsg
+    
+    def getOutputMsg(self):
+        """
+        Returns any output messages on the stack.
+        
+        @return String
+        """
+        return self._outMsg
+    
+    def get(self, sql, binds=None, variant=None):
+        """
+        Returns a copy of the cached rows of a query, or None when it is not cached or has expired.
+        
+        @param sql: the SQL query
+        @type sql: String
+        
+        @param binds (optional): the bind values of the query
+        @type binds: List/Dictionary
+        
+        @param variant (optional): the variant the rows were cached under
+        @type variant: String
+        
+        @return List
+        """
+        key = self._makeKey(sql, binds, variant)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= time.time():
+                self._remove(key)
+                entry = None
+            
+            if entry is None:
+                self._misses += 1
+                return None
+            
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return list(entry[2])
+    
+    def put(self, sql, binds, rows, ttl=None, variant=None):
+        """
+        Caches the rows of a query.  Results larger than the memory bound are not cached.
+        
+        @param sql: the SQL query
+        @type sql: String
+        
+        @param binds: the bind values of the query (None when there are none)
+        @type binds: List/Dictionary
+        
+        @param rows: the rows returned by the query
+        @type rows: List
+        
+        @param ttl (optional): seconds to keep the result, the default time to live when omitted
+        @type ttl: Integer
+        
+        @param variant (optional): a variant of the result, e.g. the shape of its rows, cached separately
+        @type variant: String
+        """
+        ttl = self._defaultttl if ttl is None else ttl
+        if ttl <= 0:
+            return
+        
+        rows = list(rows)
+        size = len(pickle.dumps(rows, pickle.HIGHEST_PROTOCOL))
+        if size > self._maxbytes:
+            return
+        
+        key = self._makeKey(sql, binds, variant)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            
+            self._entries[key] = (time.time() + ttl, size, rows)
+            self._bytes += size
+            while self._bytes > self._maxbytes:
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+    
+    def invalidate(self, sql=None, binds=None):
+        """
+        Removes cached results.  With no arguments the whole cache is cleared; with only sql every
+        cached result of that query is removed, whatever its bind values.  Every variant is removed.
+        
+        @param sql (optional): the SQL query to remove
+        @type sql: String
+        
+        @param binds (optional): the bind values of the query to remove
+        @type binds: List/Dictionary
+        
+        @return Integer number of results removed
+        """
+        with self._lock:
+            if sql is None:
+                removed = len(self._entries)
+                self._entries.clear()
+                self._bytes = 0
+                return removed
+            
+            if binds is not None:
+                querykey = self._makeKey(sql, binds)[:2]
+                keys = [key for key in self._entries if key[:2] == querykey]
+            else:
+                normalized = self.normalizeSQL(sql)
+                keys = [key for key in self._entries if key[0] == normalized]
+            
+            removed = 0
+            for key in keys:
+                if key in self._entries:
+                    self._remove(key)
+                    removed += 1
+            
+            return removed
+    
+    def getStatistics(self):
+        """
+        Returns the hit, miss and eviction counters along with the number and size of cached results.
+        
+        @return Dictionary
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {'hits': self._hits, 'misses': self._misses, 'hitRatio': self._hits / lookups if lookups > 0 else 0.0,
+                    'evictions': self._evictions, 'entries': len(self._entries), 'bytes': self._bytes, 'maxBytes': self._maxbytes}
+    
+    def resetStatistics(self):
+        """
+        Clears out the hit, miss and eviction counters.
+        """
+        with self._lock:
+            self._hits = self._misses = self._evictions = 0
+    
+    def save(self, cacheFile=None):
+        """
+        Writes the unexpired results to disk so they can be loaded by a later run.
+        
+        @param cacheFile (optional): full path to the file, the cache file given at creation when omitted
+        @type cacheFile: String
+        
+        @return Boolean
+        """
+        cacheFile = cacheFile if cacheFile is not None else self._cachefile
+        if cacheFile is None:
+            self._errMsg = "A cache file is required to save the query result cache."
+            return False
+        
+        now = time.time()
+        with self._lock:
+            entries = [(key, entry) for key, entry in self._entries.items() if entry[0] > now]
+        
+        try:
+            tmpfile = cacheFile + ".tmp"
+            with open(tmpfile, 'wb') as cf:
+                pickle.dump(entries, cf, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmpfile, cacheFile)
+        except (OSError, pickle.PicklingError) as err:
+            self._errMsg = "There was a critical error attempting to write file '{0}'.  Error={1}".format(cacheFile, str(err))
+            return False
+        
+        self._outMsg = "Saved {count} cached results to '{file}'.".format(count=len(entries), file=cacheFile)
+        return True
+    
+    def load(self, cacheFile=None):
+        """
+        Reads results saved by an earlier run, skipping any that have expired.
+        
+        @param cacheFile (optional): full path to the file, the cache file given at creation when omitted
+        @type cacheFile: String
+        
+        @return Boolean
+        """
+        cacheFile = cacheFile if cacheFile is not None else self._cachefile
+        try:
+            with open(cacheFile, 'rb') as cf:
+                entries = pickle.load(cf)
+        except (OSError, pickle.UnpicklingError, EOFError) as err:
+            self._errMsg = "There was a critical error attempting to read file '{0}'.  Error={1}".format(cacheFile, str(err))
+            return False
+        
+        now = time.time()
+        with self._lock:
+            for key, entry in entries:
+                if entry[0] > now and key not in self._entries:
+                    self._entries[key] = entry
+                    self._bytes += entry[1]
+            while self._bytes > self._maxbytes:
+                self._remove(next(iter(self._entries)))
+        
+        return True
+    
+    def normalizeSQL(self, sql):
+        """
+        Normalizes SQL text for use as a cache key: whitespace outside quoted strings and
+        identifiers is collapsed and a trailing ';' is dropped.
+        
+        @param sql: the SQL text
+        @type sql: String
+        
+        @return String
+        """
+        if type(sql) == bytes:
+            sql = sql.decode('utf-8')
+        
+        parts = []
+        quote = None
+        pendingspace = False
+        for ch in sql.strip().rstrip(';').strip():
+            if quote is not None:
+                parts.append(ch)
+                if ch == quote:
+                    quote = None
+            elif ch.isspace():
+                pendingspace = True
+            else:
+                if pendingspace:
+                    parts.append(' ')
+                    pendingspace = False
+                parts.append(ch)
+                if ch in ("'", '"'):
+                    quote = ch
+        
+        return ''.join(parts)
+    
+    def _makeKey(self, sql, binds, variant=None):
+        """
+        Builds the cache key of a query.
+        """
+        if binds is None:
+            bindkey = None
+        elif isinstance(binds, dict):
+            bindkey = tuple(sorted((str(name), repr(value)) for name, value in binds.items()))
+        else:
+            bindkey = tuple(repr(value) for value in binds)
+        
+        return self.normalizeSQL(sql), bindkey, variant
+    
+    def _remove(self, key):
+        """
+        Removes an entry.  The caller must hold the lock.
+        """
+        entry = self._entries.pop(key)
+        self._bytes -= entry[1]
@@ -0,0 +1,314 @@
+#! /usr/bin/python36
+#[][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][]
+#[]  Script: recordcrypter.py                                                  []
+#[]  Script Language: Python 3.6(.4)                                           []
+#[]  Description: This class can be used to encrypt/decrypt selected fields of []
+#[]               CSV or JSON Lines records as a stream, using the Encrypter   []
+#[]               class and its secure key file.                               []
+#[]  Author: Paul J. Laue                                                      []
+#[]  Created: October 19, 2026 11:00:00 AM                                     []
+#[] ========================================================================== []
+#[]  CHANGE LOG                                                                []
+#[]  ----------                                                                []
+#[]                                                                            []
+#[] ========================================================================== []
+#[][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][]
+from concurrent.futures import ProcessPoolExecutor
+from collections import deque
+from itertools import islice
+from cryptography.fernet import InvalidToken
+from encrypter import Encrypter
+from enum import Enum
+import csv
+import json
+import os
+import os.path
+
+class RecordFormat(Enum):
+    """
+    An enumeration of supported record stream formats.
+    """
+    CSV = 0,
+    JSONL = 1
+
+# the Encrypter a worker process built last, with the key file it was built from
+_workerEncrypter = None
+_workerKeyFile = None
+
+def _transformBatch(batch, fields, decrypt, encrypter):
+    """
+    Encrypts or decrypts the configured fields of copies of a batch of records, one field (column)
+    at a time.  Values are encrypted as text, exactly like 'Encrypter.encrypt' does.
+    """
+    batch = [dict(record) for record in batch]
+    for field in fields:
+        records = [record for record in batch if record.get(field) not in (None, '')]
+        values = [str(record[field]) for record in records]
+        if decrypt:
+            values = encrypter.decryptMany(values)
+        else:
+            values = encrypter.encryptMany(values)
+        for record, value in zip(records, values):
+            record[field] = value
+    return batch
+
+def _transformWorkerBatch(batch, fields, decrypt, keyFile):
+    """
+    Transforms a batch inside a worker process.  Python 3.6 has no pool initializer, so the key
+    file comes with every batch, but the Encrypter is only built when the key file changes.
+    """
+    global _workerEncrypter, _workerKeyFile
+    if _workerEncrypter is None or _workerKeyFile != keyFile:
+        _workerEncrypter = Encrypter(keyFile)
+        _workerKeyFile = keyFile
+    return _transformBatch(batch, fields, decrypt, _workerEncrypter)
+
+class RecordEncrypter:
+    """
+    This class reads CSV or JSON Lines records incrementally and encrypts or decrypts only the
+    configured fields, writing the output in a single pass.  Records are processed in batches
+    with a single cipher, optionally spread across a pool of worker processes.  Field values are
+    encrypted as their text, so fields encrypted here can be decrypted with 'Encrypter.decrypt' and
+    the other way around; decrypted values are always strings.
+    """
+    def __init__(self, keyFile=None, fields=None, batchSize=1000, processes=1):
+        """
+        Creates a new RecordEncrypter object.
+        
+        @param keyFile (optional): location of the secure key to use for encryption/decryption
+        @type keyFile: String
+        
+        @param fields (optional): names of the fields (columns) to encrypt/decrypt
+        @type fields: List/Sequence
+        
+        @param batchSize (optional): number of records handled per batch
+        @type batchSize: Integer
+        
+        @param processes (optional): number of worker processes to use (1 works in this process)
+        @type processes: Integer
+        
+        @raise OSError when key file does not exist or is invalid.
+        """
+        self._errMsg = ''
+        self._outMsg = ''
+        self._encrypter = Encrypter(keyFile)
+        self._keyfile = keyFile
+        self._fields = []
+        self._batchsize = batchSize if batchSize > 0 else 1000
+        self._processes = processes
+        self._recordcount = 0
+        
+        if fields is not None:
+            self.setFields(fields)
+    
+    def getErrorMsg(self):
+        """
+        Returns any error messages on the stack.
+        
+        @return String
+        """
+        return self._errMsg
+    
+    def getOutputMsg(self):
+        """
+        Returns any output messages on the stack.
+        
+        @return String
+        """
+        return self._outMsg
+    
+    def setSecureKey(self, keyFile):
+        """
+        Set the path to key and the secure key itself
+        
+        @param keyFile: location of the secure key to use for encryption/decryption
+        @type keyFile: String
+        
+        @return Boolean
+        """
+        if not self._encrypter.setSecureKey(keyFile):
+            self._errMsg = self._encrypter.getErrorMsg() or self._encrypter.getOutputMsg()
+            return False
+        self._keyfile = keyFile
+        return True
+    
+    def setFields(self, fields):
+        """
+        Set the names of the fields (columns) to encrypt/decrypt.
+        
+        @param fields: names of the fields
+        @type fields: List/Sequence
+        """
+        self._fields = [fields] if type(fields) == str else list(fields)
+    
+    def getRecordCount(self):
+        """
+        Returns the number of records processed by the last transformation.
+        
+        @return Integer
+        """
+        return self._recordcount
+    
+    def encryptRecords(self, records):
+        """
+        Encrypts the configured fields of a stream of records (dictionaries).  The records are
+        copied, not changed in place.
+        
+        @param records: an iterable of dictionaries
+        @type records: Iterable
+        
+        @return Generator of dictionaries
+        """
+        return self._transformRecords(records, False)
+    
+    def decryptRecords(self, records):
+        """
+        Decrypts the configured fields of a stream of records (dictionaries).  The records are
+        copied, not changed in place.
+        
+        @param records: an iterable of dictionaries
+        @type records: Iterable
+        
+        @return Generator of dictionaries
+        """
+        return self._transformRecords(records, True)
+    
+    def encryptFile(self, inputFile, outputFile, recordFormat=None):
+        """
+        Encrypts the configured fields of a CSV or JSON Lines file into a new file.
+        
+        @param inputFile: full path to the source file
+        @type inputFile: String
+        
+        @param outputFile: full path to the file to write
+        @type outputFile: String
+        
+        @param recordFormat (optional): format of the file, derived from the extension when omitted
+        @type recordFormat: Enumerator (RecordFormat)
+        
+        @return Boolean
+        """
+        return self._transformFile(inputFile, outputFile, recordFormat, False)
+    
+    def decryptFile(self, inputFile, outputFile, recordFormat=None):
+        """
+        Decrypts the configured fields of a CSV or JSON Lines file into a new file.
+        
+        @param inputFile: full path to the source file
+        @type inputFile: String
+        
+        @param outputFile: full path to the file to write
+        @type outputFile: String
+        
+        @param recordFormat (optional): format of the file, derived from the extension when omitted
+        @type recordFormat: Enumerator (RecordFormat)
+        
+        @return Boolean
+        """
+        return self._transformFile(inputFile, outputFile, recordFormat, True)
+    
+    def _transformFile(self, inputFile, outputFile, recordFormat, decrypt):
+        """
+        Streams records from inputFile through the transformation into a temporary file, which
+        replaces outputFile once every record has been transformed and is removed otherwise.
+        """
+        if not os.path.isfile(inputFile):
+            self._errMsg = "The file '{file}' does not exist or is invalid!".format(file=inputFile)
+            return False
+        
+        if recordFormat is None:
+            recordFormat = RecordFormat.CSV if inputFile.lower().endswith('.csv') else RecordFormat.JSONL
+        
+        self._recordcount = 0
+        tmpfile = outputFile + ".tmp"
+        replaced = False
+        try:
+            with open(inputFile, 'r', newline='') as infl, open(tmpfile, 'w', newline='') as outfl:
+                if recordFormat == RecordFormat.CSV:
+                    reader = csv.DictReader(infl)
+                    if reader.fieldnames is not None:
+                        writer = csv.DictWriter(outfl, fieldnames=reader.fieldnames)
+                        writer.writeheader()
+                        for batch in self._transformBatches(reader, decrypt):
+                            writer.writerows(batch)
+                else:
+                    records = (json.loads(line) for line in infl if line.strip())
+                    for batch in self._transformBatches(records, decrypt):
+                        outfl.writelines(json.dumps(record) + "\n" for record in batch)
+            os.replace(tmpfile, outputFile)
+            replaced = True
+        except OSError as oerr:
+            self._errMsg = "There was a critical error attempting to transform file '{0}'.  OSError={1}".format(inputFile, str(oerr))
+            return False
+        except (InvalidToken, ValueError) as err:
+            # ValueError covers invalid JSON (json.JSONDecodeError)
+            self._errMsg = "The file '{0}' has a record that could not be transformed after record {1}.  Error={2}".format(inputFile, self._recordcount, repr(err))
+            return False
+        except Exception as err:
+            # anything else a worker process raised, e.g. a broken process pool or a missing key
+            self._errMsg = "The file '{0}' could not be transformed after record {1}.  Error={2}".format(inputFile, self._recordcount, repr(err))
+            return False
+        finally:
+            if not replaced:
+                self._removeFile(tmpfile)
+        
+        self._outMsg = "Transformed {count} records into '{file}'.".format(count=self._recordcount, file=outputFile)
+        return True
+    
+    def _transformRecords(self, records, decrypt):
+        """
+        Yields transformed records one at a time.
+        """
+        for batch in self._transformBatches(records, decrypt):
+            for record in batch:
+                yield record
+    
+    def _transformBatches(self, records, decrypt):
+        """
+        Yields transformed batches of records in input order, keeping at most a few batches
+        in flight when a process pool is used.
+        """
+        self._recordcount = 0
+        batches = self._batches(records)
+        
+        if self._processes is None or self._processes > 1:
+            with ProcessPoolExecutor(max_workers=self._processes) as executor:
+                maxinflight = (self._processes or os.cpu_count() or 1) * 2
+                inflight = deque()
+                for batch in batches:
+                    inflight.append(executor.submit(_transformWorkerBatch, batch, self._fields, decrypt, self._keyfile))
+                    if len(inflight) >= maxinflight:
+                        yield self._countBatch(inflight.popleft().result())
+                while len(inflight) > 0:
+                    yield self._countBatch(inflight.popleft().result())
+        else:
+            for batch in batches:
+                yield self._countBatch(_transformBatch(batch, self._fields, decrypt, self._encrypter))
+    
+    def _batches(self, records):
+        """
+        Splits a stream of records into lists of at most batchSize records.
+        """
+        iterator = iter(records)
+        while True:
+            batch = list(islice(iterator, self._batchsize))
+            if not batch:
+                return
+            yield batch
+    
+    def _countBatch(self, batch):
+        """
+        Adds a finished batch to the record count.
+        """
+        self._recordcount += len(batch)
+        return batch
+    
+    def _removeFile(self, file):
+        """
+        Removes a file if it exists, ignoring errors.
+        """
+        try:
+            if os.path.isfile(file):
+                os.remove(file)
+        except OSError:
+            pass
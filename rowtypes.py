@@ -0,0 +1,139 @@
+#! /usr/bin/python36
+#[][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][]
+#[]  Script: rowtypes.py                                                        []
+#[]  Script Language: Python 3.6(.4)                                           []
+#[]  Description: Functions that build compact row classes for query results   []
+#[]               (namedtuples or __slots__ classes), once per set of column   []
+#[]               names, plus a memory benchmark against lists of dicts.       []
+#[]  Author: Paul J. Laue                                                      []
+#[]  Created: October 19, 2026 07:00:00 PM                                     []
+#[] ========================================================================== []
+#[]  CHANGE LOG                                                                []
+#[]  ----------                                                                []
+#[]                                                                            []
+#[] ========================================================================== []
+#[][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][]
+from collections import namedtuple, OrderedDict
+import threading
+import tracemalloc
+
+# the row classes of the most recently used column lists; ad hoc queries would otherwise add a
+# class for every distinct column list that is never freed
+_MAX_ROW_CLASSES = 256
+_rowClasses = OrderedDict()
+_rowClassesLock = threading.Lock()
+
+def getRowClass(names, slots=False):
+    """
+    Returns the row class for a set of column names, building it on first use.  Rows are either
+    namedtuples or instances of a class with __slots__; neither holds a per row dictionary, and
+    columns can be read by name (row.NAME), position (row[0]) or unpacking.  The class is called
+    with the column values, so it can be used as cursor.rowfactory.  Names that are not
+    valid identifiers (e.g. 'COUNT(*)') or repeat are renamed to their position, e.g. '_1'.
+    Only the _MAX_ROW_CLASSES most recently used classes are kept.
+    
+    @param names: the column names, e.g. from cursor.description
+    @type names: List/Sequence
+    
+    @param slots (optional): build a __slots__ class instead of a namedtuple
+    @type slots: Boolean
+    
+    @return Class
+    """
+    key = (tuple(names), slots)
+    with _rowClassesLock:
+        rowclass = _rowClasses.get(key)
+        if rowclass is not None:
+            _rowClasses.move_to_end(key)
+            return rowclass
+        
+        rowclass = _rowClasses[key] = _createSlotsRow(names) if slots else _createNamedTupleRow(names)
+        if len(_rowClasses) > _MAX_ROW_CLASSES:
+            _rowClasses.popitem(last=False)
+    return rowclass
+
+def benchmarkRowMemory(rowCount=100000, columnCount=10):
+    """
+    Measures the memory held by the same result set stored as tuples, namedtuples, __slots__
+    rows and dictionaries keyed by column name.
+    
+    @param rowCount (optional): number of rows
+    @type rowCount: Integer
+    
+    @param columnCount (optional): number of columns per row
+    @type columnCount: Integer
+    
+    @return Dictionary of format name to bytes held and bytes per row
+    """
+    names = ["COLUMN_{0}".format(index) for index in range(columnCount)]
+    rows = [tuple(row * columnCount + column for column in range(columnCount)) for row in range(rowCount)]
+    namedtuplerow = getRowClass(names)
+    slotsrow = getRowClass(names, slots=True)
+    builders = (('tuple', lambda: [tuple(list(row)) for row in rows]),
+                ('namedtuple', lambda: [namedtuplerow(*row) for row in rows]),
+                ('slots', lambda: [slotsrow(*row) for row in rows]),
+                ('dict', lambda: [dict(zip(names, row)) for row in rows]))
+    
+    results = {}
+    for name, build in builders:
+        tracemalloc.start()
+        try:
+            built = build()
+            size = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+        del built
+        results[name] = {'bytes': size, 'bytesPerRow': size / rowCount if rowCount > 0 else 0.0}
+        
+    return results
+
+def _createNamedTupleRow(names):
+    """
+    Builds a namedtuple row class that can be pickled (e.g. by the query result cache).
+    """
+    rowclass = namedtuple('Row', names, rename=True)
+    rowclass.__reduce__ = lambda row: (_restoreRow, (tuple(names), False, tuple(row)))
+    return rowclass
+
+def _createSlotsRow(names):
+    """
+    Builds a row class with __slots__, using the same field names as the namedtuple.
+    """
+    fields = namedtuple('Row', names, rename=True)._fields
+    namespace = {}
+    # one generated assignment per row is much cheaper than a setattr loop
+    exec("def __init__(_self, *_values):\n    {0}, = _values\n".format(", ".join("_self." + field for field in fields)), namespace)
+    
+    def __getitem__(self, index):
+        if type(index) == str:
+            return getattr(self, index)
+        elif type(index) == slice:
+            return tuple(self)[index]
+        return getattr(self, fields[index])
+    
+    def __iter__(self):
+        return (getattr(self, field) for field in fields)
+    
+    def __eq__(self, other):
+        return tuple(self) == tuple(other) if hasattr(other, '__iter__') else NotImplemented
+    
+    def __repr__(self):
+        return "Row(" + ", ".join("{0}={1!r}".format(field, getattr(self, field)) for field in fields) + ")"
+    
+    def _asdict(self):
+        return dict(zip(fields, self))
+    
+    return type('Row', (object,), {'__slots__': fields, '_fields': fields, '__init__': namespace['__init__'], '__getitem__': __getitem__,
+                                   '__iter__': __iter__, '__len__': lambda self: len(fields), '__eq__': __eq__, '__hash__': None,
+                                   '__repr__': __repr__, '_asdict': _asdict,
+                                   '__reduce__': lambda self: (_restoreRow, (tuple(names), True, tuple(self)))})
+
+def _restoreRow(names, slots, values):
+    """
+    Rebuilds a pickled row from its column names and values.
+    """
+    return getRowClass(names, slots)(*values)
+
+if __name__ == '__main__':
+    for name, result in benchmarkRowMemory().items():
+        print("{0:<12} {1:>14,} bytes {2:>10,.1f} bytes/row".format(name, result['bytes'], result['bytesPerRow']))
@@ -0,0 +1,266 @@
+#! /usr/bin/python36
+#[][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][]
+#[]  Script: sqlinstrument.py                                                  []
+#[]  Script Language: Python 3.6(.4)                                           []
+#[]  Description: This class records per statement timings (connect, parse,    []
+#[]               execute, fetch), rows, round trips and bytes, writes a slow  []
+#[]               query log and reports the statements that cost the most.     []
+#[]  Author: Paul J. Laue                                                      []
+#[]  Created: October 19, 2026 05:00:00 PM                                     []
+#[] ========================================================================== []
+#[]  CHANGE LOG                                                                []
+#[]  ----------                                                                []
+#[]                                                                            []
+#[] ========================================================================== []
+#[][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][]
+from collections import deque
+import logging
+import threading
+import time
+
+PHASES = ('connect', 'parse', 'execute', 'fetch')
+
+# the totals of statements seen after the per statement totals are full are added up under this text
+OTHER_STATEMENTS = '(other statements)'
+
+class StatementRecord:
+    """
+    The measurements of one statement execution.
+    """
+    __slots__ = ('sql', 'started', 'connect', 'parse', 'execute', 'fetch', 'rows', 'roundTrips', 'bytesSent', 'bytesReceived', 'error', 'baseline', '_mark')
+    
+    def __init__(self, sql):
+        """
+        Creates a new StatementRecord object and starts timing.
+        
+        @param sql: the statement text
+        @type sql: String
+        """
+        self.sql = sql
+        self.started = time.time()
+        self.connect = 0.0
+        self.parse = 0.0
+        self.execute = 0.0
+        self.fetch = 0.0
+        self.rows = 0
+        self.roundTrips = None
+        self.bytesSent = None
+        self.bytesReceived = None
+        self.error = None
+        self.baseline = None
+        self._mark = time.perf_counter()
+    
+    def mark(self, phase):
+        """
+        Adds the time since the previous mark to a phase.
+        
+        @param phase: one of 'connect', 'parse', 'execute' or 'fetch'
+        @type phase: String
+        """
+        now = time.perf_counter()
+        setattr(self, phase, getattr(self, phase) + now - self._mark)
+        self._mark = now
+    
+    def restart(self):
+        """
+        Restarts the timer without charging the elapsed time to any phase.
+        """
+        self._mark = time.perf_counter()
+    
+    def getTotalTime(self):
+        """
+        Returns the sum of all phase timings in seconds.
+        
+        @return Float
+        """
+        return self.connect + self.parse + self.execute + self.fetch
+    
+    def asDict(self):
+        """
+        Returns the measurements as a dictionary.
+        
+        @return Dictionary
+        """
+        return {'sql': self.sql, 'started': self.started, 'connect': self.connect, 'parse': self.parse, 'execute': self.execute,
+                'fetch': self.fetch, 'total': self.getTotalTime(), 'rows': self.rows, 'roundTrips': self.roundTrips,
+                'bytesSent': self.bytesSent, 'bytesReceived': self.bytesReceived, 'error': self.error}
+
+class SQLInstrumentation:
+    """
+    This class collects StatementRecords, aggregates them per statement text and logs statements
+    slower than a threshold.
+    """
+    def __init__(self, slowQueryThreshold=None, slowQueryLogFile=None, measureParse=False, sessionStatistics=False, maxRecords=10000, maxStatements=10000):
+        """
+        Creates a new empty SQLInstrumentation object.
+        
+        @param slowQueryThreshold (optional): seconds after which a statement is written to the slow query log
+        @type slowQueryThreshold: Float
+        
+        @param slowQueryLogFile (optional): full path to the slow query log, the 'oracle.slowquery' logger is used either way
+        @type slowQueryLogFile: String
+        
+        @param measureParse (optional): parse each statement in its own round trip so parse time is measured separately
+        @type measureParse: Boolean
+        
+        @param sessionStatistics (optional): sample the session's round trips and bytes from v$mystat around each statement
+        @type sessionStatistics: Boolean
+        
+        @param maxRecords (optional): number of individual statement records kept
+        @type maxRecords: Integer
+        
+        @param maxStatements (optional): number of distinct statement texts totaled, later texts are totaled as OTHER_STATEMENTS
+        @type maxStatements: Integer
+        """
+        self._errMsg = ''
+        self._outMsg = ''
+        self._slowthreshold = slowQueryThreshold
+        self._measureparse = measureParse
+        self._sessionstats = sessionStatistics
+        self._records = deque(maxlen=maxRecords)
+        self._totals = {}
+        self._maxstatements = maxStatements
+        self._lock = threading.Lock()
+        self._logger = logging.getLogger('oracle.slowquery')
+        self._handler = None
+        
+        if slowQueryLogFile is not None:
+            self._handler = logging.FileHandler(slowQueryLogFile)
+            self._handler.setFormatter(logging.Formatter('%(asctime)s %(message)s'))
+            self._logger.addHandler(self._handler)
+            self._logger.setLevel(logging.INFO)
+    
+    def getErrorMsg(self):
+        """
+        Returns any error messages on the stack.
+        
+        @return String
+        """
+        return self._errMsg
+    
+    def getOutputMsg(self):
+        """
+        Returns any output messages on the stack.
+        
+        @return String
+        """
+        return self._outMsg
+    
+    def measuresParse(self):
+        """
+        Returns whether statements are parsed in their own round trip.
+        
+        @return Boolean
+        """
+        return self._measureparse
+    
+    def samplesSessionStatistics(self):
+        """
+        Returns whether round trips and bytes are sampled from v$mystat.
+        
+        @return Boolean
+        """
+        return self._sessionstats
+    
+    def startStatement(self, sql):
+        """
+        Starts measuring a statement.
+        
+        @param sql: the statement text
+        @type sql: String
+        
+        @return StatementRecord
+        """
+        return StatementRecord(sql)
+    
+    def finishStatement(self, record):
+        """
+        Stores a finished statement record, adds it to the per statement totals and writes it to
+        the slow query log when it ran longer than the threshold.  Once maxStatements texts are
+        totaled, new texts (e.g. SQL with literals instead of binds) go to OTHER_STATEMENTS.
+        
+        @param record: the record returned by 'startStatement'
+        @type record: StatementRecord
+        """
+        total = record.getTotalTime()
+        with self._lock:
+            self._records.append(record)
+            sql = record.sql
+            if sql not in self._totals and len(self._totals) >= self._maxstatements:
+                sql = OTHER_STATEMENTS
+            totals = self._totals.get(sql)
+            if totals is None:
+                totals = self._totals[sql] = {'sql': sql, 'count': 0, 'errors': 0, 'total': 0.0, 'max': 0.0, 'rows': 0,
+                                              'connect': 0.0, 'parse': 0.0, 'execute': 0.0, 'fetch': 0.0, 'roundTrips': 0, 'bytes': 0}
+            totals['count'] += 1
+            totals['errors'] += 1 if record.error is not None else 0
+            totals['total'] += total
+            totals['max'] = max(totals['max'], total)
+            totals['rows'] += record.rows
+            for phase in PHASES:
+                totals[phase] += getattr(record, phase)
+            totals['roundTrips'] += record.roundTrips or 0
+            totals['bytes'] += (record.bytesSent or 0) + (record.bytesReceived or 0)
+        
+        if self._slowthreshold is not None and total >= self._slowthreshold:
+            self._logger.warning("slow statement %.3fs (connect=%.3f parse=%.3f execute=%.3f fetch=%.3f rows=%d roundtrips=%s): %s",
+                                 total, record.connect, record.parse, record.execute, record.fetch, record.rows, record.roundTrips, ' '.join(record.sql.split()))
+    
+    def getRecords(self):
+        """
+        Returns the most recent statement records.
+        
+        @return List of Dictionaries
+        """
+        with self._lock:
+            return [record.asDict() for record in self._records]
+    
+    def getReport(self, top=10, orderBy='total'):
+        """
+        Returns the per statement totals of the statements that cost the most.
+        
+        @param top (optional): number of statements to return
+        @type top: Integer
+        
+        @param orderBy (optional): the total to order by ('total', 'count', 'max', 'rows', or a phase name)
+        @type orderBy: String
+        
+        @return List of Dictionaries
+        """
+        with self._lock:
+            totals = [dict(item) for item in self._totals.values()]
+        
+        for item in totals:
+            item['average'] = item['total'] / item['count'] if item['count'] > 0 else 0.0
+        
+        return sorted(totals, key=lambda item: item[orderBy], reverse=True)[:top]
+    
+    def formatReport(self, top=10, orderBy='total'):
+        """
+        Returns the report of 'getReport' as printable text.
+        
+        @return String
+        """
+        lines = ["{0:>10} {1:>7} {2:>9} {3:>9} {4:>9} {5:>9} {6:>10}  {7}".format('total(s)', 'count', 'avg(s)', 'parse(s)', 'exec(s)', 'fetch(s)', 'rows', 'statement')]
+        for item in self.getReport(top, orderBy):
+            sql = ' '.join(item['sql'].split())
+            lines.append("{0:>10.3f} {1:>7} {2:>9.4f} {3:>9.3f} {4:>9.3f} {5:>9.3f} {6:>10}  {7}".format(item['total'], item['count'], item['average'],
+                         item['parse'], item['execute'], item['fetch'], item['rows'], sql if len(sql) <= 100 else sql[:97] + '...'))
+        return "\n".join(lines)
+    
+    def clear(self):
+        """
+        Clears out every record and total.
+        """
+        with self._lock:
+            self._records.clear()
+            self._totals.clear()
+    
+    def close(self):
+        """
+        Detaches the slow query log file.
+        """
+        if self._handler is not None:
+            self._logger.removeHandler(self._handler)
+            self._handler.close()
+            self._handler = None
@@ -12,8 +12,146 @@
 #[]                                                                            []
 #[] ========================================================================== []
 #[][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][]
+from collections import deque
+from decimal import Decimal, InvalidOperation
+import codecs
 import subprocess
+import os
 import os.path
+import queue
+import re
+import tempfile
+import threading
+import time
+import uuid
+
+# marks the end of a sqlplus session's output
+_SESSION_EOF = object()
+
+# lines of session output read ahead of the caller, and lines of stderr kept for the error message
+_MAX_PENDING_LINES = 10000
+_MAX_ERROR_LINES = 1000
+
+# seconds a persistent session call may take when neither a time out nor 'setTimeOut' is given; an
+# unterminated statement (e.g. a PL/SQL block without its '/') would otherwise wait forever
+DEFAULT_SESSION_TIMEOUT = 300
+
+# settings that make sqlplus print a query as CSV: one quoted header line, quoted strings and
+# unquoted numbers, without feedback lines; the session's own settings are saved with STORE SET
+# before and run back from the stored file afterwards
+_CSV_SETTINGS = b"SET MARKUP CSV ON QUOTE ON\nSET HEADING ON\nSET PAGESIZE 50000\nSET FEEDBACK OFF\nSET VERIFY OFF\nSET NUMWIDTH 40\n"
+_CSV_STORE = "STORE SET {0} REPLACE\n"
+_CSV_RESTORE = "SET MARKUP CSV OFF\n@{0}\n"
+
+# output lines reporting an error
+_ERROR_PREFIXES = ('ORA-', 'SP2-', 'ERROR at line')
+
+_INTEGER = re.compile(r'\s*[+-]?\d+\s*')
+
+class SQLPlusError(Exception):
+    """
+    Raised when sqlplus reports an ORA-/SP2- error while streaming structured results.
+    """
+    pass
+
+def _splitCSVLine(line):
+    """
+    Splits a line of sqlplus CSV output into (value, quoted) pairs, or returns None when the line
+    ends inside a quoted value (the value continues on the next line).
+    """
+    fields = []
+    pos = 0
+    length = len(line)
+    while True:
+        if line.startswith('"', pos):
+            value = []
+            pos += 1
+            while True:
+                end = line.find('"', pos)
+                if end < 0:
+                    return None
+                value.append(line[pos:end])
+                if line.startswith('""', end):
+                    value.append('"')
+                    pos = end + 2
+                else:
+                    pos = end + 1
+                    break
+            fields.append((''.join(value), True))
+        else:
+            end = line.find(',', pos)
+            end = length if end < 0 else end
+            fields.append((line[pos:end], False))
+            pos = end
+            
+        if pos >= length:
+            return fields
+        pos += 1
+
+def _convertValue(value, quoted):
+    """
+    Converts a CSV value to its Python type: quoted values are strings, empty values NULL, and
+    unquoted numbers int or Decimal.  Anything else (e.g. an unquoted date) stays a string.
+    """
+    if quoted:
+        return value
+    elif value == '':
+        return None
+    elif _INTEGER.fullmatch(value):
+        return int(value)
+    
+    try:
+        return Decimal(value)
+    except InvalidOperation:
+        return value
+
+def _readLines(stream, encoding='utf-8', chunkSize=65536):
+    """
+    Yields the lines of a sub-program's output as soon as they arrive, without their line ends.
+    Chunks are decoded incrementally, so a character split across two reads is decoded whole.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+    pending = ''
+    while True:
+        chunk = stream.read1(chunkSize)
+        text = decoder.decode(chunk, final=not chunk)
+        if text:
+            lines = (pending + text).split('\n')
+            pending = lines.pop()
+            for line in lines:
+                yield line.rstrip('\r')
+        if not chunk:
+            break
+        
+    if pending:
+        yield pending.rstrip('\r')
+
+def _pumpLines(stream, lines):
+    """
+    Reads the lines of a sub-program's output into a queue until the output is closed.
+    """
+    try:
+        for line in _readLines(stream):
+            lines.put(line)
+    finally:
+        lines.put(_SESSION_EOF)
+
+def _collectLines(stream, lines):
+    """
+    Reads the lines of a sub-program's output into a bounded deque until the output is closed.
+    """
+    for line in _readLines(stream):
+        lines.append(line)
+
+def _writeInput(stream, data):
+    """
+    Writes data to a sub-program's input and closes it.  A sub-program that exits early is not an error here.
+    """
+    try:
+        stream.write(data)
+        stream.close()
+    except OSError:
+        pass
 
 class SQLPlus:
     """
@@ -48,6 +186,13 @@ class SQLPlus:
         self._switches = []
         self._sql = ''
         self._qryresults = []
+        self._qrycolumns = None
+        self._resultcolumns = None
+        self._session = None
+        self._sessionlines = None
+        self._sessionid = uuid.uuid4().hex
+        self._markercount = 0
+        self._settingsfile = os.path.join(tempfile.gettempdir(), "sqlplus_settings_{0}.sql".format(self._sessionid))
         
     def getErrorMsg(self):
         """
@@ -74,7 +219,7 @@ class SQLPlus:
         """
         if timeout is None:
             self._timeout = None
-        elif timeout is not None and len(timeout) > 0 and type(timeout) == int: 
+        elif type(timeout) == int and timeout > 0:
             self._timeout = timeout
     
     def setProgramLocation(self, programLocation):
@@ -152,12 +297,29 @@ class SQLPlus:
         """
         return self._qryresults if len(self._qryresults) > 0 else None
     
+    def getQueryResultsAsColumns(self):
+        """
+        Returns the column arrays of the last 'executeQuery' call made with columnar=True.
+        
+        @return Dictionary of column name to List
+        """
+        return self._qrycolumns
+    
+    def getQueryResultColumns(self):
+        """
+        Returns the column names of the last structured query.
+        
+        @return List
+        """
+        return self._resultcolumns
+    
     def clearQueryResults(self):
         """
         Clears out any query results
         """
         if len(self._qryresults) > 0:
             self._qryresults.clear()
+        self._qrycolumns = None
     
     def directoryExists(self, directory):
         """
@@ -250,20 +412,8 @@ class SQLPlus:
             
         if sqlFile is not None:
             self.setSQLFromFile(sqlFile)
-      
-        cmdswitches = None
-        if len(self._switches) > 0:
-            cmdswitches = self._switches
-        
-        if self._prglocation is not None and cmdswitches is None:
-            cmd = [self._prglocation, self._connectionstr]
-        elif self._prglocation is not None and cmdswitches is not None:
-            cmd = [self._prglocation] + cmdswitches +  [self._connectionstr]
-        elif self._prglocation is None and cmdswitches is not None:
-            cmd = ['sqlplus'] + cmdswitches + [self._connectionstr]
-        else:
-            cmd = ['sqlplus', self._connectionstr]
         
+        cmd = self._buildCommand()
         sub = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
         
         try:
@@ -278,4 +428,438 @@ class SQLPlus:
             self._errMsg = stderr
             self._outMsg = stdout
                 
-        return True
\ No newline at end of file
+        return True
+    
+    def executeSQLPlusStream(self, connectionString=None, sql=None, sqlFile=None, timeout=None):
+        """
+        Executes the SQLPlus program like 'executeSQLPlus', but yields each line of its output as
+        soon as sqlplus prints it instead of collecting the output, so large spools are processed in
+        constant memory.  The statements are written to sqlplus from a separate thread and stderr is
+        drained in the background (its last lines end up in the error message).  Stopping the
+        iteration early kills sqlplus.
+        
+        @param connectionString (optional): an oracle database connection string
+        @type connectionString: String
+        
+        @param sql (optional): a series of SQL statements to run via SQLPlus
+        @type sql: String
+        
+        @param sqlFile (optional): full path to a file containing SQL statements to run via SQLPlus
+        @type sqlFile: String
+        
+        @param timeout (optional): seconds sqlplus may run, the time out set by 'setTimeOut' when omitted
+        @type timeout: Integer
+        
+        @return Generator of Strings
+        
+        @raise OSError when sqlplus cannot be started, subprocess.TimeoutExpired when it is killed
+               after the time out.
+        """
+        if connectionString is not None:
+            self.setConnectionString(connectionString)
+            
+        if sql is not None:
+            self.setSQL(sql)
+            
+        if sqlFile is not None:
+            self.setSQLFromFile(sqlFile)
+            
+        cmd = self._buildCommand()
+        timeout = timeout if timeout is not None else self._timeout
+        sub = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        
+        errors = deque(maxlen=_MAX_ERROR_LINES)
+        threading.Thread(target=_writeInput, args=(sub.stdin, self._sql), daemon=True).start()
+        stderrreader = threading.Thread(target=_collectLines, args=(sub.stderr, errors), daemon=True)
+        stderrreader.start()
+        
+        expired = threading.Event()
+        def expire():
+            expired.set()
+            sub.kill()
+            
+        timer = None
+        if timeout is not None:
+            timer = threading.Timer(timeout, expire)
+            timer.daemon = True
+            timer.start()
+            
+        count = 0
+        finished = False
+        try:
+            for line in _readLines(sub.stdout):
+                count += 1
+                yield line
+            finished = True
+        finally:
+            if not finished:
+                sub.kill()
+            sub.wait()
+            if timer is not None:
+                timer.cancel()
+            stderrreader.join()
+            sub.stdout.close()
+            sub.stderr.close()
+            self._errMsg = "\n".join(errors)
+            
+        if expired.is_set():
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        
+        self._outMsg = "SQLPlus returned {count} lines (exit code {code}).".format(count=count, code=sub.returncode)
+    
+    def openSession(self, connectionString=None, loginTimeout=60):
+        """
+        Starts a persistent sqlplus process (silent, single login attempt) that later calls to
+        'executeInSession' feed statements to over stdin, so many scripts share one login.
+        
+        @param connectionString (optional): an oracle database connection string
+        @type connectionString: String
+        
+        @param loginTimeout (optional): seconds to wait for the login to complete
+        @type loginTimeout: Integer
+        
+        @return Boolean
+        """
+        if connectionString is not None:
+            self.setConnectionString(connectionString)
+            
+        if self._session is not None:
+            return True
+        
+        switches = [switch.upper() for switch in self._switches]
+        cmd = self._buildCommand([switch for switch in ('-S', '-L') if switch not in switches])
+        try:
+            self._session = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        except OSError as oerr:
+            self._errMsg = "There was a critical error attempting to start sqlplus.  OSError={0}".format(str(oerr))
+            return False
+        
+        self._sessionlines = queue.Queue(maxsize=_MAX_PENDING_LINES)
+        threading.Thread(target=_pumpLines, args=(self._session.stdout, self._sessionlines), daemon=True).start()
+        
+        # the first marker only comes back once the login has completed
+        lines = []
+        try:
+            for line in self._sessionOutput(b"SET SQLBLANKLINES OFF", loginTimeout):
+                lines.append(line)
+        except (EOFError, OSError, subprocess.TimeoutExpired) as err:
+            self._errMsg = "The sqlplus session could not be opened.  Error={0}  Output={1}".format(str(err), " ".join(line for line in lines if line))
+            self.closeSession()
+            return False
+        
+        self._outMsg = "\n".join(lines) if lines else "The sqlplus session was opened."
+        return True
+    
+    def executeInSession(self, sql=None, sqlFile=None, timeout=None):
+        """
+        Runs SQL statements in the persistent sqlplus session (opening it if needed) and stores the
+        lines they print in the query result list.  Statements must be terminated (';' or '/').
+        The output of each call is delimited by a unique marker the session prints afterwards.
+        
+        @param sql (optional): a series of SQL statements to run
+        @type sql: String
+        
+        @param sqlFile (optional): full path to a file containing SQL statements to run
+        @type sqlFile: String
+        
+        @param timeout (optional): seconds to wait before the session is closed, the time out set by 'setTimeOut' (or DEFAULT_SESSION_TIMEOUT) when omitted
+        @type timeout: Integer
+        
+        @return Boolean (False when the session fails or the output reports an ORA-/SP2- error)
+        """
+        if sql is not None:
+            self.setSQL(sql)
+            
+        if sqlFile is not None:
+            self.setSQLFromFile(sqlFile)
+            
+        if self._session is None and not self.openSession():
+            return False
+        
+        self._qryresults = []
+        try:
+            for line in self._sessionOutput(self._sql, self._getSessionTimeout(timeout)):
+                self._qryresults.append(line)
+        except (EOFError, OSError, subprocess.TimeoutExpired) as err:
+            self._errMsg = "The sqlplus session failed.  Error={0}".format(str(err))
+            return False
+        
+        errors = [line for line in self._qryresults if line.startswith(_ERROR_PREFIXES)]
+        if errors:
+            self._errMsg = "\n".join(errors)
+            return False
+        
+        self._outMsg = "The statements returned {count} lines.".format(count=len(self._qryresults))
+        return True
+    
+    def executeInSessionStream(self, sql=None, sqlFile=None, timeout=None):
+        """
+        Runs SQL statements in the persistent sqlplus session like 'executeInSession', but yields
+        each line of output as soon as the session prints it instead of collecting the output.
+        Stopping the iteration early skips the rest of the output, so the session stays usable.
+        
+        @param sql (optional): a series of SQL statements to run
+        @type sql: String
+        
+        @param sqlFile (optional): full path to a file containing SQL statements to run
+        @type sqlFile: String
+        
+        @param timeout (optional): seconds to wait before the session is closed, the time out set by 'setTimeOut' (or DEFAULT_SESSION_TIMEOUT) when omitted
+        @type timeout: Integer
+        
+        @return Generator of Strings
+        
+        @raise EOFError when the session ends or cannot be opened, subprocess.TimeoutExpired when the
+               time out passes.
+        """
+        if sql is not None:
+            self.setSQL(sql)
+            
+        if sqlFile is not None:
+            self.setSQLFromFile(sqlFile)
+            
+        if self._session is None and not self.openSession():
+            raise EOFError(self._errMsg)
+        
+        output = self._sessionOutput(self._sql, self._getSessionTimeout(timeout))
+        try:
+            for line in output:
+                yield line
+        finally:
+            for line in output:
+                pass
+    
+    def executeQuery(self, sql=None, sqlFile=None, timeout=None, columnar=False):
+        """
+        Runs a query in the persistent sqlplus session with CSV markup and stores its typed rows
+        (see 'executeQueryStream') in the query result list, or with columnar=True its column
+        arrays, which are built while the rows stream in.
+        
+        @param sql (optional): the query to run, terminated by ';' or '/'
+        @type sql: String
+        
+        @param sqlFile (optional): full path to a file containing the query
+        @type sqlFile: String
+        
+        @param timeout (optional): seconds to wait before the session is closed, the time out set by 'setTimeOut' (or DEFAULT_SESSION_TIMEOUT) when omitted
+        @type timeout: Integer
+        
+        @param columnar (optional): store the result as one list per column ('getQueryResultsAsColumns')
+        @type columnar: Boolean
+        
+        @return Boolean
+        """
+        self._qryresults = []
+        self._qrycolumns = None
+        arrays = None
+        count = 0
+        try:
+            for row in self.executeQueryStream(sql, sqlFile, timeout):
+                count += 1
+                if not columnar:
+                    self._qryresults.append(row)
+                    continue
+                if arrays is None:
+                    arrays = [[] for _ in row]
+                for array, value in zip(arrays, row):
+                    array.append(value)
+        except SQLPlusError:
+            return False
+        except (EOFError, OSError, subprocess.TimeoutExpired) as err:
+            self._errMsg = "The sqlplus session failed.  Error={0}".format(str(err))
+            return False
+        
+        if columnar:
+            columns = self._resultcolumns or []
+            self._qrycolumns = dict(zip(columns, arrays if arrays is not None else [[] for _ in columns]))
+            
+        self._outMsg = "The query returned {count} rows.".format(count=count)
+        return True
+    
+    def executeQueryStream(self, sql=None, sqlFile=None, timeout=None):
+        """
+        Runs a query in the persistent sqlplus session (opening it if needed) with CSV markup and
+        yields its rows as tuples while sqlplus prints them, so no caller has to parse the screen
+        layout.  Quoted values are strings, empty values None and numbers int or Decimal; dates
+        come back as strings in the session's NLS format.  The column names are available from
+        'getQueryResultColumns' once the first row is yielded.  The session's settings are saved
+        with STORE SET beforehand and restored afterwards, so later 'executeInSession' calls get
+        the same output as before.
+        
+        @param sql (optional): the query to run, terminated by ';' or '/'
+        @type sql: String
+        
+        @param sqlFile (optional): full path to a file containing the query
+        @type sqlFile: String
+        
+        @param timeout (optional): seconds to wait before the session is closed, the time out set by 'setTimeOut' (or DEFAULT_SESSION_TIMEOUT) when omitted
+        @type timeout: Integer
+        
+        @return Generator of Tuples
+        
+        @raise SQLPlusError when sqlplus reports an error, EOFError when the session ends or cannot
+               be opened, subprocess.TimeoutExpired when the time out passes.
+        """
+        if sql is not None:
+            self.setSQL(sql)
+            
+        if sqlFile is not None:
+            self.setSQLFromFile(sqlFile)
+            
+        if self._session is None and not self.openSession():
+            raise EOFError(self._errMsg)
+        
+        self._resultcolumns = None
+        store = _CSV_STORE.format(self._settingsfile).encode('utf-8')
+        restore = _CSV_RESTORE.format(self._settingsfile).encode('utf-8')
+        output = self._sessionOutput(store + _CSV_SETTINGS + self._sql + b"\n" + restore, self._getSessionTimeout(timeout))
+        header = None
+        errors = []
+        partial = None
+        # each row is held until the next line shows it is not the echo of a failing statement
+        pending = None
+        try:
+            for line in output:
+                if errors or line.startswith(_ERROR_PREFIXES):
+                    errors.append(line)
+                    pending = None
+                    continue
+                
+                if partial is not None:
+                    line = partial + "\n" + line
+                    partial = None
+                fields = _splitCSVLine(line)
+                if fields is None:
+                    partial = line
+                    continue
+                
+                if header is None:
+                    # the header quotes every column name; anything before it is not a result and
+                    # every line after it is a row, even one whose values equal the column names
+                    if line and all(quoted for value, quoted in fields):
+                        header = fields
+                        self._resultcolumns = [value for value, quoted in fields]
+                    continue
+                if line == '' and len(header) > 1:
+                    continue
+                
+                if pending is not None:
+                    yield pending
+                pending = tuple(_convertValue(value, quoted) for value, quoted in fields)
+        finally:
+            for line in output:
+                pass
+            
+        if errors:
+            self._errMsg = "\n".join(errors)
+            raise SQLPlusError(self._errMsg)
+        
+        if pending is not None:
+            yield pending
+            
+    def isSessionOpen(self):
+        """
+        Returns whether the persistent sqlplus session is running.
+        
+        @return Boolean
+        """
+        return self._session is not None and self._session.poll() is None
+    
+    def closeSession(self):
+        """
+        Ends the persistent sqlplus session, killing the process if it does not exit.
+        """
+        if self._session is None:
+            return
+        
+        try:
+            self._session.stdin.write(b"EXIT\n")
+            self._session.stdin.close()
+        except OSError:
+            pass
+        
+        # read whatever is left, so the reader thread is not blocked on the full queue
+        deadline = time.monotonic() + 10
+        killed = False
+        while self._sessionlines is not None:
+            try:
+                if self._sessionlines.get(timeout=max(deadline - time.monotonic(), 0)) is _SESSION_EOF:
+                    break
+            except queue.Empty:
+                if killed:
+                    break
+                self._session.kill()
+                killed = True
+                deadline = time.monotonic() + 10
+                
+        try:
+            self._session.wait(timeout=max(deadline - time.monotonic(), 0))
+        except subprocess.TimeoutExpired:
+            self._session.kill()
+            self._session.wait()
+            
+        self._session.stdout.close()
+        self._session = None
+        self._sessionlines = None
+        
+        try:
+            os.remove(self._settingsfile)
+        except OSError:
+            pass
+        
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, excType, excValue, traceback):
+        self.closeSession()
+        
+    def _sessionOutput(self, sql, timeout=None):
+        """
+        Sends statements to the persistent session followed by a PROMPT of a unique marker, and yields
+        the lines printed until the marker comes back.  A blank line ends any unterminated statement
+        first, so the PROMPT is not taken as part of it.  The session is killed on a time out.
+        
+        @raise EOFError when the session ends, subprocess.TimeoutExpired when the time out passes.
+        """
+        self._markercount += 1
+        marker = "--SQLPLUS-MARKER-{0}-{1}--".format(self._sessionid, self._markercount)
+        sql = sql if type(sql) == bytes else str.encode(sql)
+        self._session.stdin.write(sql + b"\n\nPROMPT " + str.encode(marker) + b"\n")
+        self._session.stdin.flush()
+        
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while True:
+            try:
+                line = self._sessionlines.get(timeout=max(deadline - time.monotonic(), 0) if deadline is not None else None)
+            except queue.Empty:
+                cmd = self._session.args
+                self._session.kill()
+                self.closeSession()
+                raise subprocess.TimeoutExpired(cmd, timeout)
+            
+            if line is _SESSION_EOF:
+                self._sessionlines = None
+                self.closeSession()
+                raise EOFError("The sqlplus session ended unexpectedly.")
+            elif line == marker:
+                return
+            yield line
+            
+    def _getSessionTimeout(self, timeout):
+        """
+        Returns the time out of a persistent session call: the one given, the one set by
+        'setTimeOut', or DEFAULT_SESSION_TIMEOUT, so a call never waits forever.
+        """
+        if timeout is not None:
+            return timeout
+        return self._timeout if self._timeout is not None else DEFAULT_SESSION_TIMEOUT
+    
+    def _buildCommand(self, extraSwitches=()):
+        """
+        Builds the sqlplus command line: the program, any extra and command switches, and the
+        connection string.
+        
+        @return List
+        """
+        program = self._prglocation if self._prglocation is not None else 'sqlplus'
+        return [program] + list(extraSwitches) + self._switches + [self._connectionstr]
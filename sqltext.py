@@ -0,0 +1,187 @@
+#! /usr/bin/python36
+#[][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][]
+#[]  Script: sqltext.py                                                        []
+#[]  Script Language: Python 3.6(.4)                                           []
+#[]  Description: Functions that work on the text of SQL statements and        []
+#[]               scripts, honoring quoted strings, quoted identifiers and     []
+#[]               comments.                                                    []
+#[]  Author: Paul J. Laue                                                      []
+#[]  Created: October 19, 2026 04:00:00 PM                                     []
+#[] ========================================================================== []
+#[]  CHANGE LOG                                                                []
+#[]  ----------                                                                []
+#[]                                                                            []
+#[] ========================================================================== []
+#[][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][]
+import re
+
+_WORD = re.compile(r'[A-Za-z_][A-Za-z0-9_$#]*')
+
+# statements that are PL/SQL and end only at a '/' line, since they contain ';' themselves
+_PLSQL_BLOCK = re.compile(r'(<<|(DECLARE|BEGIN)\b|CREATE\s+(OR\s+REPLACE\s+)?((NON)?EDITIONABLE\s+)?(FUNCTION|PROCEDURE|PACKAGE|TRIGGER|TYPE|LIBRARY|JAVA)\b)', re.IGNORECASE)
+
+# SQL*Plus commands that may appear in scripts but are not sent to the database
+SQLPLUS_COMMANDS = ('@', 'ACCEPT', 'APPEND', 'ARCHIVE', 'ATTRIBUTE', 'BREAK', 'BTITLE', 'CHANGE', 'CLEAR', 'COL', 'COLUMN', 'COMPUTE', 'CONN',
+                    'CONNECT', 'COPY', 'DEF', 'DEFINE', 'DEL', 'DESC', 'DESCRIBE', 'DISC', 'DISCONNECT', 'EDIT', 'EXIT', 'GET', 'HELP', 'HISTORY',
+                    'HOST', 'INPUT', 'LIST', 'PASSW', 'PASSWORD', 'PAUSE', 'PRINT', 'PRO', 'PROMPT', 'QUIT', 'RECOVER', 'REM', 'REMARK', 'REPFOOTER',
+                    'REPHEADER', 'RUN', 'SAVE', 'SET', 'SHO', 'SHOW', 'SHUTDOWN', 'SPO', 'SPOOL', 'START', 'STARTUP', 'STORE', 'TIMING', 'TTITLE',
+                    'UNDEF', 'UNDEFINE', 'VAR', 'VARIABLE', 'WHENEVER')
+
+# the SQL*Plus EXECUTE command, which runs its argument as an anonymous PL/SQL block
+_EXECUTE = re.compile(r'EXEC(UTE)?\s+(.*?)\s*;?\s*$', re.IGNORECASE | re.DOTALL)
+
+# SQL statements starting with SET
+_SQL_SET = re.compile(r'SET\s+(TRANSACTION|ROLE|CONSTRAINTS?)\b', re.IGNORECASE)
+
+# closing delimiters of alternative quoting (q'[...]')
+_Q_CLOSE = {'[': ']', '(': ')', '{': '}', '<': '>'}
+
+def getStatementType(sql):
+    """
+    Returns the first keyword of a statement in upper case, skipping leading comments and parentheses.
+    
+    @param sql: a SQL statement
+    @type sql: String
+    
+    @return String
+    """
+    pos = 0
+    while pos < len(sql):
+        if sql[pos].isspace() or sql[pos] == '(':
+            pos += 1
+        elif sql.startswith('--', pos):
+            end = sql.find('\n', pos)
+            pos = len(sql) if end < 0 else end + 1
+        elif sql.startswith('/*', pos):
+            end = sql.find('*/', pos + 2)
+            pos = len(sql) if end < 0 else end + 2
+        else:
+            match = _WORD.match(sql, pos)
+            return match.group(0).upper() if match else ''
+    return ''
+
+def _readString(sql, pos):
+    """
+    Reads a single quoted string literal starting at pos.
+    
+    @return Tuple containing the position after the literal (-1 when it is not terminated) and its value
+    """
+    value = []
+    pos += 1
+    while pos < len(sql):
+        if sql[pos] == "'":
+            if sql.startswith("''", pos):
+                value.append("'")
+                pos += 2
+                continue
+            return pos + 1, ''.join(value)
+        value.append(sql[pos])
+        pos += 1
+    return -1, None
+
+def splitStatements(script):
+    """
+    Splits a SQL script into its statements the way SQL*Plus runs them.  SQL statements end at a
+    ';' or a line holding only '/', PL/SQL blocks (DECLARE/BEGIN blocks and CREATE FUNCTION,
+    PROCEDURE, PACKAGE, TRIGGER, TYPE, ...) only at a '/' line.  Terminators inside quoted strings
+    (including q'[...]'), quoted identifiers and comments are ignored, and SQL*Plus commands such
+    as SET, SPOOL or PROMPT are skipped, except EXECUTE, which becomes a BEGIN ... END; block.
+    
+    @param script: the text of a SQL script
+    @type script: String
+    
+    @return List of Tuples containing the line number each statement starts on and its text (SQL
+            statements without their ';', PL/SQL blocks with their final 'END;')
+    """
+    statements = []
+    start = None
+    plsql = False
+    linestart = True
+    pos = 0
+    length = len(script)
+    while pos < length:
+        if linestart:
+            linestart = False
+            end = script.find('\n', pos)
+            end = length if end < 0 else end
+            line = script[pos:end].strip()
+            if line == '/':
+                _addStatement(statements, script, start, pos)
+                start = None
+                pos = end
+                continue
+            execute = _EXECUTE.match(line) if start is None else None
+            if execute is not None:
+                statements.append((script.count('\n', 0, pos) + 1, "BEGIN {0}; END;".format(execute.group(2))))
+                pos = end
+                continue
+            if start is None and _isSQLPlusCommand(line):
+                # a trailing '-' continues a SQL*Plus command on the next line
+                while line.endswith('-') and end < length:
+                    pos = end + 1
+                    end = script.find('\n', pos)
+                    end = length if end < 0 else end
+                    line = script[pos:end].strip()
+                pos = end
+                continue
+            
+        ch = script[pos]
+        if ch == '\n':
+            linestart = True
+            pos += 1
+        elif script.startswith('--', pos):
+            end = script.find('\n', pos)
+            pos = length if end < 0 else end
+        elif script.startswith('/*', pos):
+            end = script.find('*/', pos + 2)
+            pos = length if end < 0 else end + 2
+        elif ch.isspace():
+            pos += 1
+        else:
+            if start is None:
+                start = pos
+                plsql = _PLSQL_BLOCK.match(script, pos) is not None
+                
+            if ch == "'":
+                end, value = _readString(script, pos)
+                pos = length if end < 0 else end
+            elif ch == '"':
+                end = script.find('"', pos + 1)
+                pos = length if end < 0 else end + 1
+            elif ch == ';' and not plsql:
+                _addStatement(statements, script, start, pos)
+                start = None
+                pos += 1
+            elif ch.isalpha() or ch == '_':
+                match = _WORD.match(script, pos)
+                pos = match.end()
+                if script.startswith("'", pos) and match.group(0).upper() in ('Q', 'NQ') and pos + 1 < length:
+                    closing = _Q_CLOSE.get(script[pos + 1], script[pos + 1]) + "'"
+                    end = script.find(closing, pos + 2)
+                    pos = length if end < 0 else end + 2
+            else:
+                pos += 1
+                
+    _addStatement(statements, script, start, length)
+    return statements
+
+def _isSQLPlusCommand(line):
+    """
+    Returns whether a line (at the start of a statement) is a SQL*Plus command.
+    """
+    if line.startswith('@'):
+        return True
+    
+    match = _WORD.match(line)
+    if match is None or match.group(0).upper() not in SQLPLUS_COMMANDS:
+        return False
+    return match.group(0).upper() != 'SET' or _SQL_SET.match(line) is None
+
+def _addStatement(statements, script, start, end):
+    """
+    Adds the statement between start and end to the list, unless it is empty.
+    """
+    if start is not None:
+        statement = script[start:end].strip()
+        if statement:
+            statements.append((script.count('\n', 0, start) + 1, statement))
@@ -0,0 +1,23 @@
+from blindindex import BlindIndex
+from encrypter import Encrypter
+import pytest
+
+@pytest.fixture
+def keyFile(tmp_path):
+    keyfile = tmp_path / "secure.key"
+    keyfile.write_bytes(Encrypter().generateKey())
+    return str(keyfile)
+
+@pytest.mark.parametrize("databaseFile", [None, ":memory:"])
+def test_encryptWithBlindIndex_digests_are_found_by_lookup(keyFile, databaseFile):
+    enc = Encrypter(keyFile)
+    index = BlindIndex(keyFile, databaseFile)
+
+    rows = [("123-45-6789", 1), ("987-65-4321", 2), ("123-45-6789", 3)]
+    encrypted = [(enc.encryptWithBlindIndex(value, "ssn"), recordId) for value, recordId in rows]
+    index.addDigests("ssn", ((digest, recordId) for (ciphertext, digest), recordId in encrypted))
+
+    assert sorted(index.lookup("ssn", "123-45-6789")) == ["1", "3"]
+    assert index.lookup("ssn", "987-65-4321") == ["2"]
+    assert index.lookup("dob", "123-45-6789") == []
+    assert [enc.decrypt(ciphertext) for (ciphertext, digest), recordId in encrypted] == [value for value, recordId in rows]
@@ -0,0 +1,12 @@
+from sqltext import splitStatements
+
+def test_unterminated_desc_is_not_merged_with_the_next_statement():
+    script = "DESC employees\nUPDATE employees SET salary = salary * 1.1 WHERE id = 1;\nDESCRIBE departments\nDELETE FROM departments WHERE id = 2;\n"
+
+    assert splitStatements(script) == [(2, "UPDATE employees SET salary = salary * 1.1 WHERE id = 1"),
+                                       (4, "DELETE FROM departments WHERE id = 2")]
+
+def test_sqlplus_file_and_buffer_commands_are_skipped():
+    script = "GET query.sql\nLIST\nRUN\nSAVE query.sql REPLACE\nSTORE SET settings.sql REPLACE\nPASSWORD\nSAVEPOINT before_insert;\nINSERT INTO t VALUES (1);\n"
+
+    assert splitStatements(script) == [(7, "SAVEPOINT before_insert"), (8, "INSERT INTO t VALUES (1)")]
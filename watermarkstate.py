@@ -0,0 +1,196 @@
+#! /usr/bin/python36
+#[][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][]
+#[]  Script: watermarkstate.py                                                 []
+#[]  Script Language: Python 3.6(.4)                                           []
+#[]  Description: This class keeps the high watermarks of incremental extracts []
+#[]               in a local JSON state file that is replaced atomically.      []
+#[]  Author: Paul J. Laue                                                      []
+#[]  Created: October 19, 2026 06:00:00 PM                                     []
+#[] ========================================================================== []
+#[]  CHANGE LOG                                                                []
+#[]  ----------                                                                []
+#[]                                                                            []
+#[] ========================================================================== []
+#[][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][][]
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+import json
+import os
+import re
+import threading
+
+# the UTC offset isoformat() appends to a timezone aware datetime ('+05:30', '-08:00')
+_UTC_OFFSET = re.compile(r'([+-])(\d{2}):(\d{2})$')
+
+class WatermarkState:
+    """
+    This class maps extract names (e.g. 'SCHEMA.TABLE.COLUMN') to the highest value of a monotonic
+    column seen by the last successful run.  Dates, timestamps and decimals keep their type across
+    runs.  The state file is only ever replaced as a whole, so a failed write leaves the previous
+    state in place.
+    """
+    def __init__(self, stateFile):
+        """
+        Creates a new WatermarkState object, loading the state file if it exists.
+        
+        @param stateFile: full path to the JSON state file
+        @type stateFile: String
+        """
+        self._errMsg = ''
+        self._outMsg = ''
+        self._statefile = stateFile
+        self._state = {}
+        self._lock = threading.Lock()
+        
+        if os.path.isfile(stateFile):
+            self.load()
+    
+    def getErrorMsg(self):
+        """
+        Returns any error messages on the stack.
+        
+        @return String
+        """
+        return self._errMsg
+    
+    def getOutputMsg(self):
+        """
+        Returns any output messages on the stack.
+        
+        @return String
+        """
+        return self._outMsg
+    
+    def getWatermark(self, name):
+        """
+        Returns the stored watermark of an extract, or None when it has never run.
+        
+        @param name: the extract name
+        @type name: String
+        
+        @return Object
+        """
+        with self._lock:
+            entry = self._state.get(name)
+        return self._decode(entry['watermark'], entry['type']) if entry is not None else None
+    
+    def getEntry(self, name):
+        """
+        Returns the stored watermark of an extract along with the rows and time of the run that set it.
+        
+        @param name: the extract name
+        @type name: String
+        
+        @return Dictionary (None when it has never run)
+        """
+        with self._lock:
+            entry = self._state.get(name)
+        if entry is None:
+            return None
+        return {'watermark': self._decode(entry['watermark'], entry['type']), 'rows': entry.get('rows'), 'updated': entry.get('updated')}
+    
+    def setWatermark(self, name, watermark, rows=None):
+        """
+        Sets the watermark of an extract and saves the state file.
+        
+        @param name: the extract name
+        @type name: String
+        
+        @param watermark: the highest value seen
+        @type watermark: Integer/Decimal/Float/String/datetime
+        
+        @param rows (optional): number of rows the run extracted
+        @type rows: Integer
+        
+        @return Boolean
+        """
+        value, valuetype = self._encode(watermark)
+        with self._lock:
+            self._state[name] = {'watermark': value, 'type': valuetype, 'rows': rows, 'updated': datetime.now().isoformat()}
+        return self.save()
+    
+    def removeWatermark(self, name):
+        """
+        Forgets the watermark of an extract, so its next run extracts every row, and saves the state file.
+        
+        @param name: the extract name
+        @type name: String
+        
+        @return Boolean
+        """
+        with self._lock:
+            self._state.pop(name, None)
+        return self.save()
+    
+    def save(self):
+        """
+        Writes the state to a temporary file next to the state file and moves it into place.
+        
+        @return Boolean
+        """
+        with self._lock:
+            state = dict(self._state)
+        
+        tmpfile = self._statefile + ".tmp"
+        try:
+            with open(tmpfile, 'w', encoding='utf-8') as sf:
+                json.dump(state, sf, indent=2, sort_keys=True)
+                sf.flush()
+                os.fsync(sf.fileno())
+            os.replace(tmpfile, self._statefile)
+        except OSError as oerr:
+            self._errMsg = "There was a critical error attempting to write file '{0}'.  Error={1}".format(self._statefile, str(oerr))
+            return False
+        
+        return True
+    
+    def load(self):
+        """
+        Reads the state file.
+        
+        @return Boolean
+        """
+        try:
+            with open(self._statefile, 'r', encoding='utf-8') as sf:
+                state = json.load(sf)
+        except (OSError, ValueError) as err:
+            self._errMsg = "There was a critical error attempting to read file '{0}'.  Error={1}".format(self._statefile, str(err))
+            return False
+        
+        with self._lock:
+            self._state = state
+        return True
+    
+    def _encode(self, value):
+        """
+        Converts a watermark to a JSON value and the name of its type.
+        """
+        if isinstance(value, datetime):
+            return value.isoformat(), 'datetime'
+        elif isinstance(value, date):
+            return value.isoformat(), 'date'
+        elif isinstance(value, Decimal):
+            return str(value), 'decimal'
+        elif isinstance(value, bool) or not isinstance(value, (int, float, str)):
+            raise TypeError("A watermark of type '{0}' cannot be stored.".format(type(value).__name__))
+        return value, type(value).__name__
+    
+    def _decode(self, value, valuetype):
+        """
+        Converts a stored JSON value back to a watermark of its type.
+        """
+        if valuetype == 'datetime':
+            # strptime's %z cannot read the ':' of the offset before Python 3.7, so it is parsed here
+            offset = _UTC_OFFSET.search(value)
+            if offset is not None:
+                value = value[:offset.start()]
+            parsed = datetime.strptime(value, '%Y-%m-%dT%H:%M:%S.%f' if '.' in value else '%Y-%m-%dT%H:%M:%S')
+            if offset is not None:
+                minutes = int(offset.group(2)) * 60 + int(offset.group(3))
+                parsed = parsed.replace(tzinfo=timezone(timedelta(minutes=-minutes if offset.group(1) == '-' else minutes)))
+            return parsed
+        elif valuetype == 'date':
+            return datetime.strptime(value, '%Y-%m-%d').date()
+        elif valuetype == 'decimal':
+            return Decimal(value)
+        return value